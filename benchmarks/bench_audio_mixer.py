@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""Benchmark mixer CPU cost during a busy rally.
+
+Renders the game's sounds through the capture backend (no sound device,
+faster than real time) while triggering a paddle or wall hit every frame
+over the background music, and reports the mixer's time per block and
+its CPU load as a fraction of the audio rendered.
+
+Run with:
+    python benchmarks/bench_audio_mixer.py
+"""
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from game.settings import settings
+from game.audio_backends import CaptureBackend
+from game.audio_manager_pyaudio import PyAudioManager
+
+SECONDS = 30.0
+FRAME = 1 / 120
+FORMATS = [(22050, 1), (48000, 2)]
+
+
+def run(sample_rate: int, channels: int) -> CaptureBackend:
+    """Play a rally over the music for SECONDS of audio.
+
+    Returns:
+        Backend holding the render time
+    """
+    backend = CaptureBackend(sample_rate, channels)
+    manager = PyAudioManager(backend)
+    manager.mixer.coalesce_window = 0.0  # Every trigger reaches the mixer
+    manager.play_background_music()
+    sounds = [manager.play_wall_bounce, manager.play_bounce, manager.play_wall_bounce, manager.play_score]
+    for frame in range(int(SECONDS / FRAME)):
+        sounds[frame % len(sounds)]()
+        backend.advance(FRAME)
+    manager.cleanup()
+    return backend
+
+
+def main():
+    """Run the mixer benchmark."""
+    settings.audio_enabled = True
+    results = [(fmt, run(*fmt)) for fmt in FORMATS]
+
+    for (sample_rate, channels), backend in results:
+        blocks = len(backend.blocks)
+        print(
+            f"{sample_rate} Hz x{channels}: {backend.render_seconds / blocks * 1e6:.0f} us per "
+            f"{backend.block_frames}-frame block, CPU load {backend.cpu_load() * 100:.2f}% "
+            f"({blocks} blocks, {backend.time:.0f}s of audio)"
+        )
+
+
+if __name__ == "__main__":
+    main()
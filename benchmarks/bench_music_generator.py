@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+"""Benchmark background music generation time.
+
+Compares the old per-sample loop (note lookup, ADSR branches and three
+``math.sin`` calls per sample, one ``struct.pack`` per sample) with the
+event-based NumPy generator used by ``music_generator``.
+
+Run with:
+    python benchmarks/bench_music_generator.py
+"""
+import math
+import struct
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from game.music_generator import generate_arcade_music
+
+DURATION = 30.0
+TEMPO = 120
+VOLUME = 0.25
+
+NOTES = {'C4': 261.63, 'D4': 293.66, 'E4': 329.63, 'G4': 392.00, 'A4': 440.00, 'C5': 523.25}
+MELODY = [
+    ('E4', 0.5), ('G4', 0.5), ('A4', 0.5), ('C5', 0.5), ('A4', 0.5), ('G4', 0.5), ('E4', 1.0),
+    ('D4', 0.5), ('E4', 0.5), ('G4', 0.5), ('A4', 0.5), ('G4', 0.5), ('E4', 0.5), ('D4', 1.0),
+    ('C4', 0.5), ('E4', 0.5), ('G4', 0.5), ('E4', 0.5), ('C4', 0.5), ('E4', 0.5), ('C4', 1.0),
+    ('D4', 0.5), ('E4', 0.5), ('D4', 0.5), ('C4', 0.5), ('D4', 2.0),
+]
+BASS_NOTES = {'C2': 65.41, 'D2': 73.42, 'E2': 82.41, 'G2': 98.00, 'A2': 110.00}
+BASS = [('C2', 2.0), ('G2', 2.0), ('A2', 2.0), ('E2', 2.0), ('C2', 2.0), ('G2', 2.0), ('D2', 2.0), ('G2', 2.0)]
+
+
+def generate_music_loop(filename: str) -> None:
+    """Generate the music the old way, one packed sample at a time."""
+    sample_rate = 22050
+    beat_duration = 60.0 / TEMPO
+    num_samples = int(sample_rate * DURATION)
+
+    with wave.open(filename, 'w') as wav_file:
+        wav_file.setparams((1, 2, sample_rate, num_samples, 'NONE', 'not compressed'))
+        melody_index = bass_index = 0
+        melody_time = bass_time = 0
+        melody_duration = MELODY[0][1] * beat_duration
+        bass_duration = BASS[0][1] * beat_duration
+
+        for i in range(num_samples):
+            t = i / sample_rate
+            if t >= melody_time + melody_duration:
+                melody_time = t
+                melody_index = (melody_index + 1) % len(MELODY)
+                melody_duration = MELODY[melody_index][1] * beat_duration
+            if t >= bass_time + bass_duration:
+                bass_time = t
+                bass_index = (bass_index + 1) % len(BASS)
+                bass_duration = BASS[bass_index][1] * beat_duration
+
+            melody_freq = NOTES[MELODY[melody_index][0]]
+            bass_freq = BASS_NOTES[BASS[bass_index][0]]
+            note_t = t - melody_time
+
+            if note_t < 0.01:
+                envelope = note_t / 0.01
+            elif note_t < 0.06:
+                envelope = 1.0 - ((note_t - 0.01) / 0.05) * 0.3
+            elif note_t < melody_duration - 0.1:
+                envelope = 0.7
+            else:
+                envelope = 0.7 * (1.0 - (note_t - (melody_duration - 0.1)) / 0.1)
+            bass_envelope = max(0, 1.0 - ((t - bass_time) / bass_duration))
+
+            melody_value = math.sin(2 * math.pi * melody_freq * t)
+            melody_value += 0.3 * math.sin(4 * math.pi * melody_freq * t)
+            melody_value *= envelope * VOLUME * 0.5
+            bass_value = math.sin(2 * math.pi * bass_freq * t) * bass_envelope * VOLUME * 0.4
+
+            value = max(-1.0, min(1.0, melody_value + bass_value))
+            wav_file.writeframes(struct.pack('h', int(value * 32767)))
+
+
+def time_once(generate) -> float:
+    """Time one call.
+
+    Returns:
+        Elapsed milliseconds
+    """
+    start = time.perf_counter()
+    generate()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    """Run the music generation benchmark."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "background_music.wav")
+        loop_ms = time_once(lambda: generate_music_loop(path))
+        vectorized_ms = min(
+            time_once(lambda: generate_arcade_music(path, DURATION, TEMPO, VOLUME)) for _ in range(5)
+        )
+
+    print(f"per-sample loop ({DURATION:.0f}s track): {loop_ms:.0f} ms")
+    print(f"event-based NumPy:         {vectorized_ms:.1f} ms")
+    print(f"speedup:                   {loop_ms / vectorized_ms:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
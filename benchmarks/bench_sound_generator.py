@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""Benchmark sound effect generation time.
+
+Compares the old per-sample loop (math + struct.pack + writeframes for every
+sample) with the vectorized NumPy generator used by ``sound_generator``.
+
+Run with:
+    python benchmarks/bench_sound_generator.py
+"""
+import contextlib
+import io
+import math
+import struct
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from game.sound_generator import generate_all_sounds
+
+RUNS = 5
+
+
+def generate_beep_loop(filename: str, frequency: float, duration: float, volume: float) -> None:
+    """Generate a beep the old way, one packed sample at a time."""
+    sample_rate = 22050
+    num_samples = int(sample_rate * duration)
+    with wave.open(filename, 'w') as wav_file:
+        wav_file.setparams((1, 2, sample_rate, num_samples, 'NONE', 'not compressed'))
+        for i in range(num_samples):
+            t = i / sample_rate
+            fade_in_samples = int(num_samples * 0.1)
+            fade_in = math.sin((i / fade_in_samples) * math.pi / 2) if i < fade_in_samples else 1.0
+            fade_out_samples = int(num_samples * 0.3)
+            if i > num_samples - fade_out_samples:
+                fade_out = math.sin(((num_samples - i) / fade_out_samples) * math.pi / 2)
+            else:
+                fade_out = 1.0
+            envelope = fade_in * fade_out * math.exp(-t * 3)
+            value = volume * envelope * math.sin(2 * math.pi * frequency * t)
+            wav_file.writeframes(struct.pack('h', int(value * 32767)))
+
+
+def generate_sweep_loop(filename: str, start: float, end: float, duration: float, volume: float, decay: str) -> None:
+    """Generate a frequency sweep the old way, one packed sample at a time."""
+    sample_rate = 22050
+    num_samples = int(sample_rate * duration)
+    with wave.open(filename, 'w') as wav_file:
+        wav_file.setparams((1, 2, sample_rate, num_samples, 'NONE', 'not compressed'))
+        for i in range(num_samples):
+            t = i / sample_rate
+            frequency = start + (end - start) * t / duration
+            if decay == "exponential":
+                amplitude = volume * math.exp(-t * 3)
+            elif decay == "linear":
+                amplitude = volume * (1.0 - t / duration)
+            else:
+                amplitude = volume
+            value = amplitude * math.sin(2 * math.pi * frequency * t)
+            wav_file.writeframes(struct.pack('h', int(value * 32767)))
+
+
+def generate_all_loop(output_dir: Path) -> None:
+    """Generate every effect with the old loops."""
+    generate_beep_loop(str(output_dir / "paddle_hit.wav"), 220, 0.08, 0.5)
+    generate_beep_loop(str(output_dir / "wall_hit.wav"), 165, 0.06, 0.4)
+    generate_sweep_loop(str(output_dir / "score.wav"), 550, 220, 0.3, 0.5, "exponential")
+    generate_sweep_loop(str(output_dir / "game_start.wav"), 220, 880, 0.4, 0.4, "linear")
+    generate_sweep_loop(str(output_dir / "game_over.wav"), 440, 110, 0.6, 0.5, "none")
+
+
+def time_runs(generate, output_dir: Path) -> float:
+    """Time a generator.
+
+    Args:
+        generate: Function writing all effects into a directory
+        output_dir: Directory to write to
+
+    Returns:
+        Best milliseconds per run
+    """
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        generate(output_dir)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def quiet_generate_all(output_dir: Path) -> None:
+    """Generate all effects without progress output."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate_all_sounds(output_dir)
+
+
+def main():
+    """Run the sound generation benchmark."""
+    with tempfile.TemporaryDirectory() as tmp:
+        output_dir = Path(tmp)
+        loop_ms = time_runs(generate_all_loop, output_dir)
+        vectorized_ms = time_runs(quiet_generate_all, output_dir)
+
+    print(f"per-sample loop (5 effects): {loop_ms:.2f} ms")
+    print(f"vectorized NumPy:            {vectorized_ms:.2f} ms")
+    print(f"speedup:                     {loop_ms / vectorized_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
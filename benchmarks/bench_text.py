@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""Benchmark per-frame cost of score text rendering.
+
+Compares the old immediate-mode ``arcade.draw_text`` score drawing with the
+retained ``arcade.Text`` batch used by ``PongGameView``.
+
+Run headless with:
+    ARCADE_HEADLESS=1 python benchmarks/bench_text.py
+"""
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import arcade
+from game.settings import settings
+from game.pong_window import PongGameView
+
+FRAMES = 300
+
+
+def draw_scores_immediate(score_left: int, score_right: int) -> None:
+    """Draw scores the old way, laying out every label every frame."""
+    for score, score_x in (
+        (score_left, settings.screen_width / 4),
+        (score_right, settings.screen_width * 3 / 4)
+    ):
+        for offset, alpha in [(4, 40), (2, 80)]:
+            arcade.draw_text(
+                str(score),
+                score_x + offset,
+                settings.screen_height - 80 - offset,
+                (*settings.synthwave_grid_glow, alpha),
+                font_size=48,
+                anchor_x="center",
+                bold=True
+            )
+        arcade.draw_text(
+            str(score),
+            score_x,
+            settings.screen_height - 80,
+            settings.synthwave_city_windows_cyan,
+            font_size=48,
+            anchor_x="center",
+            bold=True
+        )
+
+
+def time_frames(window: arcade.Window, draw) -> float:
+    """Time a draw function over many frames.
+
+    Args:
+        window: Window providing the GL context
+        draw: Function called with the frame index
+
+    Returns:
+        Average milliseconds per frame
+    """
+    window.ctx.finish()
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        draw(frame)
+    window.ctx.finish()
+    return (time.perf_counter() - start) * 1000 / FRAMES
+
+
+def main():
+    """Run the text rendering benchmark."""
+    settings.audio_enabled = False
+    window = arcade.Window(settings.screen_width, settings.screen_height, "Text benchmark")
+
+    game = PongGameView("two_player")
+    game.setup()
+
+    # Scores change every 60 frames, roughly a fast rally at 120 FPS
+    def retained(frame: int) -> None:
+        game.score_left = frame // 60
+        game._draw_scores()
+
+    def immediate(frame: int) -> None:
+        draw_scores_immediate(frame // 60, 0)
+
+    immediate_ms = time_frames(window, immediate)
+    retained_ms = time_frames(window, retained)
+
+    print(f"arcade.draw_text (6 labels): {immediate_ms:.3f} ms/frame")
+    print(f"retained arcade.Text batch:  {retained_ms:.3f} ms/frame")
+    print(f"speedup:                     {immediate_ms / retained_ms:.1f}x")
+
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
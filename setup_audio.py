@@ -6,8 +6,7 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from game.sound_generator import generate_all_sounds
-from game.music_generator import generate_background_music
+from game.audio_assets import asset_registry
 
 
 def main():
@@ -17,14 +16,11 @@ def main():
     print("=" * 60)
     print()
 
-    sounds_dir = Path(__file__).parent / "src" / "assets" / "sounds"
+    sounds_dir = asset_registry.directory
 
-    # Generate sound effects
-    generate_all_sounds(sounds_dir)
-    print()
-
-    # Generate background music
-    generate_background_music(sounds_dir)
+    # Generate sound effects and background music, recording their hashes
+    # so the game only regenerates them after a generator change
+    asset_registry.refresh(list(asset_registry.assets))
     print()
 
     print("=" * 60)
@@ -34,6 +30,7 @@ def main():
     print("All sound files have been generated in:")
     print(f"  {sounds_dir}")
     print()
+    print("The game also regenerates missing or outdated files on startup.")
     print("You can now run the game with:")
     print("  python src/main.py")
     print()
@@ -0,0 +1,95 @@
+"""Static arena decorations (center line, borders) drawn as one batch."""
+import arcade
+from arcade.shape_list import ShapeElementList, create_line
+from typing import Optional
+from game.settings import settings
+
+
+class ArenaRenderer:
+    """Renders static arena markings from a cached shape list.
+
+    All decorations are built once into a single shape list and drawn with
+    one call. The list is rebuilt only when something it was built from
+    changes: the arena size, the center line or border color, or the
+    border setting. The arena is drawn at the fixed internal resolution,
+    so resizing the window does not change it.
+    """
+
+    def __init__(self):
+        """Initialize arena renderer."""
+        self.shape_list: Optional[ShapeElementList] = None
+        self._key: Optional[tuple] = None
+        self.builds = 0
+
+    def _cache_key(self, width: int, height: int) -> tuple:
+        """Everything the shape list is built from."""
+        return (
+            width,
+            height,
+            tuple(settings.center_line_color),
+            tuple(settings.synthwave_grid_color),
+            settings.arena_border_enabled,
+        )
+
+    def draw(self, width: int, height: int) -> None:
+        """Draw all arena decorations.
+
+        Args:
+            width: Arena width
+            height: Arena height
+        """
+        key = self._cache_key(width, height)
+        if self.shape_list is None or self._key != key:
+            self._build(width, height)
+            self._key = key
+
+        self.shape_list.draw()
+
+    def _build(self, width: int, height: int) -> None:
+        """Build the shape list for a given arena size.
+
+        Args:
+            width: Arena width
+            height: Arena height
+        """
+        self.shape_list = ShapeElementList()
+        self._add_center_line(width, height)
+        if settings.arena_border_enabled:
+            self._add_borders(width, height)
+        self.builds += 1
+
+    def _add_center_line(self, width: int, height: int) -> None:
+        """Add dashed center line.
+
+        Args:
+            width: Arena width
+            height: Arena height
+        """
+        center_x = width / 2
+        dash_height = 20
+        gap_height = 15
+        y = 0
+
+        while y < height:
+            self.shape_list.append(create_line(
+                center_x, y,
+                center_x, y + dash_height,
+                settings.center_line_color,
+                line_width=2
+            ))
+            y += dash_height + gap_height
+
+    def _add_borders(self, width: int, height: int) -> None:
+        """Add top and bottom arena borders.
+
+        Args:
+            width: Arena width
+            height: Arena height
+        """
+        for y in (1, height - 1):
+            self.shape_list.append(create_line(
+                0, y,
+                width, y,
+                settings.synthwave_grid_color,
+                line_width=2
+            ))
@@ -0,0 +1,213 @@
+"""Registry of generated audio assets, regenerated when their generator changes."""
+import hashlib
+import inspect
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Optional
+from game import music_generator, sound_generator
+
+SOUNDS_DIR = Path(__file__).parent.parent / "assets" / "sounds"
+
+# Hash of each generated file, kept next to the files
+MANIFEST_NAME = "assets.json"
+
+
+class GeneratedAsset:
+    """A WAV file produced by a generator function with fixed parameters."""
+
+    def __init__(
+        self,
+        name: str,
+        filename: str,
+        generator: Callable[..., None],
+        loop: bool = False,
+        **params
+    ):
+        """Initialize asset.
+
+        Args:
+            name: Sound name used by the audio managers
+            filename: WAV file name in the sounds directory
+            generator: Function writing the WAV, called as generator(path, **params)
+            loop: Whether the sound is a seamless loop (kept periodic when resampled)
+            **params: Generator parameters
+        """
+        self.name = name
+        self.filename = filename
+        self.generator = generator
+        self.loop = loop
+        self.params = params
+
+    def key(self) -> str:
+        """Hash of the generator's module source, name and parameters.
+
+        Any edit to the generator module (a tweaked frequency, envelope or
+        note) or to the parameters changes the key and marks the file stale.
+
+        Returns:
+            Hex digest identifying the file's content
+        """
+        source = inspect.getsource(inspect.getmodule(self.generator))
+        recipe = json.dumps({"generator": self.generator.__qualname__, "params": self.params}, sort_keys=True)
+        return hashlib.sha256((source + recipe).encode()).hexdigest()[:16]
+
+    def generate(self, path: Path) -> None:
+        """Write the asset, replacing any old file atomically.
+
+        Args:
+            path: Output WAV path
+        """
+        temp_path = path.with_name(f".{path.name}.tmp")
+        self.generator(str(temp_path), **self.params)
+        os.replace(temp_path, path)
+
+
+class AssetRegistry:
+    """Generated audio assets, cached on disk and refreshed lazily.
+
+    start() compares each file against the manifest (a few hashes, no
+    audio work) and hands only missing or stale assets to a background
+    thread. Loaders call wait(), which returns at once for unchanged
+    assets and blocks only on one that is still being regenerated.
+    """
+
+    def __init__(self, directory: Path = SOUNDS_DIR):
+        """Initialize asset registry.
+
+        Args:
+            directory: Directory holding the generated files and manifest
+        """
+        self.directory = directory
+        self.assets: dict[str, GeneratedAsset] = {}
+        self.regenerated: list[str] = []
+        self._pending: dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    def register(self, asset: GeneratedAsset) -> None:
+        """Add an asset.
+
+        Args:
+            asset: Asset to register
+        """
+        self.assets[asset.name] = asset
+
+    def path(self, name: str) -> Path:
+        """Get the file path of an asset.
+
+        Args:
+            name: Sound name
+
+        Returns:
+            Path in the sounds directory
+        """
+        return self.directory / self.assets[name].filename
+
+    def _manifest_path(self) -> Path:
+        """Path of the manifest file."""
+        return self.directory / MANIFEST_NAME
+
+    def _load_manifest(self) -> dict[str, str]:
+        """Read the stored asset keys (empty if missing or unreadable)."""
+        try:
+            with open(self._manifest_path(), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def stale(self) -> list[str]:
+        """Find assets whose file is missing or was made by other parameters.
+
+        Returns:
+            Names of the assets to regenerate
+        """
+        manifest = self._load_manifest()
+        return [
+            name for name, asset in self.assets.items()
+            if not self.path(name).exists() or manifest.get(name) != asset.key()
+        ]
+
+    def refresh(self, names: Optional[list[str]] = None) -> list[str]:
+        """Regenerate assets now and record their keys.
+
+        Args:
+            names: Assets to regenerate (defaults to the stale ones)
+
+        Returns:
+            Names of the assets regenerated
+        """
+        if names is None:
+            names = self.stale()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        done = []
+        for name in names:
+            asset = self.assets[name]
+            try:
+                asset.generate(self.path(name))
+                with self._lock:
+                    manifest = self._load_manifest()
+                    manifest[name] = asset.key()
+                    with open(self._manifest_path(), 'w') as f:
+                        json.dump(manifest, f, indent=2, sort_keys=True)
+                done.append(name)
+                self.regenerated.append(name)
+                print(f"[AUDIO] Generated {asset.filename}")
+            except Exception as e:
+                print(f"[AUDIO] Warning: Could not generate {asset.filename}: {e}")
+            finally:
+                event = self._pending.pop(name, None)
+                if event is not None:
+                    event.set()
+
+        return done
+
+    def start(self) -> None:
+        """Regenerate missing or stale assets in a background thread."""
+        if self._worker is not None:
+            return
+
+        names = self.stale()
+        if not names:
+            return
+
+        print(f"[AUDIO] Regenerating {len(names)} audio asset(s) in the background: {', '.join(names)}")
+        for name in names:
+            self._pending[name] = threading.Event()
+        self._worker = threading.Thread(target=self.refresh, args=(names,), daemon=True)
+        self._worker.start()
+
+    def wait(self, name: str, timeout: Optional[float] = None) -> Path:
+        """Get an asset's path once it is ready to load.
+
+        Args:
+            name: Sound name
+            timeout: Longest wait in seconds for a regenerating asset
+
+        Returns:
+            Path in the sounds directory
+        """
+        event = self._pending.get(name)
+        if event is not None:
+            event.wait(timeout)
+        return self.path(name)
+
+
+# Global asset registry
+asset_registry = AssetRegistry()
+asset_registry.register(GeneratedAsset('paddle_hit', 'paddle_hit.wav', sound_generator.generate_paddle_hit))
+asset_registry.register(GeneratedAsset('wall_hit', 'wall_hit.wav', sound_generator.generate_wall_hit))
+asset_registry.register(GeneratedAsset('score', 'score.wav', sound_generator.generate_score_sound))
+asset_registry.register(GeneratedAsset('game_start', 'game_start.wav', sound_generator.generate_game_start))
+asset_registry.register(GeneratedAsset('game_over', 'game_over.wav', sound_generator.generate_game_over))
+asset_registry.register(GeneratedAsset(
+    'background_music',
+    'background_music.wav',
+    music_generator.generate_arcade_music,
+    loop=True,
+    duration=30.0,
+    tempo=120,
+    volume=0.25
+))
@@ -0,0 +1,252 @@
+"""Audio outputs the mixer renders into: a device, memory or nothing."""
+import time
+import numpy as np
+from typing import Optional
+from game.settings import settings
+from game.audio_mixer import Mixer, MIXER_SAMPLE_RATE, MIXER_CHANNELS
+
+try:
+    import pyaudio
+    PYAUDIO_AVAILABLE = True
+except ImportError:
+    PYAUDIO_AVAILABLE = False
+    print("[AUDIO] PyAudio not available - install with: pip install pyaudio")
+
+
+class AudioBackend:
+    """Output the mixer renders into.
+
+    A backend names the format it wants, then pulls blocks from the mixer
+    once opened: from a device callback, on demand, or never.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        """Initialize backend."""
+        self.mixer: Optional[Mixer] = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the backend is connected to a mixer."""
+        return self.mixer is not None
+
+    def output_format(self) -> tuple[int, int]:
+        """Get the output format.
+
+        Returns:
+            Sample rate in Hz and channel count
+        """
+        return MIXER_SAMPLE_RATE, MIXER_CHANNELS
+
+    def open(self, mixer: Mixer) -> None:
+        """Start taking audio from a mixer.
+
+        Args:
+            mixer: Mixer already set to output_format()
+        """
+        self.mixer = mixer
+
+    def close(self) -> None:
+        """Stop taking audio and release resources."""
+        self.mixer = None
+
+
+class NullBackend(AudioBackend):
+    """Discards all audio; the mixer is never asked to render."""
+
+    name = "null"
+
+
+class CaptureBackend(AudioBackend):
+    """Renders the mix into memory on demand, as fast as the CPU allows.
+
+    advance() renders the blocks a device would have pulled over that much
+    time, so a test can run the game loop with audio on a machine without
+    sound hardware, check which sounds started when (in audio time, at
+    block granularity like a device) and measure the mixer's CPU cost.
+    """
+
+    name = "capture"
+
+    def __init__(
+        self,
+        sample_rate: int = MIXER_SAMPLE_RATE,
+        channels: int = MIXER_CHANNELS,
+        block_frames: Optional[int] = None,
+        keep_audio: bool = True
+    ):
+        """Initialize capture backend.
+
+        Args:
+            sample_rate: Output sample rate in Hz
+            channels: Output channel count
+            block_frames: Frames per rendered block (defaults to settings.audio_buffer_frames)
+            keep_audio: Keep the rendered blocks (off for long runs that only need events and timing)
+        """
+        super().__init__()
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.block_frames = block_frames or settings.audio_buffer_frames
+        self.keep_audio = keep_audio
+        self.blocks: list[bytes] = []
+        self.frames = 0
+        self.events: list[tuple[float, str]] = []  # (audio time in seconds, sound name)
+        self.render_seconds = 0.0
+        self._target_frames = 0.0
+
+    def output_format(self) -> tuple[int, int]:
+        """Get the output format.
+
+        Returns:
+            Sample rate in Hz and channel count
+        """
+        return self.sample_rate, self.channels
+
+    def open(self, mixer: Mixer) -> None:
+        """Start recording voices the mixer starts.
+
+        Args:
+            mixer: Mixer to render
+        """
+        super().open(mixer)
+        mixer.voice_listener = self._on_voice_start
+
+    def close(self) -> None:
+        """Stop rendering (captured audio and events are kept)."""
+        if self.mixer is not None:
+            self.mixer.voice_listener = None
+        super().close()
+
+    @property
+    def time(self) -> float:
+        """Audio rendered so far, in seconds."""
+        return self.frames / self.sample_rate
+
+    def _on_voice_start(self, name: str) -> None:
+        """Record a sound starting at the current block."""
+        self.events.append((self.time, name))
+
+    def advance(self, seconds: float) -> None:
+        """Render the audio for the next stretch of time.
+
+        Args:
+            seconds: Audio time to advance
+        """
+        self._target_frames += seconds * self.sample_rate
+        mixer = self.mixer
+        while mixer is not None and self.frames < self._target_frames:
+            start = time.perf_counter()
+            block = mixer.render(self.block_frames)
+            self.render_seconds += time.perf_counter() - start
+            if self.keep_audio:
+                self.blocks.append(block)
+            self.frames += self.block_frames
+
+    def fired(self, name: str) -> list[float]:
+        """Get the times a sound started.
+
+        Args:
+            name: Sound name
+
+        Returns:
+            Audio times in seconds
+        """
+        return [when for when, event in self.events if event == name]
+
+    def samples(self) -> np.ndarray:
+        """Get all captured audio.
+
+        Returns:
+            Interleaved int16 samples
+        """
+        return np.frombuffer(b"".join(self.blocks), dtype=np.int16)
+
+    def cpu_load(self) -> float:
+        """Mixer CPU time as a fraction of the audio time rendered."""
+        return self.render_seconds / self.time if self.frames else 0.0
+
+    def report(self) -> str:
+        """Format the capture as a one-line summary.
+
+        Returns:
+            Audio time, sounds started and mixer CPU load
+        """
+        return (
+            f"captured {self.time:.1f}s of audio, {len(self.events)} sounds started, "
+            f"mixer CPU {self.cpu_load() * 100:.2f}%"
+        )
+
+
+class PyAudioBackend(AudioBackend):
+    """Plays the mix on the default output device through one callback stream."""
+
+    name = "pyaudio"
+
+    def __init__(self):
+        """Initialize PyAudio."""
+        super().__init__()
+        self.pa = pyaudio.PyAudio()
+        self.stream: Optional["pyaudio.Stream"] = None
+        print(f"[AUDIO] PyAudio initialized: {self.pa}")
+
+    def output_format(self) -> tuple[int, int]:
+        """Get the output device's native format (at most stereo).
+
+        Returns:
+            Sample rate in Hz and channel count
+        """
+        try:
+            device = self.pa.get_default_output_device_info()
+            return int(device['defaultSampleRate']), max(1, min(2, int(device['maxOutputChannels'])))
+        except Exception as e:
+            print(f"[AUDIO] Could not query output device ({e}); using {MIXER_SAMPLE_RATE} Hz mono")
+            return MIXER_SAMPLE_RATE, MIXER_CHANNELS
+
+    def open(self, mixer: Mixer) -> None:
+        """Open the single output stream, pulling blocks from the mixer.
+
+        Args:
+            mixer: Mixer already set to output_format()
+        """
+        self.stream = self.pa.open(
+            format=pyaudio.paInt16,
+            channels=mixer.channels,
+            rate=mixer.sample_rate,
+            output=True,
+            frames_per_buffer=settings.audio_buffer_frames,
+            stream_callback=mixer.stream_callback
+        )
+        self.stream.start_stream()
+        super().open(mixer)
+        print(
+            f"[AUDIO] Mixer stream open: {settings.audio_buffer_frames} frames per block, "
+            f"output latency {self.stream.get_output_latency() * 1000:.1f} ms"
+        )
+
+    def close(self) -> None:
+        """Close the stream and terminate PyAudio."""
+        if self.stream is not None:
+            self.stream.stop_stream()
+            self.stream.close()
+            self.stream = None
+        self.pa.terminate()
+        super().close()
+
+
+def create_backend(name: str) -> Optional[AudioBackend]:
+    """Create a backend by name.
+
+    Args:
+        name: "pyaudio", "null" or "capture"
+
+    Returns:
+        New backend, or None for "pyaudio" when PyAudio is not installed
+    """
+    if name == "null":
+        return NullBackend()
+    if name == "capture":
+        return CaptureBackend()
+    if not PYAUDIO_AVAILABLE:
+        return None
+    return PyAudioBackend()
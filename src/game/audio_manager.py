@@ -1,8 +1,10 @@
 """Audio manager for game sound effects."""
 import arcade
-from pathlib import Path
+from typing import Optional
 from game.settings import settings
+from game.pcm_store import pcm_store
 import pyglet.media
+from pyglet.media.codecs.base import AudioFormat, StaticMemorySource
 
 
 class AudioManager:
@@ -20,46 +22,41 @@ class AudioManager:
         self._load_music()
         print(f"[AUDIO] Loaded {len(self.sounds)} sound effects")
 
+    def _load_source(self, sound_name: str) -> Optional[StaticMemorySource]:
+        """Create a pyglet source from the shared PCM store (no WAV decoding).
+
+        Args:
+            sound_name: Name of the sound
+
+        Returns:
+            Static source, or None if the sound is not available
+        """
+        samples = pcm_store.get(sound_name)
+        if samples is None:
+            return None
+
+        audio_format = AudioFormat(channels=pcm_store.channels, sample_size=16, sample_rate=pcm_store.sample_rate)
+        return StaticMemorySource(memoryview(samples).cast('B'), audio_format)
+
     def _load_sounds(self) -> None:
-        """Load sound files."""
-        sounds_dir = Path(__file__).parent.parent / "assets" / "sounds"
-
-        # Load custom sound effects using pyglet directly
-        sound_files = {
-            'paddle_hit': 'paddle_hit.wav',
-            'wall_hit': 'wall_hit.wav',
-            'score': 'score.wav',
-            'game_start': 'game_start.wav',
-            'game_over': 'game_over.wav',
-        }
-
-        for sound_name, filename in sound_files.items():
-            sound_path = sounds_dir / filename
-            if sound_path.exists():
-                try:
-                    # Load using pyglet for better macOS compatibility
-                    self.sounds[sound_name] = pyglet.media.load(str(sound_path), streaming=False)
-                    print(f"[AUDIO] Loaded {sound_name}: {self.sounds[sound_name]}")
-                except Exception as e:
-                    print(f"[AUDIO] Warning: Could not load {filename}: {e}")
-            else:
-                print(f"[AUDIO] Warning: Sound file not found: {sound_path}")
+        """Load sound effects from the shared PCM store."""
+        for sound_name in ('paddle_hit', 'wall_hit', 'score', 'game_start', 'game_over'):
+            source = self._load_source(sound_name)
+            if source is None:
+                print(f"[AUDIO] Warning: {sound_name} is not available")
+                continue
+
+            self.sounds[sound_name] = source
+            print(f"[AUDIO] Loaded {sound_name}: {source}")
 
     def _load_music(self) -> None:
         """Load and start background music."""
         if not self.enabled:
             return
 
-        sounds_dir = Path(__file__).parent.parent / "assets" / "sounds"
-        music_path = sounds_dir / "background_music.wav"
-
-        if music_path.exists():
-            try:
-                # Load music using pyglet directly for better control
-                self.music_source = pyglet.media.load(str(music_path), streaming=False)
-                print(f"[AUDIO] Background music loaded: {self.music_source}")
-            except Exception as e:
-                print(f"[AUDIO] Warning: Could not load background music: {e}")
+        self.music_source = self._load_source('background_music')
+        if self.music_source is not None:
+            print(f"[AUDIO] Background music loaded: {self.music_source}")
 
     def play_background_music(self) -> None:
         """Start playing background music."""
@@ -1,191 +1,185 @@
 """Alternative audio manager using PyAudio for macOS compatibility."""
-import wave
-from pathlib import Path
+from typing import Optional
 from game.settings import settings
-import threading
+from game.pcm_store import pcm_store
+from game.audio_mixer import Mixer, ScaledBufferCache
+from game.audio_backends import AudioBackend, PYAUDIO_AVAILABLE, create_backend
 
-try:
-    import pyaudio
-    PYAUDIO_AVAILABLE = True
-except ImportError:
-    PYAUDIO_AVAILABLE = False
-    print("[AUDIO] PyAudio not available - install with: pip install pyaudio")
+# Per-sound gain, applied under the bus (sfx/music) and master volume
+SOUND_GAINS = {
+    'paddle_hit': 0.6,
+    'wall_hit': 0.5,
+    'score': 0.7,
+    'game_start': 0.6,
+    'game_over': 0.8,
+    'background_music': 0.3,
+}
 
 
 class PyAudioManager:
-    """Audio manager using PyAudio for better macOS compatibility."""
+    """Audio manager mixing every sound into one output backend (PyAudio by default)."""
 
-    def __init__(self):
-        """Initialize PyAudio audio manager."""
+    def __init__(self, backend: Optional[AudioBackend] = None):
+        """Initialize PyAudio audio manager.
+
+        Args:
+            backend: Audio output (defaults to the one named by settings.audio_backend)
+        """
         self.enabled = settings.audio_enabled
         self.sounds = {}
-        self.music_thread = None
-        self.music_stop_flag = False
+        self.mixer = Mixer(
+            max_voices=settings.audio_max_voices,
+            max_voices_per_sound=settings.audio_max_voices_per_sound,
+            coalesce_window=settings.audio_coalesce_ms / 1000
+        )
+        self.scaled_buffers = ScaledBufferCache()
+        self.backend: Optional[AudioBackend] = None
+        self.music_playing = False
 
         print("[AUDIO] Initializing PyAudio manager...")
         print(f"[AUDIO] PyAudio available: {PYAUDIO_AVAILABLE}")
         print(f"[AUDIO] Audio enabled: {self.enabled}")
 
-        if not PYAUDIO_AVAILABLE:
-            self.enabled = False
-            print("[AUDIO] Disabling audio - PyAudio not installed")
-            return
-
         try:
-            self.pa = pyaudio.PyAudio()
-            print(f"[AUDIO] PyAudio initialized: {self.pa}")
+            self.backend = backend if backend is not None else create_backend(settings.audio_backend)
+            if self.backend is None:
+                self.enabled = False
+                print("[AUDIO] Disabling audio - PyAudio not installed")
+                return
+
+            print(f"[AUDIO] Output backend: {self.backend.name}")
+            self._configure_output()
             self._load_sounds()
+            self.backend.open(self.mixer)
         except Exception as e:
-            print(f"[AUDIO] Error initializing PyAudio: {e}")
+            print(f"[AUDIO] Error initializing audio output: {e}")
             self.enabled = False
 
+    def _configure_output(self) -> None:
+        """Mix and store sounds in the backend's native format.
+
+        Sounds are resampled once when the PCM store is built for this
+        format, so the device never resamples the stream.
+        """
+        sample_rate, channels = self.backend.output_format()
+        self.mixer.sample_rate = sample_rate
+        self.mixer.channels = channels
+        pcm_store.configure(sample_rate, channels)
+        print(f"[AUDIO] Output format: {sample_rate} Hz, {channels} channel(s)")
+
     def _load_sounds(self) -> None:
-        """Load sound files into memory."""
-        sounds_dir = Path(__file__).parent.parent / "assets" / "sounds"
-
-        sound_files = {
-            'paddle_hit': 'paddle_hit.wav',
-            'wall_hit': 'wall_hit.wav',
-            'score': 'score.wav',
-            'game_start': 'game_start.wav',
-            'game_over': 'game_over.wav',
-            'background_music': 'background_music.wav',
-        }
-
-        for sound_name, filename in sound_files.items():
-            sound_path = sounds_dir / filename
-            if sound_path.exists():
-                try:
-                    # Load WAV file into memory
-                    with wave.open(str(sound_path), 'rb') as wf:
-                        frames = wf.readframes(wf.getnframes())
-                        self.sounds[sound_name] = {
-                            'data': frames,
-                            'channels': wf.getnchannels(),
-                            'sample_width': wf.getsampwidth(),
-                            'framerate': wf.getframerate(),
-                        }
-                    print(f"[AUDIO] Loaded {sound_name}: {len(frames)} bytes")
-                except Exception as e:
-                    print(f"[AUDIO] Warning: Could not load {filename}: {e}")
-            else:
-                print(f"[AUDIO] Warning: Sound file not found: {sound_path}")
+        """Load sounds as views into the shared PCM store (no decoding or copying)."""
+        for sound_name in SOUND_GAINS:
+            samples = pcm_store.get(sound_name)
+            if samples is None:
+                print(f"[AUDIO] Warning: {sound_name} is not available")
+                continue
+
+            # Sound effects and music play through the mixer as int16 samples
+            self.sounds[sound_name] = {'samples': samples}
+            print(f"[AUDIO] Loaded {sound_name}: {samples.nbytes} bytes")
+
+    def _output_open(self) -> bool:
+        """Whether the backend is taking audio from the mixer."""
+        return self.backend is not None and self.backend.is_open
+
+    def _sync_gains(self) -> None:
+        """Pass the master and bus volumes to the mixer."""
+        self.mixer.master_gain = settings.master_volume
+        self.mixer.bus_gains['sfx'] = settings.sfx_volume
+        self.mixer.bus_gains['music'] = settings.music_volume
+
+    def _output_volume(self, sound_name: str, bus: str = 'sfx') -> float:
+        """Get the volume a sound is heard at.
+
+        Args:
+            sound_name: Name of the sound
+            bus: Bus the sound plays on
+
+        Returns:
+            Sound gain times bus volume times master volume
+        """
+        bus_volume = settings.music_volume if bus == 'music' else settings.sfx_volume
+        return SOUND_GAINS.get(sound_name, 1.0) * bus_volume * settings.master_volume
 
     def _play_sound(self, sound_name: str, volume: float = 1.0) -> None:
         """Play a sound effect.
 
+        Queues the preloaded samples, pre-scaled to the sound's volume, on the
+        mixer; the audio callback starts them on its next block and applies
+        the sfx bus and master volume.
+
         Args:
             sound_name: Name of the sound to play
-            volume: Volume level (0.0 to 1.0)
+            volume: Sound gain (0.0 to 1.0)
         """
-        if not self.enabled or sound_name not in self.sounds:
+        if not self.enabled or not self._output_open():
             return
 
-        sound = self.sounds[sound_name]
-
-        def play():
-            try:
-                # Use larger frames_per_buffer to reduce clicking/popping
-                # frames_per_buffer of 2048 provides better buffering
-                stream = self.pa.open(
-                    format=self.pa.get_format_from_width(sound['sample_width']),
-                    channels=sound['channels'],
-                    rate=sound['framerate'],
-                    output=True,
-                    frames_per_buffer=2048  # Larger buffer reduces popping
-                )
-
-                # Apply volume by scaling the audio data
-                # This is a simple approach; for production you'd want better volume control
-                data = sound['data']
-                stream.write(data, exception_on_underflow=False)  # Don't raise on underflow
-
-                # Let the stream finish playing before closing
-                import time
-                time.sleep(0.01)  # Small delay to ensure buffer is flushed
-
-                stream.stop_stream()
-                stream.close()
-
-            except Exception as e:
-                print(f"[AUDIO] Error playing {sound_name}: {e}")
-
-        # Play in background thread to avoid blocking
-        thread = threading.Thread(target=play, daemon=True)
-        thread.start()
+        samples = self.sounds.get(sound_name, {}).get('samples')
+        if samples is not None:
+            self._sync_gains()
+            self.mixer.play(sound_name, self.scaled_buffers.get(sound_name, samples, volume))
 
     def play_bounce(self) -> None:
         """Play ball bounce sound (paddle hit)."""
-        print(f"[AUDIO] Playing paddle hit (volume: {settings.master_volume * 0.6})")
-        self._play_sound('paddle_hit', settings.master_volume * 0.6)
+        print(f"[AUDIO] Playing paddle hit (volume: {self._output_volume('paddle_hit')})")
+        self._play_sound('paddle_hit', SOUND_GAINS['paddle_hit'])
 
     def play_wall_bounce(self) -> None:
         """Play wall bounce sound."""
-        self._play_sound('wall_hit', settings.master_volume * 0.5)
+        self._play_sound('wall_hit', SOUND_GAINS['wall_hit'])
 
     def play_score(self) -> None:
         """Play score sound."""
-        print(f"[AUDIO] Playing score (volume: {settings.master_volume * 0.7})")
-        self._play_sound('score', settings.master_volume * 0.7)
+        print(f"[AUDIO] Playing score (volume: {self._output_volume('score')})")
+        self._play_sound('score', SOUND_GAINS['score'])
 
     def play_game_start(self) -> None:
         """Play game start sound."""
-        print(f"[AUDIO] Playing game start (volume: {settings.master_volume * 0.6})")
-        self._play_sound('game_start', settings.master_volume * 0.6)
+        print(f"[AUDIO] Playing game start (volume: {self._output_volume('game_start')})")
+        self._play_sound('game_start', SOUND_GAINS['game_start'])
 
     def play_game_end(self) -> None:
         """Play game end sound."""
-        print(f"[AUDIO] Playing game over (volume: {settings.master_volume * 0.8})")
-        self._play_sound('game_over', settings.master_volume * 0.8)
+        print(f"[AUDIO] Playing game over (volume: {self._output_volume('game_over')})")
+        self._play_sound('game_over', SOUND_GAINS['game_over'])
 
     def play_background_music(self) -> None:
-        """Start playing background music in a loop."""
-        if not self.enabled or 'background_music' not in self.sounds:
+        """Start looping background music with a fade in."""
+        if not self.enabled or not self._output_open():
             return
 
-        if self.music_thread and self.music_thread.is_alive():
-            print("[AUDIO] Music already playing")
+        samples = self.sounds.get('background_music', {}).get('samples')
+        if samples is None:
             return
 
-        self.music_stop_flag = False
-
-        def play_music():
-            sound = self.sounds['background_music']
-            volume = settings.master_volume * 0.3
-
-            print(f"[AUDIO] Starting background music (volume: {volume})")
-
-            try:
-                while not self.music_stop_flag:
-                    stream = self.pa.open(
-                        format=self.pa.get_format_from_width(sound['sample_width']),
-                        channels=sound['channels'],
-                        rate=sound['framerate'],
-                        output=True,
-                        frames_per_buffer=2048  # Larger buffer reduces popping
-                    )
-
-                    stream.write(sound['data'], exception_on_underflow=False)
-                    stream.stop_stream()
-                    stream.close()
-
-                    # Loop seamlessly
-                    if self.music_stop_flag:
-                        break
-
-            except Exception as e:
-                print(f"[AUDIO] Error playing background music: {e}")
+        if self.music_playing:
+            print("[AUDIO] Music already playing")
+            return
 
-        self.music_thread = threading.Thread(target=play_music, daemon=True)
-        self.music_thread.start()
+        print(f"[AUDIO] Starting background music (volume: {self._output_volume('background_music', 'music')})")
+        self._sync_gains()
+        self.mixer.play_music(
+            'background_music',
+            samples,
+            SOUND_GAINS['background_music'],
+            fade_in=settings.music_fade_seconds
+        )
+        self.music_playing = True
 
     def stop_background_music(self) -> None:
-        """Stop background music."""
+        """Fade out background music (does not wait for the fade)."""
+        if not self.music_playing:
+            return
+
         print("[AUDIO] Stopping background music...")
-        self.music_stop_flag = True
-        if self.music_thread:
-            self.music_thread.join(timeout=1.0)
-            self.music_thread = None
+        self.mixer.stop_music(fade_out=settings.music_fade_seconds)
+        self.music_playing = False
+
+    def sync_enabled(self) -> None:
+        """Follow the audio setting (it may have changed in the settings menu)."""
+        self.enabled = settings.audio_enabled and self._output_open()
 
     def toggle_audio(self) -> bool:
         """Toggle audio on/off.
@@ -204,9 +198,19 @@ class PyAudioManager:
             volume: Volume level (0.0 to 1.0)
         """
         settings.master_volume = max(0.0, min(1.0, volume))
+        self._sync_gains()
 
     def cleanup(self) -> None:
-        """Clean up PyAudio resources."""
+        """Stop the music and close the audio backend."""
         self.stop_background_music()
-        if hasattr(self, 'pa'):
-            self.pa.terminate()
+        if self._output_open():
+            stats = self.mixer.latency_stats()
+            if stats:
+                print(
+                    f"[AUDIO] Sound trigger latency {stats['trigger_ms']:.1f} ms avg, "
+                    f"{stats['max_trigger_ms']:.1f} ms max ({stats['block_ms']:.1f} ms blocks)"
+                )
+            voices = self.mixer.voice_stats()
+            print(f"[AUDIO] Triggers coalesced: {voices['dropped']}, voices stolen: {voices['stolen']}")
+        if self.backend is not None:
+            self.backend.close()
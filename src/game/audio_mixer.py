@@ -0,0 +1,458 @@
+"""Software mixer rendering sound effects and looping music into one output stream."""
+import time
+import numpy as np
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Optional, Tuple
+
+# Default mixer output format (the generated sound assets' format; the
+# PyAudio manager switches to the output device's native format)
+MIXER_SAMPLE_RATE = 22050
+MIXER_CHANNELS = 1
+
+# Return code telling a callback-mode stream to keep running (pyaudio.paContinue)
+STREAM_CONTINUE = 0
+
+# Gains are applied as Q15 fixed point: sample * round(gain * 32768) >> 15
+GAIN_ONE = 1 << 15
+
+# Mixer buses; each has its own gain under the master gain
+BUSES = ("sfx", "music")
+
+# Triggers and music commands queued for the audio thread; bounded so an
+# output that stops pulling blocks (or never does) cannot grow them forever
+MAX_PENDING = 256
+
+
+def gain_to_q15(gain: float) -> int:
+    """Convert a linear gain to Q15 fixed point.
+
+    Args:
+        gain: Linear gain (1.0 = unchanged)
+
+    Returns:
+        Gain in Q15 (GAIN_ONE = unity)
+    """
+    return max(0, round(gain * GAIN_ONE))
+
+
+def scale_samples(samples: np.ndarray, gain: float) -> np.ndarray:
+    """Scale int16 samples by a gain, saturating to the int16 range.
+
+    Args:
+        samples: int16 samples
+        gain: Linear gain
+
+    Returns:
+        New int16 array
+    """
+    scaled = samples.astype(np.int32)
+    scaled *= gain_to_q15(gain)
+    scaled >>= 15
+    np.clip(scaled, -32768, 32767, out=scaled)
+    return scaled.astype(np.int16)
+
+
+class ScaledBufferCache:
+    """Small LRU cache of sounds pre-scaled to static volume levels.
+
+    Playing a sound at a level it was already played at reuses the scaled
+    buffer, so unchanged volumes cost no per-play math. Levels are
+    quantized to 1/1024 so float noise does not create new entries.
+    """
+
+    LEVEL_STEPS = 1024
+
+    def __init__(self, max_entries: int = 32):
+        """Initialize cache.
+
+        Args:
+            max_entries: Scaled buffers kept before the least recently used is dropped
+        """
+        self.max_entries = max_entries
+        self._buffers: OrderedDict[tuple[str, int], np.ndarray] = OrderedDict()
+
+    def get(self, name: str, samples: np.ndarray, gain: float) -> np.ndarray:
+        """Get a sound scaled to a gain.
+
+        Args:
+            name: Sound name (cache key together with the level)
+            samples: Unscaled int16 samples
+            gain: Linear gain
+
+        Returns:
+            Scaled int16 samples (the original array at unity gain)
+        """
+        level = round(gain * self.LEVEL_STEPS)
+        if level == self.LEVEL_STEPS:
+            return samples
+
+        key = (name, level)
+        scaled = self._buffers.get(key)
+        if scaled is not None:
+            self._buffers.move_to_end(key)
+            return scaled
+
+        scaled = scale_samples(samples, level / self.LEVEL_STEPS)
+        self._buffers[key] = scaled
+        while len(self._buffers) > self.max_entries:
+            self._buffers.popitem(last=False)
+        return scaled
+
+    def clear(self) -> None:
+        """Drop all scaled buffers."""
+        self._buffers.clear()
+
+
+class Voice:
+    """One playing instance of a sound."""
+
+    __slots__ = ("name", "samples", "position", "gain", "bus", "queued_at")
+
+    def __init__(self, name: str, samples: np.ndarray, gain: float, bus: str, queued_at: float):
+        self.name = name
+        self.samples = samples
+        self.position = 0
+        self.gain = gain
+        self.bus = bus
+        self.queued_at = queued_at
+
+
+class MusicVoice(Voice):
+    """A looping voice with a fade level, read from its buffer as a ring."""
+
+    __slots__ = ("level", "target", "step")
+
+    def __init__(self, name: str, samples: np.ndarray, gain: float, queued_at: float):
+        super().__init__(name, samples, gain, "music", queued_at)
+        self.level = 0.0  # Fade level (0.0 silent to 1.0 full)
+        self.target = 0.0
+        self.step = 0.0  # Level change per sample while fading
+
+    def fade_to(self, target: float, samples: int) -> None:
+        """Start a linear fade.
+
+        Args:
+            target: Level to reach
+            samples: Fade length in samples (0 = jump)
+        """
+        self.target = target
+        if samples <= 0:
+            self.level = target
+            self.step = 0.0
+        else:
+            self.step = (target - self.level) / samples
+
+    def read(self, out: np.ndarray) -> None:
+        """Fill a block from the loop, wrapping to the start sample-accurately.
+
+        Args:
+            out: int16 block to fill
+        """
+        filled = 0
+        total = len(out)
+        length = len(self.samples)
+        while filled < total:
+            count = min(total - filled, length - self.position)
+            out[filled:filled + count] = self.samples[self.position:self.position + count]
+            self.position = (self.position + count) % length
+            filled += count
+
+    def envelope(self, size: int) -> Optional[np.ndarray]:
+        """Advance the fade by one block.
+
+        Args:
+            size: Block size in samples
+
+        Returns:
+            Per-sample levels for the block, or None when not fading
+        """
+        if not self.step:
+            return None
+
+        levels = self.level + self.step * np.arange(1, size + 1)
+        if self.step > 0:
+            np.minimum(levels, self.target, out=levels)
+        else:
+            np.maximum(levels, self.target, out=levels)
+        self.level = float(levels[-1])
+        if self.level == self.target:
+            self.step = 0.0
+        return levels
+
+
+class Mixer:
+    """Mixes active voices from preloaded int16 buffers in the audio callback.
+
+    The game thread only appends to a pending queue (O(1), no locks, no
+    allocation beyond the voice object); the audio thread picks new voices
+    up at the start of each block, sums every active voice into a 32-bit
+    accumulator and saturates to int16. A sound therefore starts at most
+    one block after it is triggered, plus the device output latency.
+
+    Each voice is scaled by its own gain, its bus gain and the master gain,
+    combined into one Q15 multiply per voice per block (skipped at unity).
+    Bus and master gains can change at any time and apply from the next
+    block.
+
+    Repeat triggers of a sound within the coalesce window are dropped
+    before they are queued, and polyphony is capped per sound and overall:
+    a voice starting over a cap steals the oldest voice it competes with,
+    so bursts of triggers never grow the per-block work.
+
+    Music is one looping voice on the music bus, outside the polyphony
+    caps. It wraps inside the callback without a gap, and starting or
+    stopping it only queues a command, so neither waits on the audio
+    thread; fades are applied per sample.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = MIXER_SAMPLE_RATE,
+        channels: int = MIXER_CHANNELS,
+        max_voices: int = 16,
+        max_voices_per_sound: int = 4,
+        coalesce_window: float = 0.03
+    ):
+        """Initialize mixer.
+
+        Args:
+            sample_rate: Output sample rate in Hz
+            channels: Output channels
+            max_voices: Voices mixed at once
+            max_voices_per_sound: Voices of one sound mixed at once
+            coalesce_window: Seconds in which repeat triggers of a sound are dropped
+        """
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.max_voices = max_voices
+        self.max_voices_per_sound = max_voices_per_sound
+        self.coalesce_window = coalesce_window
+        self.master_gain = 1.0
+        self.bus_gains: dict[str, float] = {bus: 1.0 for bus in BUSES}
+        self.voices: list[Voice] = []  # Only touched by the audio thread
+        self._pending: Deque[Optional[Voice]] = deque(maxlen=MAX_PENDING)
+        self._accumulator = np.zeros(0, dtype=np.int32)
+        self._scratch = np.zeros(0, dtype=np.int32)
+
+        self.music: Optional[MusicVoice] = None  # Only touched by the audio thread
+        self._music_commands: Deque[Tuple[Optional[MusicVoice], int]] = deque(maxlen=MAX_PENDING)
+        self._music_block = np.zeros(0, dtype=np.int16)
+
+        # Time from trigger to the block that starts playing it (seconds)
+        self.trigger_latencies: Deque[float] = deque(maxlen=256)
+        self.blocks_rendered = 0
+        self.block_frames = 0
+
+        self._last_trigger: dict[str, float] = {}  # Only touched by the game thread
+        self.dropped_triggers = 0
+        self.stolen_voices = 0
+
+        # Called from the audio thread with the name of each voice it starts
+        self.voice_listener: Optional[Callable[[str], None]] = None
+
+    def play(self, name: str, samples: np.ndarray, gain: float = 1.0, bus: str = "sfx") -> bool:
+        """Queue a sound to start on the next block.
+
+        Args:
+            name: Sound name
+            samples: int16 samples in the mixer format
+            gain: Voice gain
+            bus: Bus the voice plays on ("sfx" or "music")
+
+        Returns:
+            False if the trigger was coalesced with a recent one and dropped
+        """
+        now = time.perf_counter()
+        last = self._last_trigger.get(name)
+        if last is not None and now - last < self.coalesce_window:
+            self.dropped_triggers += 1
+            return False
+
+        self._last_trigger[name] = now
+        self._pending.append(Voice(name, samples, gain, bus, now))
+        return True
+
+    def _start_voice(self, voice: Voice) -> None:
+        """Add a voice to the mix, stealing the oldest competing voice over a cap.
+
+        Args:
+            voice: Voice to start
+        """
+        voices = self.voices
+        same = [index for index, other in enumerate(voices) if other.name == voice.name]
+        if len(same) >= self.max_voices_per_sound:
+            del voices[same[0]]
+            self.stolen_voices += 1
+        elif len(voices) >= self.max_voices:
+            del voices[0]
+            self.stolen_voices += 1
+        voices.append(voice)
+
+    def play_music(self, name: str, samples: np.ndarray, gain: float = 1.0, fade_in: float = 0.0) -> None:
+        """Start looping music on the next block.
+
+        Starting the music that is already playing (or fading out) fades it
+        back in where it is instead of restarting it.
+
+        Args:
+            name: Music name
+            samples: int16 samples in the mixer format
+            gain: Music gain
+            fade_in: Fade-in time in seconds
+        """
+        voice = MusicVoice(name, samples, gain, time.perf_counter())
+        self._music_commands.append((voice, round(fade_in * self.sample_rate * self.channels)))
+
+    def stop_music(self, fade_out: float = 0.0) -> None:
+        """Fade the music out and stop it; returns immediately.
+
+        Args:
+            fade_out: Fade-out time in seconds
+        """
+        self._music_commands.append((None, round(fade_out * self.sample_rate * self.channels)))
+
+    def _apply_music_commands(self) -> None:
+        """Start, resume or fade out the music as requested by the game thread."""
+        commands = self._music_commands
+        while commands:
+            voice, fade = commands.popleft()
+            if voice is None:
+                if self.music is not None:
+                    self.music.fade_to(0.0, fade)
+                continue
+
+            if self.music is not None and self.music.name == voice.name:
+                self.music.gain = voice.gain
+            else:
+                self.music = voice
+                if self.voice_listener is not None:
+                    self.voice_listener(voice.name)
+            self.music.fade_to(1.0, fade)
+
+    def _mix_music(self, size: int) -> None:
+        """Add the next block of music to the accumulator.
+
+        Args:
+            size: Block size in samples
+        """
+        music = self.music
+        if len(self._music_block) != size:
+            self._music_block = np.zeros(size, dtype=np.int16)
+        block = self._music_block
+        music.read(block)
+
+        gain = music.gain * self.bus_gains[music.bus] * self.master_gain
+        levels = music.envelope(size)
+        if levels is None:
+            self._mix(block, gain_to_q15(gain * music.level))
+        else:
+            self._accumulator += (block * (levels * gain)).astype(np.int32)
+
+        if music.level == 0.0 and music.target == 0.0:
+            self.music = None
+
+    def _mix(self, chunk: np.ndarray, gain: int) -> None:
+        """Add samples to the accumulator at a Q15 gain.
+
+        Args:
+            chunk: int16 samples
+            gain: Q15 gain
+        """
+        length = len(chunk)
+        if gain == GAIN_ONE:
+            self._accumulator[:length] += chunk
+        elif gain:
+            scratch = self._scratch[:length]
+            np.multiply(chunk, gain, out=scratch, dtype=np.int32)
+            scratch >>= 15
+            self._accumulator[:length] += scratch
+
+    def stop_all(self) -> None:
+        """Drop queued voices; playing voices end at the next block."""
+        self._pending.clear()
+        self._pending.append(None)
+
+    def render(self, frame_count: int) -> bytes:
+        """Mix the next block of audio (called from the audio thread).
+
+        Args:
+            frame_count: Frames requested by the output stream
+
+        Returns:
+            int16 PCM bytes for the block
+        """
+        now = time.perf_counter()
+        pending = self._pending
+        while pending:
+            voice = pending.popleft()
+            if voice is None:
+                self.voices.clear()
+                continue
+            self.trigger_latencies.append(now - voice.queued_at)
+            self._start_voice(voice)
+            if self.voice_listener is not None:
+                self.voice_listener(voice.name)
+        self._apply_music_commands()
+
+        self.block_frames = frame_count
+        size = frame_count * self.channels
+        if len(self._accumulator) != size:
+            self._accumulator = np.zeros(size, dtype=np.int32)
+            self._scratch = np.zeros(size, dtype=np.int32)
+        accumulator = self._accumulator
+        accumulator.fill(0)
+
+        master_gain = self.master_gain
+        bus_gains = self.bus_gains
+        for voice in self.voices:
+            chunk = voice.samples[voice.position:voice.position + size]
+            voice.position += len(chunk)
+            self._mix(chunk, gain_to_q15(voice.gain * bus_gains[voice.bus] * master_gain))
+        if self.music is not None:
+            self._mix_music(size)
+
+        self.voices = [voice for voice in self.voices if voice.position < len(voice.samples)]
+        self.blocks_rendered += 1
+
+        np.clip(accumulator, -32768, 32767, out=accumulator)
+        return accumulator.astype(np.int16).tobytes()
+
+    def stream_callback(self, in_data: Optional[bytes], frame_count: int, time_info: dict, status: int):
+        """Callback for a callback-mode output stream (PyAudio signature).
+
+        Returns:
+            (PCM bytes, continue flag)
+        """
+        return self.render(frame_count), STREAM_CONTINUE
+
+    def voice_stats(self) -> dict[str, int]:
+        """Summarize voice limiting.
+
+        Returns:
+            Voices playing, triggers dropped by coalescing and voices stolen
+        """
+        return {
+            "active": len(self.voices),
+            "dropped": self.dropped_triggers,
+            "stolen": self.stolen_voices,
+        }
+
+    def latency_stats(self) -> dict[str, float]:
+        """Summarize trigger-to-playback latency.
+
+        Trigger latency is bounded by the block duration; the device adds
+        its own output latency on top.
+
+        Returns:
+            Mean and maximum trigger latency and the block duration, in
+            milliseconds (empty before any sound has played)
+        """
+        if not self.trigger_latencies:
+            return {}
+
+        latencies = np.fromiter(self.trigger_latencies, dtype=np.float64) * 1000
+        return {
+            "trigger_ms": float(latencies.mean()),
+            "max_trigger_ms": float(latencies.max()),
+            "block_ms": self.block_frames / self.sample_rate * 1000,
+        }
@@ -2,24 +2,134 @@
 import arcade
 import random
 import math
+import numpy as np
+from itertools import islice
+from typing import Optional
+from arcade.gl import BufferDescription
 from game.settings import settings
+from game.quality import quality
+from game.profiler import profiler
+
+# Grid lines drawn across the floor and from the horizon toward the viewer
+_GRID_VERTICAL_LINES = 20
+_GRID_HORIZONTAL_LINES = 15
+
+_GRID_VERTEX_SHADER = """
+#version 330
+
+uniform WindowBlock {
+    mat4 projection;
+    mat4 view;
+} window;
+
+in vec2 in_vert;
+
+out vec2 v_pos;
+
+void main() {
+    v_pos = in_vert;
+    gl_Position = window.projection * window.view * vec4(in_vert, 0.0, 1.0);
+}
+"""
+
+_GRID_FRAGMENT_SHADER = """
+#version 330
+
+uniform vec2 u_size;          // (width, horizon height)
+uniform vec2 u_line_counts;   // (vertical lines, horizontal lines)
+uniform float u_depth;
+uniform float u_scroll;       // Horizontal line offset toward the horizon, in rows [0, 1)
+uniform int u_glow_passes;
+uniform vec3 u_core_color;
+uniform vec3 u_glow_color;
+
+in vec2 v_pos;
+
+out vec4 fragColor;
+
+// Glow layers from the innermost outwards: (half width, alpha)
+const vec2 GLOW_LAYERS[3] = vec2[3](
+    vec2(2.0, 100.0 / 255.0),
+    vec2(3.0, 60.0 / 255.0),
+    vec2(4.0, 30.0 / 255.0)
+);
+
+float row_y(float row) {
+    return u_size.y * pow((row + u_scroll) / u_line_counts.y, 2.0);
+}
+
+void main() {
+    float width = u_size.x;
+    float horizon = u_size.y;
+    float dist = abs(v_pos.y - horizon);
+
+    if (v_pos.y <= horizon) {
+        float t = v_pos.y / horizon;
+
+        // Vertical lines converge toward the center at the horizon
+        float base_spacing = width / u_line_counts.x;
+        float spacing = base_spacing * (1.0 + (u_depth - 1.0) * t);
+        float offset = v_pos.x - width * 0.5;
+        float u = offset / spacing + u_line_counts.x * 0.5;
+        float line = clamp(round(u), 0.0, u_line_counts.x);
+        vec2 grad = vec2(1.0, -offset * base_spacing * (u_depth - 1.0) / (horizon * spacing)) / spacing;
+        dist = min(dist, abs(u - line) / length(grad));
+
+        // Horizontal lines get closer together toward the horizon
+        float v = u_line_counts.y * sqrt(t) - u_scroll;
+        float below = floor(v);
+        if (below + u_scroll >= 0.0) {
+            dist = min(dist, v_pos.y - row_y(below));
+        }
+        float above = row_y(below + 1.0);
+        if (above <= horizon) {
+            dist = min(dist, above - v_pos.y);
+        }
+    }
+
+    // Layer the glow passes and the 2 pixel core like individually drawn lines
+    float aa = fwidth(v_pos.x) * 0.5;
+    float glow_keep = 1.0;
+    for (int i = 0; i < u_glow_passes; i++) {
+        float coverage = 1.0 - smoothstep(GLOW_LAYERS[i].x - aa, GLOW_LAYERS[i].x + aa, dist);
+        glow_keep *= 1.0 - GLOW_LAYERS[i].y * coverage;
+    }
+    float core = 1.0 - smoothstep(1.0 - aa, 1.0 + aa, dist);
+
+    float alpha = 1.0 - glow_keep * (1.0 - core);
+    if (alpha <= 0.0) discard;
+    vec3 color = u_glow_color * (1.0 - glow_keep) * (1.0 - core) + u_core_color * core;
+    fragColor = vec4(color / alpha, alpha);
+}
+"""
 
 
 class BackgroundRenderer:
     """Renders synthwave-themed background with stars, city, and grid."""
 
-    def __init__(self, width: int, height: int):
+    def __init__(self, width: int, height: int, seed: Optional[int] = None):
         """Initialize background renderer.
 
         Args:
             width: Screen width
             height: Screen height
+            seed: Seed for the star and skyline layout and flicker (random if None)
         """
         self.width = width
         self.height = height
+        self._layout_random = random.Random(seed)
+        # Star twinkle and window flicker use their own generator so drawing
+        # does not disturb game randomness (keeps recorded matches replayable);
+        # it shares the seed so seeded backgrounds also draw identically
+        self._flicker_random = random.Random(seed)
         self.stars = self._generate_stars()
         self.buildings = self._generate_buildings()
 
+        # Perspective grid shader (GL resources are created on first draw)
+        self.grid_scroll = 0.0
+        self._grid_program = None
+        self._grid_geometry = None
+
     def _generate_stars(self) -> list[tuple[float, float, float]]:
         """Generate random star positions and sizes.
 
@@ -28,9 +138,9 @@ class BackgroundRenderer:
         """
         stars = []
         for _ in range(settings.star_count):
-            x = random.uniform(0, self.width)
-            y = random.uniform(self.height * 0.5, self.height)  # Stars in upper half
-            size = random.uniform(0.5, 2.5)
+            x = self._layout_random.uniform(0, self.width)
+            y = self._layout_random.uniform(self.height * 0.5, self.height)  # Stars in upper half
+            size = self._layout_random.uniform(0.5, 2.5)
             stars.append((x, y, size))
         return stars
 
@@ -46,12 +156,12 @@ class BackgroundRenderer:
 
         while x_pos < self.width:
             # Random building dimensions
-            building_width = random.randint(60, 120)
-            building_height = random.randint(80, 200)
+            building_width = self._layout_random.randint(60, 120)
+            building_height = self._layout_random.randint(80, 200)
 
             # Random window pattern
-            window_rows = random.randint(5, 12)
-            window_cols = random.randint(3, 6)
+            window_rows = self._layout_random.randint(5, 12)
+            window_cols = self._layout_random.randint(3, 6)
 
             # Random accent color for windows
             accent_colors = [
@@ -59,7 +169,7 @@ class BackgroundRenderer:
                 settings.synthwave_city_windows_pink,
                 settings.synthwave_city_windows_orange
             ]
-            accent_color = random.choice(accent_colors)
+            accent_color = self._layout_random.choice(accent_colors)
 
             buildings.append({
                 'x': x_pos,
@@ -71,16 +181,30 @@ class BackgroundRenderer:
                 'accent_color': accent_color
             })
 
-            x_pos += building_width + random.randint(10, 30)  # Gap between buildings
+            x_pos += building_width + self._layout_random.randint(10, 30)  # Gap between buildings
 
         return buildings
 
+    def update(self, delta_time: float, speed: float = 0.0) -> None:
+        """Scroll the floor grid toward the horizon.
+
+        Args:
+            delta_time: Time since last update
+            speed: Scroll driver, usually the ball speed (0 keeps the grid still)
+        """
+        rows = delta_time * speed * settings.grid_scroll_speed
+        self.grid_scroll = (self.grid_scroll + rows) % 1.0
+
     def draw(self) -> None:
         """Draw the complete synthwave background."""
-        self._draw_sky_gradient()
-        self._draw_stars()
-        self._draw_city_skyline()
-        self._draw_perspective_grid()
+        with profiler.section("bg.sky"):
+            self._draw_sky_gradient()
+        with profiler.section("bg.stars"):
+            self._draw_stars()
+        with profiler.section("bg.city"):
+            self._draw_city_skyline()
+        with profiler.section("bg.grid"):
+            self._draw_perspective_grid()
 
     def _draw_sky_gradient(self) -> None:
         """Draw vertical gradient sky from deep blue to purple."""
@@ -110,9 +234,10 @@ class BackgroundRenderer:
 
     def _draw_stars(self) -> None:
         """Draw twinkling stars in the background."""
-        for x, y, size in self.stars:
+        visible_stars = int(len(self.stars) * quality.star_fraction)
+        for x, y, size in islice(self.stars, visible_stars):
             # Slight brightness variation for twinkling effect
-            brightness = random.uniform(0.6, 1.0)
+            brightness = self._flicker_random.uniform(0.6, 1.0)
             color = tuple(int(255 * brightness) for _ in range(3))
             arcade.draw_circle_filled(x, y, size, color)
 
@@ -154,7 +279,7 @@ class BackgroundRenderer:
             for row in range(building['window_rows']):
                 for col in range(building['window_cols']):
                     # Random chance for window to be lit
-                    if random.random() < 0.7:
+                    if self._flicker_random.random() < 0.7:
                         # Windows start from bottom and go up
                         window_x = building_left + (col + 1) * window_width
                         window_y = building_bottom + (row + 1) * window_height
@@ -170,72 +295,96 @@ class BackgroundRenderer:
                             building['accent_color']
                         )
 
-    def _draw_perspective_grid(self) -> None:
-        """Draw perspective grid floor in synthwave style."""
+    def _create_grid_resources(self) -> None:
+        """Create the grid shader program and the floor quad it is drawn on."""
+        ctx = arcade.get_window().ctx
         horizon_y = self.height * 0.4
-        grid_bottom = 0
-        grid_top = horizon_y
-
-        # Vertical lines (receding into distance)
-        num_vertical_lines = 20
-        for i in range(num_vertical_lines + 1):
-            # Lines converge toward center
-            x_top = self.width / 2 + (i - num_vertical_lines / 2) * (self.width / num_vertical_lines) * settings.grid_perspective_depth
-            x_bottom = self.width / 2 + (i - num_vertical_lines / 2) * (self.width / num_vertical_lines)
-
-            # Draw line with glow effect
-            self._draw_glowing_line(
-                x_bottom, grid_bottom,
-                x_top, grid_top,
-                settings.synthwave_grid_color,
-                settings.synthwave_grid_glow,
-                line_width=2
-            )
+        self._grid_program = ctx.program(
+            vertex_shader=_GRID_VERTEX_SHADER,
+            fragment_shader=_GRID_FRAGMENT_SHADER
+        )
+        self._grid_program["u_size"] = (self.width, horizon_y)
+        self._grid_program["u_line_counts"] = (_GRID_VERTICAL_LINES, _GRID_HORIZONTAL_LINES)
+        self._grid_program["u_depth"] = settings.grid_perspective_depth
+        self._grid_program["u_core_color"] = tuple(c / 255 for c in settings.synthwave_grid_color)
+        self._grid_program["u_glow_color"] = tuple(c / 255 for c in settings.synthwave_grid_glow)
+
+        # Floor quad, extended above the horizon to fit the horizon line glow
+        top = horizon_y + 5
+        vertices = np.array([0, 0, self.width, 0, 0, top, self.width, top], dtype=np.float32)
+        self._grid_geometry = ctx.geometry(
+            [BufferDescription(ctx.buffer(data=vertices), "2f", ["in_vert"])],
+            mode=ctx.TRIANGLE_STRIP
+        )
+
+    def _draw_perspective_grid(self) -> None:
+        """Draw perspective grid floor in synthwave style.
+
+        Every line and its glow is computed per pixel in a shader, so the
+        grid costs one draw call regardless of line density.
+        """
+        if self._grid_program is None:
+            self._create_grid_resources()
+
+        self._grid_program["u_scroll"] = self.grid_scroll
+        self._grid_program["u_glow_passes"] = quality.grid_glow_passes
+
+        # Arcade only enables blending around its own draw calls
+        ctx = self._grid_program.ctx
+        with ctx.enabled(ctx.BLEND):
+            self._grid_geometry.render(self._grid_program)
 
-        # Horizontal lines (parallel, evenly spaced)
-        num_horizontal_lines = 15
-        for i in range(num_horizontal_lines + 1):
-            # Perspective scaling - lines closer together near horizon
-            ratio = i / num_horizontal_lines
-            # Non-linear spacing for perspective effect
-            perspective_ratio = ratio ** 2
-            y = grid_bottom + perspective_ratio * (grid_top - grid_bottom)
-
-            # Draw line with glow effect
-            self._draw_glowing_line(
-                0, y,
-                self.width, y,
-                settings.synthwave_grid_color,
-                settings.synthwave_grid_glow,
-                line_width=2
-            )
 
-    def _draw_glowing_line(
-        self,
-        x1: float, y1: float,
-        x2: float, y2: float,
-        core_color: tuple[int, int, int],
-        glow_color: tuple[int, int, int],
-        line_width: int = 2
-    ) -> None:
-        """Draw a line with a glowing effect.
+class BackgroundCache:
+    """Builds each background once and shares it between views.
+
+    Menus, settings screens and the game all draw the same background, so
+    switching views does not regenerate the skyline or recreate GPU
+    resources, and the skyline stays the same across screens.
+    """
+
+    def __init__(self):
+        """Initialize empty cache."""
+        self.seed: Optional[int] = None  # Layout seed for newly built backgrounds
+        self._backgrounds: dict[tuple, BackgroundRenderer] = {}
+
+    def _theme_key(self) -> tuple:
+        """Settings baked into a background when it is built.
+
+        Returns:
+            Tuple of theme settings
+        """
+        return (
+            settings.synthwave_grid_color,
+            settings.synthwave_grid_glow,
+            settings.synthwave_city_windows_cyan,
+            settings.synthwave_city_windows_pink,
+            settings.synthwave_city_windows_orange,
+            settings.star_count,
+            settings.grid_perspective_depth
+        )
+
+    def get(self, width: int, height: int) -> BackgroundRenderer:
+        """Get the shared background for a resolution and the current theme.
 
         Args:
-            x1, y1: Start position
-            x2, y2: End position
-            core_color: Main line color
-            glow_color: Glow halo color
-            line_width: Line thickness
+            width: Screen width
+            height: Screen height
+
+        Returns:
+            Shared background renderer
         """
-        # Draw glow layers (outer to inner)
-        glow_layers = [
-            (line_width + 6, (*glow_color, 30)),
-            (line_width + 4, (*glow_color, 60)),
-            (line_width + 2, (*glow_color, 100))
-        ]
-
-        for width, color in glow_layers:
-            arcade.draw_line(x1, y1, x2, y2, color, width)
-
-        # Draw core line
-        arcade.draw_line(x1, y1, x2, y2, core_color, line_width)
+        key = (width, height, self._theme_key())
+        background = self._backgrounds.get(key)
+        if background is None:
+            background = BackgroundRenderer(width, height, self.seed)
+            self._backgrounds[key] = background
+        return background
+
+    def clear(self) -> None:
+        """Drop all cached backgrounds."""
+        self._backgrounds.clear()
+
+
+# Global background cache shared by all views
+background_cache = BackgroundCache()
@@ -4,6 +4,7 @@ import random
 import math
 from game.settings import settings
 from game.visual_effects import GlowEffect, MotionTrail
+from game.profiler import profiler
 
 
 class Ball(arcade.SpriteCircle):
@@ -131,18 +132,20 @@ class Ball(arcade.SpriteCircle):
     def draw(self) -> None:
         """Draw the ball with motion trail and glow effect."""
         # Draw motion trail first (behind the ball)
-        self.motion_trail.draw(
-            settings.ball_radius,
-            settings.synthwave_ball_core,
-            settings.synthwave_ball_glow
-        )
+        with profiler.section("trail"):
+            self.motion_trail.draw(
+                settings.ball_radius,
+                settings.synthwave_ball_core,
+                settings.synthwave_ball_glow
+            )
 
         # Draw ball with radial glow
-        GlowEffect.draw_radial_glow(
-            self.center_x,
-            self.center_y,
-            settings.ball_radius,
-            settings.synthwave_ball_core,
-            settings.synthwave_ball_glow,
-            intensity=1.5
-        )
+        with profiler.section("glow"):
+            GlowEffect.draw_radial_glow(
+                self.center_x,
+                self.center_y,
+                settings.ball_radius,
+                settings.synthwave_ball_core,
+                settings.synthwave_ball_glow,
+                intensity=1.5
+            )
@@ -0,0 +1,471 @@
+"""Headless frame capture: input log replay and background frame encoding.
+
+Matches are rendered into the internal framebuffer (see ``render_target``)
+and streamed to disk as PNG sequences or raw RGBA video. Pixels are read
+back asynchronously through a ring of pixel buffers and handed to a worker
+thread through a bounded queue, so readback and encoding never block the
+render loop.
+
+Usage:
+    ARCADE_HEADLESS=1 python -m game.capture match.json out/ --format png
+    ARCADE_HEADLESS=1 python -m game.capture match.json out/ --format raw --live
+"""
+import argparse
+import json
+import queue
+import random
+import threading
+import time
+import arcade
+import numpy as np
+from pathlib import Path
+from typing import Literal, Optional
+from PIL import Image
+from pyglet import gl
+from game.settings import settings
+from game.render_target import render_target, InternalRenderTarget
+
+# Keys that only affect the local window and are never recorded
+_IGNORED_KEYS = {arcade.key.F3, arcade.key.F11}
+
+
+class InputLog:
+    """Records input events per update tick so a match can be replayed exactly.
+
+    A match is deterministic given its random seed, the delta time of each
+    update tick and the input events that arrived before each tick: key
+    presses and releases, and mouse moves and clicks on the pause menu (in
+    logical coordinates, so a replay does not depend on the window size).
+    """
+
+    def __init__(self, game_mode: Literal["single", "two_player"] = "single", seed: Optional[int] = None):
+        """Initialize input log.
+
+        Args:
+            game_mode: Game mode the match was played in
+            seed: Random seed for the match (a new one is chosen if None)
+        """
+        self.game_mode = game_mode
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.delta_times: list[float] = []
+        # (tick, "press"/"release", key) or (tick, "move"/"click", x, y)
+        self.events: list[tuple] = []
+
+    @property
+    def tick(self) -> int:
+        """Number of update ticks recorded so far."""
+        return len(self.delta_times)
+
+    def record_key(self, action: Literal["press", "release"], key: int) -> None:
+        """Record a key event before the next update tick.
+
+        Args:
+            action: "press" or "release"
+            key: Arcade key code
+        """
+        if key not in _IGNORED_KEYS:
+            self.events.append((self.tick, action, key))
+
+    def record_mouse(self, action: Literal["move", "click"], x: float, y: float) -> None:
+        """Record a mouse event before the next update tick.
+
+        Args:
+            action: "move" or "click"
+            x: Logical x position
+            y: Logical y position
+        """
+        self.events.append((self.tick, action, x, y))
+
+    def advance(self, delta_time: float) -> None:
+        """Record one update tick.
+
+        Args:
+            delta_time: Time step of the tick
+        """
+        self.delta_times.append(delta_time)
+
+    def events_by_tick(self) -> dict[int, list[tuple]]:
+        """Group recorded events by the tick they precede.
+
+        Returns:
+            Mapping of tick index to (action, key) and (action, x, y) events
+        """
+        grouped: dict[int, list[tuple]] = {}
+        for tick, action, *args in self.events:
+            grouped.setdefault(tick, []).append((action, *args))
+        return grouped
+
+    def save(self, path: Path) -> None:
+        """Save the log as JSON.
+
+        Args:
+            path: Output file path
+        """
+        data = {
+            "game_mode": self.game_mode,
+            "seed": self.seed,
+            "delta_times": self.delta_times,
+            "events": self.events
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, path: Path) -> "InputLog":
+        """Load a log saved with ``save``.
+
+        Args:
+            path: Log file path
+
+        Returns:
+            Loaded input log
+        """
+        with open(path, 'r') as f:
+            data = json.load(f)
+
+        log = cls(data["game_mode"], data["seed"])
+        log.delta_times = [float(dt) for dt in data["delta_times"]]
+        for tick, action, *args in data["events"]:
+            if action in ("move", "click"):
+                log.events.append((int(tick), action, float(args[0]), float(args[1])))
+            else:
+                log.events.append((int(tick), action, int(args[0])))
+        return log
+
+
+class AsyncReadback:
+    """Reads framebuffer pixels through a ring of pixel pack buffers.
+
+    ``glReadPixels`` into a bound pixel buffer returns immediately; the copy
+    completes on the GPU. A buffer is mapped only after ``depth - 1`` more
+    frames have been issued, by which time the copy has finished, so the
+    render loop never waits on the GPU.
+    """
+
+    def __init__(self, ctx, size: tuple[int, int], depth: int = 3):
+        """Initialize readback ring.
+
+        Args:
+            ctx: Arcade OpenGL context
+            size: (width, height) of the frames to read
+            depth: Number of frames in flight
+        """
+        self.size = size
+        self.depth = depth
+        frame_bytes = size[0] * size[1] * 4
+        self.buffers = [ctx.buffer(reserve=frame_bytes, usage="stream") for _ in range(depth)]
+        self.pending: list[Optional[int]] = [None] * depth  # Frame index held by each buffer
+        self.slot = 0
+
+    def read(self, framebuffer, frame_index: int) -> Optional[tuple[int, bytes]]:
+        """Start reading a frame and collect the oldest frame in flight.
+
+        Args:
+            framebuffer: Framebuffer to read
+            frame_index: Index of the frame being read
+
+        Returns:
+            (frame_index, RGBA bytes) of a completed earlier frame, or None
+        """
+        buffer = self.buffers[self.slot]
+        completed = None
+        if self.pending[self.slot] is not None:
+            completed = (self.pending[self.slot], buffer.read())
+
+        with framebuffer.activate():
+            gl.glPixelStorei(gl.GL_PACK_ALIGNMENT, 1)
+            gl.glBindBuffer(gl.GL_PIXEL_PACK_BUFFER, buffer.glo)
+            gl.glReadPixels(0, 0, *self.size, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, 0)
+            gl.glBindBuffer(gl.GL_PIXEL_PACK_BUFFER, 0)
+
+        self.pending[self.slot] = frame_index
+        self.slot = (self.slot + 1) % self.depth
+        return completed
+
+    def drain(self) -> list[tuple[int, bytes]]:
+        """Collect all frames still in flight, oldest first.
+
+        Returns:
+            List of (frame_index, RGBA bytes)
+        """
+        frames = []
+        for i in range(self.depth):
+            slot = (self.slot + i) % self.depth
+            if self.pending[slot] is not None:
+                frames.append((self.pending[slot], self.buffers[slot].read()))
+                self.pending[slot] = None
+        return frames
+
+
+class FrameCapture:
+    """Streams frames to disk from a background worker thread.
+
+    Frames are queued in a bounded queue. In live mode a full queue drops
+    the new frame (counted in ``frames_dropped``) instead of stalling the
+    render loop; offline rendering waits for space so every frame is kept.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        size: tuple[int, int],
+        frame_format: Literal["png", "raw"] = "png",
+        queue_size: int = 16,
+        drop_when_full: bool = True,
+        fps: int = 60
+    ):
+        """Initialize frame capture.
+
+        Args:
+            output_dir: Directory for the frames
+            size: (width, height) of the frames
+            frame_format: "png" for numbered PNG files, "raw" for a single RGBA stream
+            queue_size: Maximum number of frames waiting to be written
+            drop_when_full: Drop frames when the queue is full instead of waiting
+            fps: Frame rate stored alongside raw video
+        """
+        self.output_dir = output_dir
+        self.size = size
+        self.frame_format = frame_format
+        self.drop_when_full = drop_when_full
+        self.fps = fps
+
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.frames_submitted = 0
+        self.frames_written = 0
+        self.frames_dropped = 0
+
+        self._readback: Optional[AsyncReadback] = None
+        self._frame_index = 0
+        self._raw_file = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if self.frame_format == "raw":
+            self._raw_file = open(self.output_dir / "frames.rgba", 'wb')
+
+        self._thread = threading.Thread(target=self._worker, name="frame-capture", daemon=True)
+        self._thread.start()
+
+    def submit(self, frame_index: int, data: bytes) -> bool:
+        """Queue a frame for writing.
+
+        Args:
+            frame_index: Frame number
+            data: Bottom-up RGBA pixels as read from OpenGL
+
+        Returns:
+            True if the frame was queued, False if it was dropped
+        """
+        self.frames_submitted += 1
+        if self.drop_when_full:
+            try:
+                self.queue.put_nowait((frame_index, data))
+            except queue.Full:
+                self.frames_dropped += 1
+                return False
+        else:
+            self.queue.put((frame_index, data))
+        return True
+
+    def grab(self, target: InternalRenderTarget) -> None:
+        """Read back the frame just rendered into the internal framebuffer.
+
+        Args:
+            target: Render target holding the finished frame
+        """
+        if self._readback is None:
+            self._readback = AsyncReadback(target.ctx, self.size)
+
+        completed = self._readback.read(target.framebuffer, self._frame_index)
+        self._frame_index += 1
+        if completed is not None:
+            self.submit(*completed)
+
+    def attach(self) -> None:
+        """Capture every frame rendered through the global render target."""
+        render_target.frame_listeners.append(self.grab)
+
+    def close(self) -> None:
+        """Flush frames in flight, wait for the writer and detach."""
+        if self.grab in render_target.frame_listeners:
+            render_target.frame_listeners.remove(self.grab)
+
+        if self._readback is not None:
+            for frame in self._readback.drain():
+                self.submit(*frame)
+
+        if self._thread is not None:
+            self.queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+        if self._raw_file is not None:
+            self._raw_file.close()
+            self._raw_file = None
+            self._write_raw_info()
+
+    def _worker(self) -> None:
+        """Write queued frames until the stop marker arrives."""
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            frame_index, data = item
+            self._write_frame(frame_index, data)
+            self.frames_written += 1
+
+    def _write_frame(self, frame_index: int, data: bytes) -> None:
+        """Write one frame in the configured format.
+
+        Args:
+            frame_index: Frame number
+            data: Bottom-up RGBA pixels
+        """
+        width, height = self.size
+        pixels = np.frombuffer(data, dtype=np.uint8).reshape(height, width, 4)[::-1]
+
+        if self.frame_format == "raw":
+            self._raw_file.write(pixels.tobytes())
+        else:
+            path = self.output_dir / f"frame_{frame_index:06d}.png"
+            Image.fromarray(pixels).save(path, compress_level=1)
+
+    def _write_raw_info(self) -> None:
+        """Write the metadata needed to decode the raw stream."""
+        width, height = self.size
+        info = {
+            "width": width,
+            "height": height,
+            "fps": self.fps,
+            "pixel_format": "rgba",
+            "frames": self.frames_written,
+            "ffmpeg": f"ffmpeg -f rawvideo -pix_fmt rgba -s {width}x{height} -r {self.fps} -i frames.rgba clip.mp4"
+        }
+        with open(self.output_dir / "frames.json", 'w') as f:
+            json.dump(info, f, indent=2)
+
+
+class MatchReplay:
+    """Drives a game view from an input log one update tick at a time."""
+
+    def __init__(self, log: InputLog):
+        """Initialize replay.
+
+        Args:
+            log: Recorded match
+        """
+        from game.pong_window import PongGameView
+
+        self.log = log
+        self.events = log.events_by_tick()
+        self.tick = 0
+
+        random.seed(log.seed)
+        self.view = PongGameView(log.game_mode)
+        self.view.setup()
+
+    @property
+    def finished(self) -> bool:
+        """True when every recorded tick has been replayed."""
+        return self.tick >= self.log.tick
+
+    def step(self) -> None:
+        """Replay the input events and update of the next tick."""
+        for action, *args in self.events.get(self.tick, ()):
+            if action == "press":
+                self.view.on_key_press(args[0], 0)
+            elif action == "release":
+                self.view.on_key_release(args[0], 0)
+            else:
+                self.view.handle_mouse(action, *args)
+
+        self.view.on_update(self.log.delta_times[self.tick])
+        self.tick += 1
+
+
+def render_replay(log: InputLog, capture: FrameCapture, live: bool = False, fps: int = 60) -> None:
+    """Render a recorded match through the frame capture pipeline.
+
+    Offline replays render one frame per ``1 / fps`` of match time as fast
+    as possible. Live replays keep the match running in real time, as a
+    running game would, and render whenever the previous frame is done.
+
+    Args:
+        log: Recorded match
+        capture: Started frame capture
+        live: Run in real time instead of as fast as possible
+        fps: Output frame rate
+    """
+    replay = MatchReplay(log)
+    capture.attach()
+    frame_interval = 1.0 / fps
+    match_time = 0.0
+    next_frame = 0.0
+    start = time.perf_counter()
+
+    while not replay.finished:
+        if live:
+            # Catch the match up with the wall clock, then wait for the next frame slot
+            next_frame = max(next_frame + frame_interval, time.perf_counter() - start)
+            delay = start + next_frame - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        else:
+            next_frame += frame_interval
+
+        # The view is driven directly rather than shown, so no window
+        # event loop updates it a second time
+        while not replay.finished and match_time < next_frame:
+            match_time += log.delta_times[replay.tick]
+            replay.step()
+        replay.view.on_draw()
+
+    capture.close()
+
+
+def main() -> None:
+    """Render a recorded match to disk."""
+    parser = argparse.ArgumentParser(description="Render a recorded Pong match to frames")
+    parser.add_argument("log", type=Path, help="Input log recorded with main.py --record-inputs")
+    parser.add_argument("output", type=Path, help="Output directory")
+    parser.add_argument("--format", choices=["png", "raw"], default="png", help="Frame format")
+    parser.add_argument("--live", action="store_true", help="Render in real time, dropping frames if encoding falls behind")
+    parser.add_argument("--fps", type=int, default=60, help="Output frame rate")
+    parser.add_argument("--queue-size", type=int, default=16, help="Frames buffered for the writer thread")
+    args = parser.parse_args()
+
+    log = InputLog.load(args.log)
+
+    # Servers have no audio device, and captures should use full quality
+    settings.audio_enabled = False
+    if not args.live:
+        settings.adaptive_quality_enabled = False
+
+    arcade.Window(settings.screen_width, settings.screen_height, settings.screen_title, visible=False)
+
+    capture = FrameCapture(
+        args.output,
+        (settings.render_width, settings.render_height),
+        frame_format=args.format,
+        queue_size=args.queue_size,
+        drop_when_full=args.live,
+        fps=args.fps
+    )
+    capture.start()
+
+    start = time.perf_counter()
+    render_replay(log, capture, live=args.live, fps=args.fps)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"[CAPTURE] {capture.frames_written} frames written, "
+        f"{capture.frames_dropped} dropped in {elapsed:.1f}s -> {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""Frame pacing modes with frame jitter and input-to-present latency measurement."""
+import arcade
+import pyglet
+import time
+import numpy as np
+from collections import deque
+from typing import Deque, Literal, Optional
+from game.settings import settings
+
+PacingMode = Literal["vsync", "uncapped", "capped"]
+
+# Refresh rate assumed for vsync when the display does not report one
+DEFAULT_REFRESH_RATE = 60
+
+# Longest frame the simulation catches up on; after a longer stall (window
+# drag, breakpoint) the game pauses for the excess instead of fast-forwarding
+MAX_CATCH_UP = 0.25
+
+
+def sleep_until(deadline: float, spin_time: float) -> None:
+    """Wait until a perf_counter deadline with a sleep+spin hybrid.
+
+    The OS sleep is only accurate to a millisecond or worse, so it is used
+    for the bulk of the wait and the last ``spin_time`` seconds are spent
+    busy-waiting to hit the deadline precisely.
+
+    Args:
+        deadline: Target time (time.perf_counter() clock)
+        spin_time: Seconds before the deadline to stop sleeping and spin
+    """
+    remaining = deadline - time.perf_counter() - spin_time
+    if remaining > 0:
+        time.sleep(remaining)
+    while time.perf_counter() < deadline:
+        pass
+
+
+class FramePacer:
+    """Drives the frame loop in one of three pacing modes and measures delivery.
+
+    - ``vsync``: frames are presented on the display refresh; the buffer swap
+      blocks until vertical blank.
+    - ``uncapped``: frames run back to back with no waiting.
+    - ``capped``: frames start on a fixed ``target_fps`` schedule, waiting with
+      sleep followed by a short spin so deadlines are hit to within
+      microseconds instead of the OS sleep granularity.
+
+    The simulation runs on a fixed step of ``target_fps`` ticks per second
+    in every mode, separate from presents: each frame runs however many
+    ``on_update(1 / target_fps)`` ticks the elapsed time owes (zero or more)
+    and draws once, so game speed never follows the present rate.
+
+    Input is pumped right before the updates so the freshest events reach
+    the frame. Presents are timestamped to measure frame-to-frame jitter and
+    an estimated input-to-present latency: the time from sampling input to
+    the buffer swap returning, plus half a frame for the average time an
+    event waits to be sampled.
+    """
+
+    def __init__(self, history: int = 600):
+        """Initialize frame pacer.
+
+        Args:
+            history: Number of frames kept for statistics
+        """
+        self.mode: PacingMode = settings.frame_pacing_mode
+        self.window: Optional[arcade.Window] = None
+        self.intervals: Deque[float] = deque(maxlen=history)
+        self.latencies: Deque[float] = deque(maxlen=history)
+
+        self._next_deadline: Optional[float] = None
+        self._last_frame: Optional[float] = None
+        self._last_present: Optional[float] = None
+        self._input_time: Optional[float] = None
+        self._accumulator = 0.0
+        self.ticks = 0
+
+    @property
+    def period(self) -> float:
+        """Simulation tick period (and capped-mode frame period) in seconds."""
+        return 1.0 / settings.target_fps
+
+    @property
+    def frame_budget(self) -> float:
+        """Time a frame may take without missing its present, in seconds.
+
+        The display refresh period under vsync, otherwise one tick period.
+        """
+        if self.mode == "vsync" and self.window is not None:
+            mode = self.window.screen.get_mode()
+            rate = getattr(mode, "rate", 0) or DEFAULT_REFRESH_RATE
+            return 1.0 / rate
+        return self.period
+
+    def install(self, window: arcade.Window, mode: Optional[PacingMode] = None) -> None:
+        """Take over frame dispatch for a window.
+
+        Args:
+            window: Game window
+            mode: Pacing mode (defaults to settings.frame_pacing_mode)
+        """
+        self.window = window
+
+        # Replace arcade's fixed-interval frame event, whose timing is only
+        # as precise as the OS sleep, with one called on every loop pass
+        pyglet.clock.unschedule(window._dispatch_frame)
+        pyglet.clock.schedule(self._frame)
+
+        original_flip = window.flip
+
+        def timed_flip() -> None:
+            original_flip()
+            self._on_present()
+
+        window.flip = timed_flip
+        self.set_mode(mode or settings.frame_pacing_mode)
+
+    def uninstall(self) -> None:
+        """Give frame dispatch back to arcade."""
+        if self.window is None:
+            return
+
+        pyglet.clock.unschedule(self._frame)
+        del self.window.flip
+        self.window.set_update_rate(1 / settings.target_fps)
+        self.window = None
+
+    def set_mode(self, mode: PacingMode) -> None:
+        """Switch pacing mode and restart the measurements.
+
+        Args:
+            mode: "vsync", "uncapped" or "capped"
+        """
+        self.mode = mode
+        if self.window is not None:
+            self.window.set_vsync(mode == "vsync")
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear measurements and the capped-mode schedule."""
+        self.intervals.clear()
+        self.latencies.clear()
+        self._next_deadline = None
+        self._last_frame = None
+        self._last_present = None
+        self._input_time = None
+        self._accumulator = 0.0
+
+    def _wait_for_deadline(self) -> None:
+        """Wait for the next capped frame slot."""
+        now = time.perf_counter()
+        if self._next_deadline is None:
+            self._next_deadline = now
+            return
+
+        self._next_deadline += self.period
+        if now >= self._next_deadline:
+            # Frame ran late: start now rather than rushing to catch up
+            self._next_deadline = now
+        else:
+            sleep_until(self._next_deadline, settings.frame_pacing_spin_time)
+
+    def _frame(self, _clock_dt: float) -> None:
+        """Run one paced frame (scheduled on every event loop pass)."""
+        window = self.window
+        if self.mode == "capped":
+            self._wait_for_deadline()
+
+        now = time.perf_counter()
+        delta_time = now - self._last_frame if self._last_frame is not None else self.period
+        self._last_frame = now
+
+        # Sample input as late as possible so it reaches this frame's update
+        window.dispatch_events()
+        self._input_time = time.perf_counter()
+
+        self._run_ticks(delta_time)
+        if not window.closed:
+            window.draw(delta_time)
+
+    def _run_ticks(self, delta_time: float) -> None:
+        """Advance the simulation by whole fixed ticks for the elapsed time.
+
+        A tick runs once at least half a tick is owed (the remainder may go
+        negative), so a frame period that matches the tick period within
+        timer noise runs exactly one tick instead of alternating 0 and 2.
+
+        Args:
+            delta_time: Seconds since the previous frame
+        """
+        period = self.period
+        self._accumulator += min(delta_time, MAX_CATCH_UP)
+        while self._accumulator >= period / 2 and not self.window.closed:
+            self.window._dispatch_updates(period)
+            self._accumulator -= period
+            self.ticks += 1
+
+    def _on_present(self) -> None:
+        """Record the timing of a completed buffer swap."""
+        now = time.perf_counter()
+        if self._last_present is not None:
+            interval = now - self._last_present
+            self.intervals.append(interval)
+            if self._input_time is not None:
+                self.latencies.append(now - self._input_time + interval / 2)
+        self._last_present = now
+        self._input_time = None
+
+    def stats(self) -> dict[str, float]:
+        """Summarize frame delivery over the recorded history.
+
+        Returns:
+            Frame rate, mean interval, jitter (interval standard deviation),
+            99th percentile interval, late frames (over 1.5x the median
+            interval) and mean/95th percentile latency, times in milliseconds
+        """
+        if not self.intervals:
+            return {}
+
+        intervals = np.fromiter(self.intervals, dtype=np.float64) * 1000
+        median = float(np.median(intervals))
+        stats = {
+            "fps": 1000 / float(intervals.mean()),
+            "interval_ms": float(intervals.mean()),
+            "jitter_ms": float(intervals.std()),
+            "p99_interval_ms": float(np.percentile(intervals, 99)),
+            "late_frames": int(np.count_nonzero(intervals > median * 1.5)),
+        }
+        if self.latencies:
+            latencies = np.fromiter(self.latencies, dtype=np.float64) * 1000
+            stats["latency_ms"] = float(latencies.mean())
+            stats["p95_latency_ms"] = float(np.percentile(latencies, 95))
+        return stats
+
+    def report(self) -> str:
+        """Format the statistics as a one-line summary.
+
+        Returns:
+            Summary text, or an empty string if nothing was measured
+        """
+        stats = self.stats()
+        if not stats:
+            return ""
+
+        text = (
+            f"{self.mode}: {stats['fps']:.1f} fps, jitter {stats['jitter_ms']:.2f} ms, "
+            f"p99 interval {stats['p99_interval_ms']:.2f} ms, {stats['late_frames']} late"
+        )
+        if "latency_ms" in stats:
+            text += f", latency {stats['latency_ms']:.2f} ms (p95 {stats['p95_latency_ms']:.2f} ms)"
+        return text
+
+
+# Global frame pacer instance
+frame_pacer = FramePacer()
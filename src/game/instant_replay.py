@@ -0,0 +1,216 @@
+"""Instant replay re-rendered from a ring buffer of compact per-tick state."""
+import arcade
+import numpy as np
+from collections import deque
+from typing import Optional
+from game.settings import settings
+from game.paddle import Paddle
+from game.ball import Ball
+
+# Positions are stored as int16 fixed point with this many steps per pixel
+FIXED_POINT_SCALE = 8
+
+# Per-tick state: ball x, ball y, left paddle y, right paddle y (8 bytes)
+STATE_FIELDS = 4
+
+_INT16_MIN = np.iinfo(np.int16).min
+_INT16_MAX = np.iinfo(np.int16).max
+
+
+class ReplayBuffer:
+    """Fixed-size ring buffer of ball and paddle positions, one row per tick.
+
+    A tick is one fixed simulation step of the frame loop (``target_fps``
+    per second in every pacing mode), not a presented frame.
+    """
+
+    def __init__(self, seconds: Optional[float] = None, tick_rate: Optional[float] = None):
+        """Initialize replay buffer.
+
+        Args:
+            seconds: Seconds of play kept (defaults to settings.instant_replay_seconds)
+            tick_rate: Simulation ticks per second (defaults to settings.target_fps)
+        """
+        self.tick_rate = tick_rate or settings.target_fps
+        seconds = seconds or settings.instant_replay_seconds
+        self.capacity = max(1, int(seconds * self.tick_rate))
+        self.states = np.zeros((self.capacity, STATE_FIELDS), dtype=np.int16)
+        self.head = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        """Number of recorded ticks."""
+        return self.count
+
+    def record(self, ball_x: float, ball_y: float, left_y: float, right_y: float) -> None:
+        """Record one tick.
+
+        Args:
+            ball_x: Ball x position
+            ball_y: Ball y position
+            left_y: Left paddle y position
+            right_y: Right paddle y position
+        """
+        row = self.states[self.head]
+        for i, value in enumerate((ball_x, ball_y, left_y, right_y)):
+            row[i] = min(max(round(value * FIXED_POINT_SCALE), _INT16_MIN), _INT16_MAX)
+
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def snapshot(self) -> np.ndarray:
+        """Copy the recorded ticks in chronological order.
+
+        Returns:
+            Array of shape (ticks, STATE_FIELDS) in fixed point
+        """
+        if self.count < self.capacity:
+            return self.states[:self.count].copy()
+        return np.concatenate((self.states[self.head:], self.states[:self.head]))
+
+    def clear(self) -> None:
+        """Forget all recorded ticks."""
+        self.head = 0
+        self.count = 0
+
+
+class InstantReplay:
+    """Records play and replays the last goal in slow motion.
+
+    Nothing is captured from the screen: playback poses the game's own ball
+    and paddles from the recorded state for each draw and restores them
+    afterwards, so a replay needs no extra sprites or GPU memory. The ball
+    trail is rebuilt from the recorded ticks.
+    """
+
+    def __init__(self):
+        """Initialize instant replay."""
+        self.buffer = ReplayBuffer()
+        self.last_goal: Optional[np.ndarray] = None
+        self.speed = settings.instant_replay_speed
+        self.playing = False
+        self.position = 0.0  # Playback position in ticks
+        self._label: Optional[arcade.Text] = None
+
+    @property
+    def available(self) -> bool:
+        """Whether a goal has been recorded for replay."""
+        return self.last_goal is not None and len(self.last_goal) > 1
+
+    def record(self, ball: Ball, paddle_left: Paddle, paddle_right: Paddle) -> None:
+        """Record the positions after one update tick.
+
+        Args:
+            ball: Game ball
+            paddle_left: Left paddle
+            paddle_right: Right paddle
+        """
+        self.buffer.record(ball.center_x, ball.center_y, paddle_left.center_y, paddle_right.center_y)
+
+    def mark_goal(self) -> None:
+        """Keep the play leading up to a goal for replay."""
+        self.last_goal = self.buffer.snapshot()
+
+    def start(self) -> bool:
+        """Start replaying the last goal.
+
+        Returns:
+            True if a replay started
+        """
+        if not self.available:
+            return False
+
+        self.speed = settings.instant_replay_speed
+        self.position = 0.0
+        self.playing = True
+        return True
+
+    def stop(self) -> None:
+        """Stop the replay."""
+        self.playing = False
+
+    def reset(self) -> None:
+        """Forget recorded play for a new match."""
+        self.buffer.clear()
+        self.last_goal = None
+        self.playing = False
+
+    def tick(self) -> None:
+        """Advance playback by one simulation tick (``speed`` recorded ticks)."""
+        if not self.playing:
+            return
+
+        self.position += self.speed
+        if self.position >= len(self.last_goal) - 1:
+            self.playing = False
+
+    def _state_at(self, position: float) -> np.ndarray:
+        """Interpolate the recorded state between ticks.
+
+        Args:
+            position: Playback position in ticks
+
+        Returns:
+            Ball x, ball y, left paddle y, right paddle y in pixels
+        """
+        index = min(int(position), len(self.last_goal) - 2)
+        t = min(position - index, 1.0)
+        before = self.last_goal[index].astype(np.float32)
+        after = self.last_goal[index + 1].astype(np.float32)
+        return (before + (after - before) * t) / FIXED_POINT_SCALE
+
+    def draw(self, ball: Ball, paddle_left: Paddle, paddle_right: Paddle) -> None:
+        """Draw the current replay frame with the game's own objects.
+
+        Args:
+            ball: Game ball
+            paddle_left: Left paddle
+            paddle_right: Right paddle
+        """
+        ball_x, ball_y, left_y, right_y = self._state_at(self.position)
+
+        saved_ball = ball.position
+        saved_left = paddle_left.center_y
+        saved_right = paddle_right.center_y
+        saved_trail = ball.motion_trail.positions
+
+        # Trail from the recorded ticks leading up to this frame
+        trail = deque(maxlen=saved_trail.maxlen)
+        first = max(0, int(self.position) - trail.maxlen + 2)
+        for row in self.last_goal[first:int(self.position) + 1]:
+            trail.append((row[0] / FIXED_POINT_SCALE, row[1] / FIXED_POINT_SCALE))
+        trail.append((ball_x, ball_y))
+
+        ball.position = (ball_x, ball_y)
+        paddle_left.center_y = left_y
+        paddle_right.center_y = right_y
+        ball.motion_trail.positions = trail
+        try:
+            paddle_left.draw()
+            paddle_right.draw()
+            ball.draw()
+        finally:
+            ball.position = saved_ball
+            paddle_left.center_y = saved_left
+            paddle_right.center_y = saved_right
+            ball.motion_trail.positions = saved_trail
+
+        self._draw_label()
+
+    def _draw_label(self) -> None:
+        """Draw the replay banner."""
+        if self._label is None:
+            self._label = arcade.Text(
+                "",
+                settings.screen_width / 2,
+                60,
+                settings.synthwave_city_windows_cyan,
+                font_size=24,
+                anchor_x="center",
+                bold=True
+            )
+
+        text = "INSTANT REPLAY" if self.speed >= 1.0 else f"INSTANT REPLAY  x{self.speed:g}"
+        if self._label.text != text:
+            self._label.text = text
+        self._label.draw()
@@ -1,8 +1,98 @@
 """Generate retro 80s arcade-style background music."""
-import wave
-import struct
 import math
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterator
+import numpy as np
+from game.sound_generator import write_wav, to_pcm16
+
+
+def note_events(
+    pattern: list[tuple[str, float]],
+    beat_duration: float,
+    num_samples: int,
+    sample_rate: int
+) -> Iterator[tuple[int, int, str, float]]:
+    """Lay a looping note pattern out on the sample grid.
+
+    A note starts on the first sample at or after the end of the previous
+    one, so note boundaries fall exactly where the per-sample generator put
+    them.
+
+    Args:
+        pattern: (note, beats) pairs, repeated until the track ends
+        beat_duration: Seconds per beat
+        num_samples: Track length in samples
+        sample_rate: Sample rate in Hz
+
+    Yields:
+        Start sample, end sample (exclusive), note name and note duration in seconds
+    """
+    start = 0
+    index = 0
+    while start < num_samples:
+        note, beats = pattern[index]
+        note_duration = beats * beat_duration
+        boundary = start / sample_rate + note_duration
+
+        end = math.ceil(boundary * sample_rate)
+        while end > start + 1 and (end - 1) / sample_rate >= boundary:
+            end -= 1
+        while end / sample_rate < boundary:
+            end += 1
+
+        yield start, min(end, num_samples), note, note_duration
+        start = end
+        index = (index + 1) % len(pattern)
+
+
+@lru_cache(maxsize=64)
+def melody_envelope(length: int, note_duration: float, sample_rate: int) -> np.ndarray:
+    """ADSR envelope (Attack, Decay, Sustain, Release) for a melody note.
+
+    Args:
+        length: Note length in samples
+        note_duration: Nominal note duration in seconds
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        Envelope levels (cached; do not modify)
+    """
+    attack_time = 0.01
+    decay_time = 0.05
+    sustain_level = 0.7
+    release_time = 0.1
+
+    note_t = np.arange(length) / sample_rate
+    release_start = note_duration - release_time
+    envelope = np.select(
+        [note_t < attack_time, note_t < attack_time + decay_time, note_t < release_start],
+        [
+            note_t / attack_time,
+            1.0 - ((note_t - attack_time) / decay_time) * (1.0 - sustain_level),
+            sustain_level,
+        ],
+        sustain_level * (1.0 - (note_t - release_start) / release_time)
+    )
+    envelope.flags.writeable = False
+    return envelope
+
+
+@lru_cache(maxsize=64)
+def bass_envelope(length: int, note_duration: float, sample_rate: int) -> np.ndarray:
+    """Linear decay envelope for a bass note.
+
+    Args:
+        length: Note length in samples
+        note_duration: Nominal note duration in seconds
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        Envelope levels (cached; do not modify)
+    """
+    envelope = np.maximum(0.0, 1.0 - (np.arange(length) / sample_rate) / note_duration)
+    envelope.flags.writeable = False
+    return envelope
 
 
 def generate_arcade_music(
@@ -13,7 +103,9 @@ def generate_arcade_music(
 ) -> None:
     """Generate simple 80s arcade-style background music.
 
-    Creates a looping melodic pattern with a retro synthesizer sound.
+    Creates a looping melodic pattern with a retro synthesizer sound. Each
+    melody and bass note is rendered as one NumPy segment with a cached
+    envelope and summed into the track.
 
     Args:
         filename: Output WAV file path
@@ -68,81 +160,26 @@ def generate_arcade_music(
     beat_duration = 60.0 / tempo
 
     num_samples = int(sample_rate * duration)
+    t = np.arange(num_samples) / sample_rate
+
+    mix = np.zeros(num_samples)
+    for start, end, note, note_duration in note_events(melody, beat_duration, num_samples, sample_rate):
+        # Melody with some harmonic richness (square wave-ish); the phase runs
+        # on the track clock so each oscillator is continuous across notes
+        phase = 2 * math.pi * notes[note] * t[start:end]
+        tone = np.sin(phase)
+        tone += 0.3 * np.sin(2 * phase)  # Second harmonic
+        mix[start:end] += tone * melody_envelope(end - start, note_duration, sample_rate) * (volume * 0.5)
+
+    for start, end, note, note_duration in note_events(bass_pattern, beat_duration, num_samples, sample_rate):
+        # Bass (sine wave) with a linear decay over the note
+        tone = np.sin(2 * math.pi * bass_notes[note] * t[start:end])
+        mix[start:end] += tone * bass_envelope(end - start, note_duration, sample_rate) * (volume * 0.4)
+
+    # Clamp to prevent clipping
+    np.clip(mix, -1.0, 1.0, out=mix)
 
-    with wave.open(filename, 'w') as wav_file:
-        wav_file.setparams((1, 2, sample_rate, num_samples, 'NONE', 'not compressed'))
-
-        melody_index = 0
-        bass_index = 0
-        melody_time = 0
-        bass_time = 0
-        current_melody_duration = melody[0][1] * beat_duration
-        current_bass_duration = bass_pattern[0][1] * beat_duration
-
-        for i in range(num_samples):
-            t = i / sample_rate
-
-            # Update melody note if needed
-            if t >= melody_time + current_melody_duration:
-                melody_time = t
-                melody_index = (melody_index + 1) % len(melody)
-                current_melody_duration = melody[melody_index][1] * beat_duration
-
-            # Update bass note if needed
-            if t >= bass_time + current_bass_duration:
-                bass_time = t
-                bass_index = (bass_index + 1) % len(bass_pattern)
-                current_bass_duration = bass_pattern[bass_index][1] * beat_duration
-
-            # Get current notes
-            melody_note, _ = melody[melody_index]
-            bass_note, _ = bass_pattern[bass_index]
-
-            melody_freq = notes[melody_note]
-            bass_freq = bass_notes[bass_note]
-
-            # Time within current note
-            note_t = t - melody_time
-            bass_t = t - bass_time
-
-            # ADSR envelope for melody (Attack, Decay, Sustain, Release)
-            attack_time = 0.01
-            decay_time = 0.05
-            sustain_level = 0.7
-            release_time = 0.1
-
-            if note_t < attack_time:
-                envelope = note_t / attack_time
-            elif note_t < attack_time + decay_time:
-                envelope = 1.0 - ((note_t - attack_time) / decay_time) * (1.0 - sustain_level)
-            elif note_t < current_melody_duration - release_time:
-                envelope = sustain_level
-            else:
-                release_progress = (note_t - (current_melody_duration - release_time)) / release_time
-                envelope = sustain_level * (1.0 - release_progress)
-
-            # Simple envelope for bass
-            bass_envelope = max(0, 1.0 - (bass_t / current_bass_duration))
-
-            # Generate melody with some harmonic richness (square wave-ish)
-            melody_value = 0
-            melody_value += math.sin(2 * math.pi * melody_freq * t)
-            melody_value += 0.3 * math.sin(4 * math.pi * melody_freq * t)  # Second harmonic
-            melody_value *= envelope * volume * 0.5
-
-            # Generate bass (sine wave)
-            bass_value = math.sin(2 * math.pi * bass_freq * t) * bass_envelope * volume * 0.4
-
-            # Mix melody and bass
-            value = melody_value + bass_value
-
-            # Clamp to prevent clipping
-            value = max(-1.0, min(1.0, value))
-
-            # Convert to 16-bit integer
-            sample = int(value * 32767)
-            packed_value = struct.pack('h', sample)
-            wav_file.writeframes(packed_value)
+    write_wav(filename, to_pcm16(mix), sample_rate)
 
 
 def generate_background_music(output_dir: Path) -> None:
@@ -154,7 +191,6 @@ def generate_background_music(output_dir: Path) -> None:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     print("Generating retro arcade background music...")
-    print("  (This may take a moment...)")
 
     # Generate a 30-second loop
     generate_arcade_music(
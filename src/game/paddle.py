@@ -3,6 +3,7 @@ import arcade
 from typing import Literal
 from game.settings import settings
 from game.visual_effects import GlowEffect
+from game.profiler import profiler
 
 
 class Paddle(arcade.SpriteSolidColor):
@@ -87,12 +88,13 @@ class Paddle(arcade.SpriteSolidColor):
 
     def draw(self) -> None:
         """Draw the paddle with synthwave glow effect."""
-        GlowEffect.draw_rectangular_glow(
-            self.center_x,
-            self.center_y,
-            settings.paddle_width,
-            settings.paddle_height,
-            settings.synthwave_paddle_core,
-            settings.synthwave_paddle_glow,
-            intensity=1.2
-        )
+        with profiler.section("glow"):
+            GlowEffect.draw_rectangular_glow(
+                self.center_x,
+                self.center_y,
+                settings.paddle_width,
+                settings.paddle_height,
+                settings.synthwave_paddle_core,
+                settings.synthwave_paddle_glow,
+                intensity=1.2
+            )
@@ -0,0 +1,314 @@
+"""Pre-decoded PCM store: all sounds in one raw file, memory-mapped once."""
+import json
+import math
+import mmap
+import os
+import threading
+import wave
+import numpy as np
+from pathlib import Path
+from typing import Optional
+from game.audio_assets import AssetRegistry, asset_registry, SOUNDS_DIR
+from game.audio_mixer import MIXER_SAMPLE_RATE, MIXER_CHANNELS
+
+PCM_DIR = SOUNDS_DIR / "pcm"
+
+# Each output format has its own data and index file, so switching formats
+# never replaces a file that may still be mapped
+DATA_NAME = "sounds_{sample_rate}_{channels}.pcm"
+INDEX_NAME = "index_{sample_rate}_{channels}.json"
+
+# Stored format: native-endian int16 (the mixer's and the devices' format)
+SAMPLE_WIDTH = 2
+
+# Silence appended before resampling a one-shot sound so its end does not
+# ring into its start (the FFT treats the signal as periodic)
+RESAMPLE_PADDING = 0.02
+
+
+def resample(frames: np.ndarray, src_rate: int, dst_rate: int, loop: bool = False) -> np.ndarray:
+    """Band-limited resampling through the frequency domain.
+
+    Args:
+        frames: Float samples, shape (frames, channels)
+        src_rate: Input sample rate in Hz
+        dst_rate: Output sample rate in Hz
+        loop: Treat the sound as a seamless loop (keeps it periodic)
+
+    Returns:
+        Float samples at dst_rate, shape (round(frames * dst_rate / src_rate), channels)
+    """
+    if src_rate == dst_rate:
+        return frames
+
+    count = len(frames)
+    out_count = round(count * dst_rate / src_rate)
+    if loop:
+        padded, padded_out = count, out_count
+    else:
+        # Pad to a length that maps to a whole number of output samples
+        step = src_rate // math.gcd(src_rate, dst_rate)
+        padded = -(-(count + int(src_rate * RESAMPLE_PADDING)) // step) * step
+        padded_out = padded * dst_rate // src_rate
+
+    spectrum = np.fft.rfft(frames, n=padded, axis=0)
+    bins = min(len(spectrum), padded_out // 2 + 1)
+    resized = np.zeros((padded_out // 2 + 1, frames.shape[1]), dtype=spectrum.dtype)
+    resized[:bins] = spectrum[:bins]
+    if padded_out > padded and padded % 2 == 0:
+        resized[padded // 2] *= 0.5  # Split the old Nyquist bin between its two new bins
+
+    return np.fft.irfft(resized, n=padded_out, axis=0)[:out_count] * (padded_out / padded)
+
+
+def convert(
+    samples: np.ndarray,
+    src_rate: int,
+    src_channels: int,
+    dst_rate: int,
+    dst_channels: int,
+    loop: bool = False
+) -> np.ndarray:
+    """Convert interleaved int16 samples to another rate and channel count.
+
+    Mono is copied to every output channel and multi-channel audio is
+    averaged down to mono.
+
+    Args:
+        samples: Interleaved int16 samples
+        src_rate: Input sample rate in Hz
+        src_channels: Input channel count
+        dst_rate: Output sample rate in Hz
+        dst_channels: Output channel count
+        loop: Treat the sound as a seamless loop
+
+    Returns:
+        Interleaved int16 samples
+    """
+    frames = samples.reshape(-1, src_channels).astype(np.float64)
+    if dst_channels == 1 and src_channels > 1:
+        frames = frames.mean(axis=1, keepdims=True)
+    elif dst_channels != src_channels:
+        frames = frames[:, np.arange(dst_channels) % src_channels]
+
+    frames = resample(frames, src_rate, dst_rate, loop)
+    np.clip(np.round(frames), -32768, 32767, out=frames)
+    return frames.astype(np.int16).reshape(-1)
+
+
+class PCMStore:
+    """Raw int16 PCM for every generated sound, decoded once and mapped.
+
+    The first open decodes each WAV into one data file (in the output
+    format) with a small JSON index of offsets. Later opens, including
+    later runs, only read the index and mmap the data file; get() returns
+    read-only NumPy views into the mapping, so loading a sound copies
+    nothing. The store is rebuilt when a WAV's size or mtime changes.
+
+    Sounds are resampled to the output rate and channel count while the
+    store is built, so the mixer plays every sound in one format and
+    nothing is resampled per play. Each format is stored in its own files:
+    changing the format builds (or maps) that format's files and leaves the
+    old mapping alive for any views still in use.
+    """
+
+    def __init__(
+        self,
+        directory: Path = PCM_DIR,
+        registry: AssetRegistry = asset_registry,
+        sample_rate: int = MIXER_SAMPLE_RATE,
+        channels: int = MIXER_CHANNELS
+    ):
+        """Initialize PCM store.
+
+        Args:
+            directory: Directory for the data and index files
+            registry: Generated assets to store
+            sample_rate: Stored sample rate in Hz
+            channels: Stored channel count
+        """
+        self.directory = directory
+        self.registry = registry
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.index: dict[str, dict] = {}
+        self.builds = 0
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._lock = threading.Lock()
+
+    def configure(self, sample_rate: int, channels: int) -> None:
+        """Set the output format; its store is mapped (or built) on next open.
+
+        Args:
+            sample_rate: Output sample rate in Hz
+            channels: Output channel count
+        """
+        if (sample_rate, channels) == (self.sample_rate, self.channels):
+            return
+
+        self.close()
+        self.sample_rate = sample_rate
+        self.channels = channels
+
+    def _data_path(self) -> Path:
+        """Data file of the current format."""
+        return self.directory / DATA_NAME.format(sample_rate=self.sample_rate, channels=self.channels)
+
+    def _index_path(self) -> Path:
+        """Index file of the current format."""
+        return self.directory / INDEX_NAME.format(sample_rate=self.sample_rate, channels=self.channels)
+
+    def _format(self) -> dict:
+        """Stored format, compared on open to detect a changed output format."""
+        return {"sample_rate": self.sample_rate, "channels": self.channels, "sample_width": SAMPLE_WIDTH}
+
+    def _stamp(self, path: Path) -> list[int]:
+        """Size and modification time identifying a WAV file's version."""
+        stat = path.stat()
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def _read_index(self) -> Optional[dict]:
+        """Read the index if it matches the current format and WAV files.
+
+        Returns:
+            Sound entries, or None if the store must be rebuilt
+        """
+        try:
+            with open(self._index_path(), 'r') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if index.get("format") != self._format() or not self._data_path().exists():
+            return None
+
+        sounds = index.get("sounds", {})
+        for name in self.registry.assets:
+            path = self.registry.wait(name)
+            entry = sounds.get(name)
+            if path.exists() != (entry is not None):
+                return None
+            if entry is not None and entry["source"] != self._stamp(path):
+                return None
+        return sounds
+
+    def _decode(self, name: str, path: Path) -> Optional[np.ndarray]:
+        """Decode a WAV file and convert it to the stored format.
+
+        Args:
+            name: Sound name
+            path: WAV file
+
+        Returns:
+            int16 samples, or None if the file cannot be stored
+        """
+        try:
+            with wave.open(str(path), 'rb') as wf:
+                params = (wf.getframerate(), wf.getnchannels(), wf.getsampwidth())
+                frames = wf.readframes(wf.getnframes())
+        except Exception as e:
+            print(f"[AUDIO] Warning: Could not load {path.name}: {e}")
+            return None
+
+        rate, channels, width = params
+        if width != SAMPLE_WIDTH:
+            print(f"[AUDIO] Warning: {path.name} is not 16-bit; skipping {name}")
+            return None
+
+        samples = np.frombuffer(frames, dtype='<i2').astype(np.int16)
+        if (rate, channels) != (self.sample_rate, self.channels):
+            loop = self.registry.assets[name].loop
+            samples = convert(samples, rate, channels, self.sample_rate, self.channels, loop)
+        return samples
+
+    def build(self) -> None:
+        """Decode every WAV into the data file and write the index."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        sounds = {}
+        offset = 0
+        data_path = self._data_path()
+        temp_data = data_path.with_name(data_path.name + ".tmp")
+
+        with open(temp_data, 'wb') as f:
+            for name in self.registry.assets:
+                path = self.registry.wait(name)
+                if not path.exists():
+                    print(f"[AUDIO] Warning: Sound file not found: {path}")
+                    continue
+
+                samples = self._decode(name, path)
+                if samples is None:
+                    continue
+
+                f.write(samples.tobytes())
+                sounds[name] = {
+                    "offset": offset,
+                    "frames": len(samples) // self.channels,
+                    "source": self._stamp(path),
+                }
+                offset += samples.nbytes
+
+        index_path = self._index_path()
+        temp_index = index_path.with_name(index_path.name + ".tmp")
+        with open(temp_index, 'w') as f:
+            json.dump({"format": self._format(), "sounds": sounds}, f, indent=2)
+        os.replace(temp_data, data_path)
+        os.replace(temp_index, index_path)
+
+        self.builds += 1
+        print(f"[AUDIO] Built PCM store: {len(sounds)} sounds, {offset} bytes")
+
+    def open(self) -> None:
+        """Map the store, building it first if missing or outdated."""
+        with self._lock:
+            if self._file is not None:
+                return
+
+            sounds = self._read_index()
+            if sounds is None:
+                self.build()
+                sounds = self._read_index() or {}
+
+            self.index = sounds
+            self._file = open(self._data_path(), 'rb')
+            if os.fstat(self._file.fileno()).st_size:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def get(self, name: str) -> Optional[np.ndarray]:
+        """Get a sound's samples without copying.
+
+        Args:
+            name: Sound name
+
+        Returns:
+            Read-only int16 view into the mapped store, or None if unavailable
+        """
+        self.open()
+        entry = self.index.get(name)
+        if entry is None or self._mmap is None:
+            return None
+        return np.frombuffer(
+            self._mmap,
+            dtype=np.int16,
+            count=entry["frames"] * self.channels,
+            offset=entry["offset"]
+        )
+
+    def close(self) -> None:
+        """Unmap the store (views returned by get() must no longer be used)."""
+        with self._lock:
+            if self._mmap is not None:
+                try:
+                    self._mmap.close()
+                except BufferError:
+                    pass  # Views are still alive; the mapping goes when they do
+                self._mmap = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self.index = {}
+
+
+# Global PCM store shared by all audio managers
+pcm_store = PCMStore()
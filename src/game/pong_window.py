@@ -1,5 +1,11 @@
 """Main Pong game window and logic."""
 import arcade
+import math
+import random
+import string
+import time
+from pathlib import Path
+from pyglet.graphics import Batch
 from typing import Literal, Optional
 from game.settings import settings
 from game.paddle import Paddle
@@ -7,7 +13,16 @@ from game.ball import Ball
 from game.ai_controller import AIController
 from game.audio_manager_pyaudio import PyAudioManager as AudioManager
 from game.ui.pause_menu import PauseMenu
-from game.background_renderer import BackgroundRenderer
+from game.background_renderer import BackgroundRenderer, background_cache
+from game.arena_renderer import ArenaRenderer
+from game.visual_effects import ParticleEffect
+from game.profiler import profiler, ProfilerOverlay
+from game.quality import quality
+from game.frame_pacing import frame_pacer
+from game.render_target import render_target
+from game.capture import InputLog
+from game.instant_replay import InstantReplay
+from game.view_registry import view_registry
 
 
 class PongGameView(arcade.View):
@@ -30,6 +45,10 @@ class PongGameView(arcade.View):
         self.audio_manager: Optional[AudioManager] = None
         self.pause_menu: Optional[PauseMenu] = None
         self.background_renderer: Optional[BackgroundRenderer] = None
+        self.particles: Optional[ParticleEffect] = None
+        self.instant_replay: Optional[InstantReplay] = None
+        self.arena_renderer = ArenaRenderer()
+        self.profiler_overlay = ProfilerOverlay(profiler)
 
         # Game state
         self.score_left = 0
@@ -37,12 +56,38 @@ class PongGameView(arcade.View):
         self.paused = False
         self.game_over = False
         self.winner = ""
+        self._launch_delay = 0.0  # Seconds until the ball is relaunched after a point
+
+        # Retained text (created in setup)
+        self.hud_batch: Optional[Batch] = None
+        self.game_over_batch: Optional[Batch] = None
+        self.score_texts: list[arcade.Text] = []
+        self.game_over_texts: list[arcade.Text] = []
+        self.winner_text: Optional[arcade.Text] = None
+        self.final_score_text: Optional[arcade.Text] = None
+        self._displayed_scores: Optional[tuple[int, int]] = None
+
+        # Frame timing for the adaptive quality governor
+        self._update_time = 0.0
 
         # Input state
         self.keys_pressed = set()
 
+        # Optional input recording for replays (see game.capture.InputLog)
+        self.input_log: Optional[InputLog] = None
+
     def setup(self) -> None:
-        """Set up the game."""
+        """Set up a new match.
+
+        Game objects are created the first time; later calls (restarting
+        after game over or returning from the menu) only reset them.
+        """
+        if self.ball is None:
+            self._create_game_objects()
+        self.reset()
+
+    def _create_game_objects(self) -> None:
+        """Create paddles, ball, AI, menus and effects."""
         # Create paddles
         paddle_margin = 50
         center_y = settings.screen_height / 2
@@ -64,57 +109,122 @@ class PongGameView(arcade.View):
         if self.game_mode == "single":
             self.ai_controller = AIController(self.paddle_right)
 
-        # Create audio manager
-        self.audio_manager = AudioManager()
+        # Audio manager is shared by every game view
+        self.audio_manager = view_registry.audio_manager
 
         # Create pause menu
         self.pause_menu = PauseMenu()
         self.pause_menu.on_resume = self._resume_game
         self.pause_menu.on_quit = self._quit_to_menu
 
-        # Create background renderer
-        self.background_renderer = BackgroundRenderer(
+        # Shared synthwave background
+        self.background_renderer = background_cache.get(
             settings.screen_width,
             settings.screen_height
         )
 
+        # Create impact particle pool
+        self.particles = ParticleEffect(capacity=settings.particle_capacity)
+
+        # Per-tick state recording for instant replays of goals
+        self.instant_replay = InstantReplay()
+
+        # Create retained score and game over text
+        self._create_text()
+
+    def reset(self) -> None:
+        """Reset game objects and state for a new match."""
+        # Start recording a new match, seeding randomness so it can be replayed
+        if settings.input_log_dir:
+            self._save_input_log()
+            self.input_log = InputLog(self.game_mode)
+            random.seed(self.input_log.seed)
+
+        center_y = settings.screen_height / 2
+        self.paddle_left.reset_position(center_y)
+        self.paddle_right.reset_position(center_y)
+        self.ball.reset(settings.screen_width / 2, center_y)
+        if self.ai_controller:
+            self.ai_controller.reset()
+        self.particles.clear()
+        self.instant_replay.reset()
+
         # Reset game state
         self.score_left = 0
         self.score_right = 0
+        self.paused = False
         self.game_over = False
         self.winner = ""
+        self._launch_delay = 0.0
+        self._displayed_scores = None
+        self._update_time = 0.0
+        self.keys_pressed.clear()
+        self.pause_menu.hide()
 
         # Start the ball and background music
+        self.audio_manager.sync_enabled()
         self.audio_manager.play_game_start()
         self.audio_manager.play_background_music()
         self.ball.launch()
 
     def on_draw(self) -> None:
         """Draw the game."""
-        self.clear()
+        frame_start = time.perf_counter()
+
+        with render_target.capture():
+            self._draw_frame()
 
+        # Profiler frame ends after the scaled image is presented
+        profiler.end_frame()
+
+        # Let the quality governor react to this frame's cost
+        work_time = time.perf_counter() - frame_start + self._update_time
+        quality.record_frame(work_time, frame_pacer.frame_budget)
+        self._update_time = 0.0
+
+    def _draw_frame(self) -> None:
+        """Draw the background, game objects and overlays in game coordinates."""
         # Draw synthwave background
         self.background_renderer.draw()
 
-        if not self.game_over:
-            # Draw center line
-            self._draw_center_line()
+        if self.instant_replay.playing:
+            # Re-render the last goal from recorded state
+            with profiler.section("arena"):
+                self.arena_renderer.draw(settings.screen_width, settings.screen_height)
+            self.instant_replay.draw(self.ball, self.paddle_left, self.paddle_right)
+            with profiler.section("text"):
+                self._draw_scores()
+
+        elif not self.game_over:
+            # Draw center line and other arena markings
+            with profiler.section("arena"):
+                self.arena_renderer.draw(settings.screen_width, settings.screen_height)
 
             # Draw game objects
             self.paddle_left.draw()
             self.paddle_right.draw()
+            with profiler.section("particles"):
+                self.particles.draw()
             self.ball.draw()
 
             # Draw scores
-            self._draw_scores()
+            with profiler.section("text"):
+                self._draw_scores()
 
             # Draw pause menu if paused
             if self.paused:
-                self.pause_menu.draw()
+                with profiler.section("ui"):
+                    self.pause_menu.draw()
 
         else:
             # Draw game over screen
-            self._draw_game_over()
+            with profiler.section("ui"):
+                self._draw_game_over()
+
+        # Draw profiler overlay on top of everything
+        if profiler.enabled:
+            with profiler.section("overlay"):
+                self.profiler_overlay.draw()
 
     def on_update(self, delta_time: float) -> None:
         """Update game state.
@@ -122,11 +232,41 @@ class PongGameView(arcade.View):
         Args:
             delta_time: Time since last update
         """
+        if self.input_log:
+            self.input_log.advance(delta_time)
+
+        # The match stays frozen while an instant replay plays
+        if self.instant_replay.playing:
+            self.instant_replay.tick()
+            return
+
         if self.paused or self.game_over:
             return
 
+        update_start = time.perf_counter()
+        with profiler.section("update"):
+            self._update_game(delta_time)
+        self._update_time += time.perf_counter() - update_start
+
+    def _update_game(self, delta_time: float) -> None:
+        """Advance ball, paddles, AI and collisions by one tick.
+
+        Args:
+            delta_time: Time since last update
+        """
+        # Relaunch the ball once the post-point delay has elapsed
+        if self._launch_delay > 0:
+            self._launch_delay -= delta_time
+            if self._launch_delay <= 0:
+                self.ball.launch()
+
         # Update ball
         self.ball.update()
+        self.particles.update(delta_time)
+
+        # Floor grid scrolls with the ball speed
+        ball_speed = math.hypot(self.ball.velocity_x, self.ball.velocity_y)
+        self.background_renderer.update(delta_time, ball_speed)
 
         # Update paddles
         self._update_player_input()
@@ -139,6 +279,7 @@ class PongGameView(arcade.View):
 
         # Check collisions
         self._check_paddle_collisions()
+        self.instant_replay.record(self.ball, self.paddle_left, self.paddle_right)
         self._check_scoring()
 
     def on_key_press(self, key: int, modifiers: int) -> None:
@@ -148,15 +289,32 @@ class PongGameView(arcade.View):
             key: Key that was pressed
             modifiers: Modifier keys held
         """
+        if self.input_log:
+            self.input_log.record_key("press", key)
+
         # Check if pause menu handles the key
         if self.pause_menu.handle_key_press(key):
             return
 
+        # Skip a running instant replay
+        if self.instant_replay.playing and key in (arcade.key.R, arcade.key.ESCAPE, arcade.key.ENTER):
+            self.instant_replay.stop()
+            return
+
+        # Replay the last goal
+        if key == arcade.key.R and not self.paused and self.instant_replay.start():
+            return
+
         # Toggle pause
         if key == arcade.key.ESCAPE:
             self._toggle_pause()
             return
 
+        # Toggle profiler overlay
+        if key == arcade.key.F3:
+            profiler.toggle()
+            return
+
         # Toggle fullscreen
         if key == arcade.key.F11:
             settings.fullscreen = not settings.fullscreen
@@ -183,6 +341,9 @@ class PongGameView(arcade.View):
             key: Key that was released
             modifiers: Modifier keys held
         """
+        if self.input_log:
+            self.input_log.record_key("release", key)
+
         self.keys_pressed.discard(key)
 
     def on_mouse_motion(self, x: float, y: float, dx: float, dy: float) -> None:
@@ -194,7 +355,7 @@ class PongGameView(arcade.View):
             dx: Change in x
             dy: Change in y
         """
-        self.pause_menu.handle_mouse_motion(x, y)
+        self.handle_mouse("move", *render_target.window_to_logical(x, y))
 
     def on_mouse_press(self, x: float, y: float, button: int, modifiers: int) -> None:
         """Handle mouse clicks.
@@ -205,12 +366,43 @@ class PongGameView(arcade.View):
             button: Mouse button pressed
             modifiers: Modifier keys held
         """
-        self.pause_menu.handle_mouse_press(x, y)
+        self.handle_mouse("click", *render_target.window_to_logical(x, y))
+
+    def handle_mouse(self, action: Literal["move", "click"], x: float, y: float) -> None:
+        """Pass a mouse event to the pause menu, recording it if it is open.
+
+        Args:
+            action: "move" or "click"
+            x: Logical x position
+            y: Logical y position
+        """
+        if not self.pause_menu.visible:
+            return
+
+        if self.input_log:
+            self.input_log.record_mouse(action, x, y)
+        if action == "move":
+            self.pause_menu.handle_mouse_motion(x, y)
+        else:
+            self.pause_menu.handle_mouse_press(x, y)
 
     def on_hide_view(self) -> None:
         """Called when this view is hidden (e.g., switching to menu)."""
+        self._save_input_log()
+
+        # The audio manager is shared, so only stop the music here
         if self.audio_manager:
-            self.audio_manager.cleanup()
+            self.audio_manager.stop_background_music()
+
+    def _save_input_log(self) -> None:
+        """Write the recorded input log of the current match, if any."""
+        if not self.input_log or not settings.input_log_dir:
+            return
+
+        path = Path(settings.input_log_dir) / f"match_{time.strftime('%Y%m%d_%H%M%S')}_{self.input_log.seed}.json"
+        self.input_log.save(path)
+        print(f"[CAPTURE] Input log saved to {path}")
+        self.input_log = None
 
     def _update_player_input(self) -> None:
         """Update paddle movement based on input using configurable controls."""
@@ -256,6 +448,7 @@ class PongGameView(arcade.View):
                 settings.paddle_height
             )
             self.audio_manager.play_bounce()
+            self._emit_paddle_hit_particles()
 
         # Right paddle collision
         if (
@@ -267,6 +460,7 @@ class PongGameView(arcade.View):
                 settings.paddle_height
             )
             self.audio_manager.play_bounce()
+            self._emit_paddle_hit_particles()
 
         # Wall bounces
         if (
@@ -274,17 +468,46 @@ class PongGameView(arcade.View):
             self.ball.center_y >= self.ball.max_y
         ):
             self.audio_manager.play_wall_bounce()
+            self._emit_wall_hit_particles()
+
+    def _emit_paddle_hit_particles(self) -> None:
+        """Emit a particle burst where the ball hit a paddle."""
+        if not settings.particles_enabled:
+            return
+
+        self.particles.emit_burst(
+            self.ball.center_x,
+            self.ball.center_y,
+            settings.synthwave_paddle_glow,
+            count=int(settings.particle_burst_count * quality.particle_fraction),
+            speed=4.0
+        )
+
+    def _emit_wall_hit_particles(self) -> None:
+        """Emit a smaller particle burst where the ball hit a wall."""
+        if not settings.particles_enabled:
+            return
+
+        self.particles.emit_burst(
+            self.ball.center_x,
+            self.ball.center_y,
+            settings.synthwave_ball_glow,
+            count=int(settings.particle_burst_count * quality.particle_fraction) // 2,
+            size=2.0
+        )
 
     def _check_scoring(self) -> None:
         """Check if anyone scored."""
         if self.ball.is_out_of_bounds_left():
             self.score_right += 1
+            self.instant_replay.mark_goal()
             self.audio_manager.play_score()
             self._reset_ball()
             self._check_win_condition()
 
         elif self.ball.is_out_of_bounds_right():
             self.score_left += 1
+            self.instant_replay.mark_goal()
             self.audio_manager.play_score()
             self._reset_ball()
             self._check_win_condition()
@@ -296,13 +519,9 @@ class PongGameView(arcade.View):
             settings.screen_height / 2
         )
 
-        # Small delay before launching
-        arcade.schedule(self._delayed_ball_launch, 0.5)
-
-    def _delayed_ball_launch(self, delta_time: float) -> None:
-        """Launch ball after delay."""
-        self.ball.launch()
-        arcade.unschedule(self._delayed_ball_launch)
+        # Small delay before launching, counted in update ticks so
+        # recorded matches replay identically
+        self._launch_delay = 0.5
 
     def _check_win_condition(self) -> None:
         """Check if someone won the game."""
@@ -337,156 +556,116 @@ class PongGameView(arcade.View):
 
     def _quit_to_menu(self) -> None:
         """Return to main menu."""
-        from game.ui.main_menu import MainMenuView
-
-        menu = MainMenuView()
-        menu.setup()
-
-        # Set up menu callbacks
-        menu.on_single_player = lambda: self._start_game("single")
-        menu.on_two_player = lambda: self._start_game("two_player")
-        menu.on_settings = lambda: self._show_settings(menu)
-        menu.on_quit = self.window.close
+        view_registry.show_main_menu()
 
-        self.window.show_view(menu)
+    def _create_text(self) -> None:
+        """Create retained text objects for the scores and game over screen.
 
-    def _start_game(self, mode: Literal["single", "two_player"]) -> None:
-        """Start a new game."""
-        game_view = PongGameView(mode)
-        game_view.setup()
-        self.window.show_view(game_view)
-
-    def _show_settings(self, return_view: arcade.View) -> None:
-        """Show settings menu."""
-        from game.ui.settings_menu import SettingsMenuView
-
-        settings_view = SettingsMenuView()
-        settings_view.on_back = lambda: self.window.show_view(return_view)
-        settings_view.setup()
-        self.window.show_view(settings_view)
-
-    def _draw_center_line(self) -> None:
-        """Draw dashed center line."""
-        center_x = settings.screen_width / 2
-        dash_height = 20
-        gap_height = 15
-        y = 0
-
-        while y < settings.screen_height:
-            arcade.draw.draw_line(
-                center_x, y,
-                center_x, y + dash_height,
-                settings.center_line_color,
-                line_width=2
-            )
-            y += dash_height + gap_height
-
-    def _draw_scores(self) -> None:
-        """Draw player scores with neon glow."""
+        Text layout only happens when a label's string changes, and each
+        group of labels is drawn with a single batch draw.
+        """
         score_color = settings.synthwave_city_windows_cyan
         glow_color = settings.synthwave_grid_glow
 
-        # Left score with glow
-        for offset, alpha in [(4, 40), (2, 80)]:
-            arcade.draw_text(
-                str(self.score_left),
-                settings.screen_width / 4 + offset,
-                settings.screen_height - 80 - offset,
-                (*glow_color, alpha),
-                font_size=48,
-                anchor_x="center",
-                bold=True
-            )
-        arcade.draw_text(
-            str(self.score_left),
-            settings.screen_width / 4,
-            settings.screen_height - 80,
-            score_color,
-            font_size=48,
-            anchor_x="center",
-            bold=True
-        )
-
-        # Right score with glow
-        for offset, alpha in [(4, 40), (2, 80)]:
-            arcade.draw_text(
-                str(self.score_right),
-                settings.screen_width * 3 / 4 + offset,
-                settings.screen_height - 80 - offset,
-                (*glow_color, alpha),
-                font_size=48,
-                anchor_x="center",
-                bold=True
-            )
-        arcade.draw_text(
-            str(self.score_right),
-            settings.screen_width * 3 / 4,
-            settings.screen_height - 80,
-            score_color,
-            font_size=48,
-            anchor_x="center",
-            bold=True
-        )
-
-    def _draw_game_over(self) -> None:
-        """Draw game over screen."""
-        # Semi-transparent overlay
-        rect = arcade.types.XYWH(
-            settings.screen_width / 2,
-            settings.screen_height / 2,
-            settings.screen_width,
-            settings.screen_height
-        )
-        arcade.draw.draw_rect_filled(rect, (0, 0, 0, 200))
-
-        # Game over text
-        arcade.draw_text(
+        # Scores with neon glow (glow passes first so the score draws on top)
+        self.hud_batch = Batch()
+        self.score_texts = []
+        for score_x in (settings.screen_width / 4, settings.screen_width * 3 / 4):
+            for offset, alpha in [(4, 40), (2, 80), (0, 255)]:
+                color = score_color if offset == 0 else (*glow_color, alpha)
+                self.score_texts.append(arcade.Text(
+                    "0",
+                    score_x + offset,
+                    settings.screen_height - 80 - offset,
+                    color,
+                    font_size=48,
+                    anchor_x="center",
+                    bold=True,
+                    batch=self.hud_batch
+                ))
+        self._displayed_scores = None
+
+        # Preload the score digits into the glyph atlas so a score change
+        # never has to rasterize new glyphs mid-game
+        self.score_texts[0].label.document.get_font().get_glyphs(string.digits)
+
+        # Game over screen
+        center_x = settings.screen_width / 2
+        center_y = settings.screen_height / 2
+        self.game_over_batch = Batch()
+        title_text = arcade.Text(
             "GAME OVER",
-            settings.screen_width / 2,
-            settings.screen_height / 2 + 100,
+            center_x, center_y + 100,
             (0, 255, 255),
             font_size=60,
             anchor_x="center",
-            bold=True
+            bold=True,
+            batch=self.game_over_batch
         )
-
-        # Winner text
-        arcade.draw_text(
-            f"{self.winner} WINS!",
-            settings.screen_width / 2,
-            settings.screen_height / 2 + 30,
+        self.winner_text = arcade.Text(
+            "",
+            center_x, center_y + 30,
             (255, 255, 100),
             font_size=40,
             anchor_x="center",
-            bold=True
+            bold=True,
+            batch=self.game_over_batch
         )
-
-        # Final scores
-        arcade.draw_text(
-            f"{self.score_left} - {self.score_right}",
-            settings.screen_width / 2,
-            settings.screen_height / 2 - 40,
+        self.final_score_text = arcade.Text(
+            "",
+            center_x, center_y - 40,
             settings.score_color,
             font_size=48,
             anchor_x="center",
-            bold=True
+            bold=True,
+            batch=self.game_over_batch
         )
-
-        # Instructions
-        arcade.draw_text(
+        restart_text = arcade.Text(
             "Press ENTER to play again",
-            settings.screen_width / 2,
-            settings.screen_height / 2 - 120,
+            center_x, center_y - 120,
             (150, 150, 200),
             font_size=20,
-            anchor_x="center"
+            anchor_x="center",
+            batch=self.game_over_batch
         )
-
-        arcade.draw_text(
+        menu_text = arcade.Text(
             "Press ESC for main menu",
-            settings.screen_width / 2,
-            settings.screen_height / 2 - 150,
+            center_x, center_y - 150,
             (150, 150, 200),
             font_size=20,
-            anchor_x="center"
+            anchor_x="center",
+            batch=self.game_over_batch
+        )
+
+        # Keep every label referenced so it stays in its batch
+        self.game_over_texts = [
+            title_text, self.winner_text, self.final_score_text, restart_text, menu_text
+        ]
+
+    def _draw_scores(self) -> None:
+        """Draw player scores with neon glow."""
+        scores = (self.score_left, self.score_right)
+        if scores != self._displayed_scores:
+            left, right = str(self.score_left), str(self.score_right)
+            for i, text in enumerate(self.score_texts):
+                text.text = left if i < 3 else right
+            self._displayed_scores = scores
+
+        self.hud_batch.draw()
+
+    def _draw_game_over(self) -> None:
+        """Draw game over screen."""
+        # Semi-transparent overlay
+        rect = arcade.types.XYWH(
+            settings.screen_width / 2,
+            settings.screen_height / 2,
+            settings.screen_width,
+            settings.screen_height
         )
+        arcade.draw.draw_rect_filled(rect, (0, 0, 0, 200))
+
+        # Winner and final scores (only re-laid out when they change)
+        self.winner_text.text = f"{self.winner} WINS!"
+        self.final_score_text.text = f"{self.score_left} - {self.score_right}"
+
+        self.game_over_batch.draw()
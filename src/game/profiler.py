@@ -0,0 +1,316 @@
+"""Per-frame CPU profiler with draw-call counters and an in-game overlay."""
+import arcade
+import gc
+import time
+import numpy as np
+from collections import deque
+from contextlib import nullcontext
+from typing import Deque, Optional
+from arcade.gl.backends.opengl.vertex_array import OpenGLVertexArray
+from pyglet.graphics import Batch
+from game.settings import settings
+from game.quality import quality
+from game.frame_pacing import frame_pacer
+
+# Shared no-op context returned by sections while profiling is disabled
+_NULL_SECTION = nullcontext()
+
+
+class _Section:
+    """Context manager timing one named section of the frame."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> "_Section":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        elapsed = time.perf_counter() - self.start
+        sections = self.profiler.sections
+        sections[self.name] = sections.get(self.name, 0.0) + elapsed
+
+
+class FrameProfiler:
+    """Collects per-frame section timings, draw calls, vertices and GC pauses.
+
+    Profiling is off by default. While disabled, ``section()`` returns a
+    shared no-op context manager so instrumented code costs almost nothing.
+    """
+
+    def __init__(self, history: int = 240):
+        """Initialize profiler.
+
+        Args:
+            history: Number of frames kept for the frame time graph
+        """
+        self.enabled = False
+        self.frame_times: Deque[float] = deque(maxlen=history)
+
+        # Current frame accumulators
+        self.sections: dict[str, float] = {}
+        self.draw_calls = 0
+        self.vertices = 0
+        self.gc_pause = 0.0
+        self.gc_collections = 0
+
+        # Results of the last completed frame
+        self.last_sections: dict[str, float] = {}
+        self.last_draw_calls = 0
+        self.last_vertices = 0
+        self.last_gc_pause = 0.0
+        self.last_gc_collections = 0
+
+        self._frame_start: Optional[float] = None
+        self._gc_start = 0.0
+        self._original_render = None
+
+    def section(self, name: str):
+        """Time a named section of the current frame.
+
+        Args:
+            name: Section name (e.g. "update", "bg.grid")
+
+        Returns:
+            Context manager timing the section
+        """
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def toggle(self) -> bool:
+        """Toggle profiling on/off.
+
+        Returns:
+            New profiling state
+        """
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+        return self.enabled
+
+    def enable(self) -> None:
+        """Start profiling and install draw-call and GC hooks."""
+        if self.enabled:
+            return
+
+        self.enabled = True
+        self.frame_times.clear()
+        self._reset_frame()
+        self._frame_start = None
+
+        # Count every arcade draw call by wrapping the vertex array render
+        self._original_render = OpenGLVertexArray.render
+        original_render = self._original_render
+        profiler = self
+
+        def counting_render(vao, mode, first=0, vertices=0, instances=1):
+            profiler.draw_calls += 1
+            profiler.vertices += vertices * instances
+            original_render(vao, mode, first, vertices, instances)
+
+        OpenGLVertexArray.render = counting_render
+        gc.callbacks.append(self._on_gc)
+
+    def disable(self) -> None:
+        """Stop profiling and remove hooks."""
+        if not self.enabled:
+            return
+
+        self.enabled = False
+        if self._original_render is not None:
+            OpenGLVertexArray.render = self._original_render
+            self._original_render = None
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+
+    def _on_gc(self, phase: str, info: dict) -> None:
+        """Measure garbage collector pauses.
+
+        Args:
+            phase: "start" or "stop"
+            info: Collection details from the gc module
+        """
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        else:
+            self.gc_pause += time.perf_counter() - self._gc_start
+            self.gc_collections += 1
+
+    def _reset_frame(self) -> None:
+        """Clear the current frame accumulators."""
+        self.sections = {}
+        self.draw_calls = 0
+        self.vertices = 0
+        self.gc_pause = 0.0
+        self.gc_collections = 0
+
+    def end_frame(self) -> None:
+        """Finish the current frame and record its results.
+
+        Frame time is measured between consecutive ``end_frame`` calls.
+        """
+        if not self.enabled:
+            return
+
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self.frame_times.append(now - self._frame_start)
+        self._frame_start = now
+
+        self.last_sections = self.sections
+        self.last_draw_calls = self.draw_calls
+        self.last_vertices = self.vertices
+        self.last_gc_pause = self.gc_pause
+        self.last_gc_collections = self.gc_collections
+        self._reset_frame()
+
+    def percentiles(self) -> tuple[float, float, float]:
+        """Get rolling frame time percentiles.
+
+        Returns:
+            (p50, p95, p99) frame times in seconds
+        """
+        if not self.frame_times:
+            return (0.0, 0.0, 0.0)
+        p50, p95, p99 = np.percentile(self.frame_times, [50, 95, 99])
+        return (float(p50), float(p95), float(p99))
+
+
+class ProfilerOverlay:
+    """Draws profiler results and a frame time graph on top of the game."""
+
+    def __init__(self, profiler: "FrameProfiler", x: float = 10, y: float = 10):
+        """Initialize overlay.
+
+        Args:
+            profiler: Profiler to display
+            x: Left edge of the overlay
+            y: Bottom edge of the overlay
+        """
+        self.profiler = profiler
+        self.x = x
+        self.y = y
+        self.width = 330
+        self.graph_height = 80
+        self.line_height = 16
+        self.max_lines = 20
+        self.refresh_interval = 10  # Frames between text refreshes
+
+        self.batch: Optional[Batch] = None
+        self.lines: list[arcade.Text] = []
+        self._frames_since_refresh = 0
+
+    def _create_text(self) -> None:
+        """Create the retained text lines."""
+        self.batch = Batch()
+        top = self.y + self.graph_height + 10 + self.max_lines * self.line_height
+        self.lines = [
+            arcade.Text(
+                "",
+                self.x + 6,
+                top - (i + 1) * self.line_height,
+                (220, 220, 255),
+                font_size=10,
+                font_name=("Courier New", "Courier", "monospace"),
+                batch=self.batch
+            )
+            for i in range(self.max_lines)
+        ]
+
+    def _format_lines(self) -> list[str]:
+        """Build the overlay text from the last frame's results.
+
+        Returns:
+            Text for each overlay line
+        """
+        p = self.profiler
+        p50, p95, p99 = p.percentiles()
+        fps = 1.0 / p50 if p50 > 0 else 0.0
+
+        lines = [
+            f"FPS {fps:6.1f}   target {settings.target_fps}",
+            f"frame p50 {p50 * 1000:5.2f}  p95 {p95 * 1000:5.2f}  p99 {p99 * 1000:5.2f} ms",
+            f"draw calls {p.last_draw_calls:5d}   vertices {p.last_vertices:7d}",
+            f"GC {p.last_gc_pause * 1000:5.2f} ms  ({p.last_gc_collections} collections)",
+            f"quality level {quality.level}/{quality.max_level}",
+            self._format_pacing(),
+            "",
+        ]
+        for name, seconds in sorted(p.last_sections.items(), key=lambda item: -item[1]):
+            lines.append(f"{name:<14} {seconds * 1000:6.3f} ms")
+
+        return lines[:self.max_lines]
+
+    def _format_pacing(self) -> str:
+        """Build the frame pacing overlay line.
+
+        Returns:
+            Pacing mode with jitter and latency
+        """
+        stats = frame_pacer.stats()
+        if not stats:
+            return f"pacing {frame_pacer.mode}"
+        return (
+            f"pacing {frame_pacer.mode:<8} jitter {stats['jitter_ms']:5.2f}"
+            f"  lat {stats.get('latency_ms', 0.0):5.2f} ms"
+        )
+
+    def draw(self) -> None:
+        """Draw the overlay."""
+        if self.batch is None:
+            self._create_text()
+
+        # Refresh text a few times per second so it stays readable
+        self._frames_since_refresh += 1
+        if self._frames_since_refresh >= self.refresh_interval:
+            self._frames_since_refresh = 0
+            text = self._format_lines()
+            for i, line in enumerate(self.lines):
+                line.text = text[i] if i < len(text) else ""
+
+        # Background panel
+        height = self.graph_height + 20 + self.max_lines * self.line_height
+        panel = arcade.types.LBWH(self.x, self.y, self.width, height)
+        arcade.draw.draw_rect_filled(panel, (0, 0, 0, 180))
+
+        self._draw_graph()
+        self.batch.draw()
+
+    def _draw_graph(self) -> None:
+        """Draw rolling frame time graph with the frame budget line."""
+        budget = 1.0 / settings.target_fps
+        scale = self.graph_height / (budget * 3)  # Graph shows up to 3x budget
+        graph_x = self.x + 6
+        graph_y = self.y + 6
+        graph_width = self.width - 12
+
+        # Frame budget line
+        budget_y = graph_y + budget * scale
+        arcade.draw.draw_line(
+            graph_x, budget_y,
+            graph_x + graph_width, budget_y,
+            (255, 140, 0),
+            line_width=1
+        )
+
+        frame_times = self.profiler.frame_times
+        if len(frame_times) < 2:
+            return
+
+        step = graph_width / (frame_times.maxlen - 1)
+        points = [
+            (graph_x + i * step, graph_y + min(frame_time * scale, self.graph_height))
+            for i, frame_time in enumerate(frame_times)
+        ]
+        arcade.draw.draw_line_strip(points, (0, 255, 255), line_width=1)
+
+
+# Global profiler instance
+profiler = FrameProfiler()
@@ -0,0 +1,161 @@
+"""Adaptive quality governor that scales visual effects to hold a frame budget."""
+from typing import Optional
+from game.settings import settings
+
+# Degradation ladder, applied in order when the frame budget is exceeded.
+# Each step sets one effect knob; stepping back up undoes the last step.
+QUALITY_LADDER: list[tuple[str, float]] = [
+    ("glow_layers", 3),
+    ("glow_layers", 1),
+    ("star_fraction", 0.5),
+    ("star_fraction", 0.25),
+    ("trail_fraction", 0.5),
+    ("trail_fraction", 0.25),
+    ("grid_glow_passes", 1),
+    ("grid_glow_passes", 0),
+    ("particle_fraction", 0.5),
+    ("particle_fraction", 0.0),
+]
+
+# Effect knobs at full quality
+FULL_QUALITY: dict[str, float] = {
+    "glow_layers": 5,
+    "star_fraction": 1.0,
+    "trail_fraction": 1.0,
+    "grid_glow_passes": 3,
+    "particle_fraction": 1.0,
+}
+
+
+class QualityGovernor:
+    """Steps effect quality down when frames run over budget and back up with headroom.
+
+    Frames are judged by their work time (updating and drawing), averaged
+    over a sliding window, against the frame budget of the pacing mode.
+    The interval between presents is not used: under vsync it is the
+    refresh period however cheap the frame is. Quality drops one step when
+    the average work exceeds the budget for ``downgrade_frames``
+    consecutive frames, and rises one step only after ``upgrade_frames``
+    consecutive frames whose work time leaves comfortable headroom. The
+    gap between the two thresholds, and the much longer upgrade window,
+    provide hysteresis so quality does not oscillate.
+    """
+
+    def __init__(
+        self,
+        downgrade_threshold: float = 1.1,
+        upgrade_threshold: float = 0.6,
+        downgrade_frames: int = 30,
+        upgrade_frames: int = 240,
+        smoothing: float = 0.1
+    ):
+        """Initialize quality governor.
+
+        Args:
+            downgrade_threshold: Step down when frame work time exceeds budget * this
+            upgrade_threshold: Step up when frame work time is below budget * this
+            downgrade_frames: Consecutive over-budget frames before stepping down
+            upgrade_frames: Consecutive frames with headroom before stepping up
+            smoothing: Exponential moving average factor for frame times
+        """
+        self.downgrade_threshold = downgrade_threshold
+        self.upgrade_threshold = upgrade_threshold
+        self.downgrade_frames = downgrade_frames
+        self.upgrade_frames = upgrade_frames
+        self.smoothing = smoothing
+
+        self.level = 0
+        self.knobs: dict[str, float] = dict(FULL_QUALITY)
+
+        self.avg_work: Optional[float] = None
+        self._over_budget_frames = 0
+        self._headroom_frames = 0
+
+    @property
+    def max_level(self) -> int:
+        """Lowest quality level (number of ladder steps)."""
+        return len(QUALITY_LADDER)
+
+    @property
+    def glow_layers(self) -> int:
+        """Number of glow layers drawn around paddles and the ball."""
+        return int(self.knobs["glow_layers"])
+
+    @property
+    def star_fraction(self) -> float:
+        """Fraction of background stars drawn."""
+        return self.knobs["star_fraction"]
+
+    @property
+    def trail_fraction(self) -> float:
+        """Fraction of motion trail segments drawn."""
+        return self.knobs["trail_fraction"]
+
+    @property
+    def grid_glow_passes(self) -> int:
+        """Number of glow passes drawn under each grid line."""
+        return int(self.knobs["grid_glow_passes"])
+
+    @property
+    def particle_fraction(self) -> float:
+        """Fraction of particles emitted per burst."""
+        return self.knobs["particle_fraction"]
+
+    def set_level(self, level: int) -> None:
+        """Set the quality level directly.
+
+        Args:
+            level: 0 for full quality up to ``max_level`` for lowest quality
+        """
+        self.level = max(0, min(level, self.max_level))
+        self.knobs = dict(FULL_QUALITY)
+        for knob, value in QUALITY_LADDER[:self.level]:
+            self.knobs[knob] = value
+        self._over_budget_frames = 0
+        self._headroom_frames = 0
+
+    def reset(self) -> None:
+        """Return to full quality and forget frame history."""
+        self.set_level(0)
+        self.avg_work = None
+
+    def record_frame(self, work_time: float, budget: Optional[float] = None) -> None:
+        """Record one frame and adjust quality if needed.
+
+        Args:
+            work_time: Time spent updating and drawing this frame (seconds)
+            budget: Time a frame may take in the current pacing mode
+                (defaults to one ``target_fps`` period)
+        """
+        if not settings.adaptive_quality_enabled:
+            return
+
+        if self.avg_work is None:
+            self.avg_work = work_time
+        else:
+            self.avg_work += (work_time - self.avg_work) * self.smoothing
+
+        if budget is None:
+            budget = 1.0 / settings.target_fps
+
+        if self.avg_work > budget * self.downgrade_threshold:
+            self._over_budget_frames += 1
+            self._headroom_frames = 0
+        elif self.avg_work < budget * self.upgrade_threshold:
+            self._headroom_frames += 1
+            self._over_budget_frames = 0
+        else:
+            self._over_budget_frames = 0
+            self._headroom_frames = 0
+
+        if self._over_budget_frames >= self.downgrade_frames and self.level < self.max_level:
+            self.set_level(self.level + 1)
+            # Let the moving average settle on the new cost
+            self.avg_work = None
+        elif self._headroom_frames >= self.upgrade_frames and self.level > 0:
+            self.set_level(self.level - 1)
+            self.avg_work = None
+
+
+# Global quality governor instance
+quality = QualityGovernor()
@@ -0,0 +1,143 @@
+"""Fixed internal-resolution render target scaled to the window."""
+import arcade
+from contextlib import contextmanager
+from typing import Callable, Generator, Optional
+from arcade.gl.geometry import quad_2d_fs
+from game.settings import settings
+
+
+class InternalRenderTarget:
+    """Renders the game into a fixed-size framebuffer and upscales it to the window.
+
+    All game drawing uses logical coordinates (``settings.screen_width`` x
+    ``settings.screen_height``) regardless of the window size. The
+    framebuffer is ``settings.render_width`` x ``settings.render_height``
+    pixels, so fill-rate cost does not grow with the monitor resolution.
+    The result is scaled to the window, letterboxed to keep the aspect ratio.
+    """
+
+    def __init__(self):
+        """Initialize render target (GL resources are created on first use)."""
+        self.ctx = None
+        self.framebuffer = None
+        self.texture = None
+        self.camera: Optional[arcade.Camera2D] = None
+        self._quad = None
+        self._key: Optional[tuple] = None
+
+        # Called with this target after each frame is rendered (e.g. frame capture)
+        self.frame_listeners: list[Callable[["InternalRenderTarget"], None]] = []
+
+    def _ensure_resources(self) -> None:
+        """Create or rebuild the framebuffer when the window or settings change."""
+        window = arcade.get_window()
+        key = (
+            window.ctx,
+            settings.render_width,
+            settings.render_height,
+            settings.screen_width,
+            settings.screen_height,
+            settings.render_scaling_filter
+        )
+        if key == self._key:
+            return
+
+        self.ctx = window.ctx
+        size = (settings.render_width, settings.render_height)
+        scaling = self.ctx.NEAREST if settings.render_scaling_filter == "nearest" else self.ctx.LINEAR
+
+        self.texture = self.ctx.texture(size, components=4, filter=(scaling, scaling))
+        self.framebuffer = self.ctx.framebuffer(color_attachments=[self.texture])
+        half_width = settings.screen_width / 2
+        half_height = settings.screen_height / 2
+        self.camera = arcade.Camera2D(
+            viewport=arcade.types.LBWH(0, 0, *size),
+            projection=arcade.types.LRBT(-half_width, half_width, -half_height, half_height),
+            position=(half_width, half_height),
+            render_target=self.framebuffer,
+            window=window
+        )
+        self._quad = quad_2d_fs()
+        self._key = key
+
+    @contextmanager
+    def capture(self, present: bool = True) -> Generator["InternalRenderTarget", None, None]:
+        """Redirect drawing into the internal framebuffer.
+
+        Args:
+            present: Scale the result to the window when the block exits
+
+        Example:
+            with render_target.capture():
+                background.draw()
+        """
+        self._ensure_resources()
+        with self.camera.activate():
+            self.framebuffer.clear(color=arcade.get_window().background_color)
+            yield self
+
+        for listener in self.frame_listeners:
+            listener(self)
+
+        if present:
+            self.present()
+
+    def letterbox(self, width: float, height: float) -> tuple[float, float, float, float]:
+        """Compute where the scaled game image sits inside a window.
+
+        Args:
+            width: Window width
+            height: Window height
+
+        Returns:
+            (x, y, width, height) of the game image
+        """
+        scale = min(width / settings.screen_width, height / settings.screen_height)
+        scaled_width = settings.screen_width * scale
+        scaled_height = settings.screen_height * scale
+        return (
+            (width - scaled_width) / 2,
+            (height - scaled_height) / 2,
+            scaled_width,
+            scaled_height
+        )
+
+    def present(self) -> None:
+        """Scale the internal framebuffer onto the window."""
+        window = arcade.get_window()
+        screen = self.ctx.screen
+
+        screen.use()
+        screen.clear(color=(0, 0, 0, 255))
+
+        fb_width, fb_height = window.get_framebuffer_size()
+        x, y, width, height = self.letterbox(fb_width, fb_height)
+        self.ctx.viewport = (int(x), int(y), int(width), int(height))
+
+        # Copy pixels as-is; the framebuffer already holds the blended result
+        with self.ctx.enabled_only():
+            self.texture.use(0)
+            self._quad.render(self.ctx.utility_textured_quad_program)
+
+        window.default_camera.use()
+
+    def window_to_logical(self, x: float, y: float) -> tuple[float, float]:
+        """Convert window coordinates (e.g. mouse position) to game coordinates.
+
+        Args:
+            x: Window x position
+            y: Window y position
+
+        Returns:
+            (x, y) in logical game coordinates
+        """
+        window = arcade.get_window()
+        left, bottom, width, height = self.letterbox(*window.get_size())
+        return (
+            (x - left) * settings.screen_width / width,
+            (y - bottom) * settings.screen_height / height
+        )
+
+
+# Global render target shared by all views
+render_target = InternalRenderTarget()
@@ -1,5 +1,5 @@
 """Game settings and configuration."""
-from typing import Literal
+from typing import Literal, Optional
 from pydantic import BaseModel, Field
 import arcade
 import json
@@ -38,7 +38,30 @@ class GameSettings(BaseModel):
     screen_height: int = Field(default=720, description="Screen height in pixels")
     screen_title: str = Field(default="Pong - Arcade Edition", description="Window title")
     fullscreen: bool = Field(default=False, description="Fullscreen mode enabled")
-    target_fps: int = Field(default=120, description="Target frames per second")
+    render_width: int = Field(default=1280, description="Internal render resolution width")
+    render_height: int = Field(default=720, description="Internal render resolution height")
+    render_scaling_filter: Literal["linear", "nearest"] = Field(
+        default="linear",
+        description="Filter used when scaling the internal resolution to the window"
+    )
+    target_fps: int = Field(default=120, description="Simulation ticks per second (and the capped frame rate)")
+    frame_pacing_mode: Literal["vsync", "uncapped", "capped"] = Field(
+        default="capped",
+        description="Frame pacing: display refresh, no limit, or capped at target_fps"
+    )
+    frame_pacing_spin_time: float = Field(
+        default=0.002,
+        ge=0.0,
+        description="Seconds before each capped frame spent busy-waiting instead of sleeping"
+    )
+    adaptive_quality_enabled: bool = Field(
+        default=True,
+        description="Reduce visual effects automatically when frames run over budget"
+    )
+    input_log_dir: Optional[str] = Field(
+        default=None,
+        description="Directory where match input logs are recorded for replay and capture"
+    )
 
     # Gameplay settings
     winning_score: int = Field(default=10, description="Score needed to win")
@@ -46,10 +69,41 @@ class GameSettings(BaseModel):
         default="Normal",
         description="AI difficulty preset"
     )
+    instant_replay_seconds: float = Field(
+        default=10.0,
+        ge=1.0,
+        le=30.0,
+        description="Seconds of play before a goal kept for instant replay"
+    )
+    instant_replay_speed: float = Field(
+        default=0.5,
+        gt=0.0,
+        le=1.0,
+        description="Instant replay playback speed (0.5 = half-speed slow motion)"
+    )
 
     # Audio settings
     audio_enabled: bool = Field(default=True, description="Sound effects enabled")
     master_volume: float = Field(default=0.7, ge=0.0, le=1.0, description="Master volume")
+    sfx_volume: float = Field(default=1.0, ge=0.0, le=1.0, description="Sound effects volume (under master)")
+    music_volume: float = Field(default=1.0, ge=0.0, le=1.0, description="Music volume (under master)")
+    music_fade_seconds: float = Field(default=1.0, ge=0.0, description="Background music fade in/out time")
+    audio_buffer_frames: int = Field(
+        default=512,
+        ge=64,
+        description="Mixer block size in frames; a sound starts within one block (512 = 11 ms at 48 kHz)"
+    )
+    audio_max_voices: int = Field(default=16, ge=1, description="Sounds playing at once; the oldest is stolen")
+    audio_max_voices_per_sound: int = Field(default=4, ge=1, description="Copies of one sound playing at once")
+    audio_coalesce_ms: float = Field(
+        default=30.0,
+        ge=0.0,
+        description="Repeat triggers of a sound within this window are dropped"
+    )
+    audio_backend: Literal["pyaudio", "null", "capture"] = Field(
+        default="pyaudio",
+        description="Audio output: the sound device, nothing, or an in-memory capture (tests and benchmarks)"
+    )
 
     # Paddle settings
     paddle_width: int = Field(default=20, description="Paddle width in pixels")
@@ -119,6 +173,10 @@ class GameSettings(BaseModel):
         default=(50, 50, 100),
         description="Center line RGB color"
     )
+    arena_border_enabled: bool = Field(
+        default=False,
+        description="Draw top and bottom arena borders"
+    )
 
     # Synthwave visual theme settings
     synthwave_sky_top: tuple[int, int, int] = Field(
@@ -175,7 +233,15 @@ class GameSettings(BaseModel):
     motion_blur_enabled: bool = Field(default=True, description="Enable ball motion blur trail")
     motion_blur_length: int = Field(default=15, description="Number of trail segments")
     star_count: int = Field(default=100, description="Number of background stars")
+    particles_enabled: bool = Field(default=True, description="Enable impact particle bursts")
+    particle_capacity: int = Field(default=16384, description="Maximum number of live particles")
+    particle_burst_count: int = Field(default=24, description="Particles emitted per paddle hit")
     grid_perspective_depth: float = Field(default=0.8, description="Grid perspective depth factor")
+    grid_scroll_speed: float = Field(
+        default=0.2,
+        ge=0.0,
+        description="Grid rows scrolled toward the horizon per second, per unit of ball speed (0 disables)"
+    )
 
     class Config:
         """Pydantic configuration."""
@@ -238,7 +304,10 @@ def save_settings(config_file: Path = None) -> None:
             }
         },
         "display": {
-            "fullscreen": settings.fullscreen
+            "fullscreen": settings.fullscreen,
+            "render_width": settings.render_width,
+            "render_height": settings.render_height,
+            "frame_pacing_mode": settings.frame_pacing_mode
         },
         "gameplay": {
             "winning_score": settings.winning_score,
@@ -246,7 +315,9 @@ def save_settings(config_file: Path = None) -> None:
         },
         "audio": {
             "enabled": settings.audio_enabled,
-            "master_volume": settings.master_volume
+            "master_volume": settings.master_volume,
+            "sfx_volume": settings.sfx_volume,
+            "music_volume": settings.music_volume
         }
     }
 
@@ -301,6 +372,12 @@ def load_settings(config_file: Path = None) -> bool:
         if "display" in config_data:
             if "fullscreen" in config_data["display"]:
                 settings.fullscreen = config_data["display"]["fullscreen"]
+            if "render_width" in config_data["display"]:
+                settings.render_width = config_data["display"]["render_width"]
+            if "render_height" in config_data["display"]:
+                settings.render_height = config_data["display"]["render_height"]
+            if "frame_pacing_mode" in config_data["display"]:
+                settings.frame_pacing_mode = config_data["display"]["frame_pacing_mode"]
 
         # Load gameplay settings
         if "gameplay" in config_data:
@@ -315,6 +392,10 @@ def load_settings(config_file: Path = None) -> bool:
                 settings.audio_enabled = config_data["audio"]["enabled"]
             if "master_volume" in config_data["audio"]:
                 settings.master_volume = config_data["audio"]["master_volume"]
+            if "sfx_volume" in config_data["audio"]:
+                settings.sfx_volume = config_data["audio"]["sfx_volume"]
+            if "music_volume" in config_data["audio"]:
+                settings.music_volume = config_data["audio"]["music_volume"]
 
         print(f"[CONFIG] Settings loaded from {config_file}")
         return True
@@ -1,16 +1,117 @@
 """Generate retro Pong sound effects."""
 import wave
-import struct
-import math
+import numpy as np
 from pathlib import Path
 
+SAMPLE_RATE = 22050
+
+
+def write_wav(filename: str, samples: np.ndarray, sample_rate: int = SAMPLE_RATE) -> None:
+    """Write mono 16-bit samples to a WAV file in one call.
+
+    Args:
+        filename: Output WAV file path
+        samples: int16 samples
+        sample_rate: Sample rate in Hz
+    """
+    with wave.open(filename, 'w') as wav_file:
+        # Set parameters: 1 channel, 2 bytes per sample, sample rate
+        wav_file.setparams((1, 2, sample_rate, len(samples), 'NONE', 'not compressed'))
+        wav_file.writeframes(samples.astype('<i2').tobytes())
+
+
+def to_pcm16(values: np.ndarray) -> np.ndarray:
+    """Convert a waveform in -1.0..1.0 to int16, truncating like int().
+
+    Args:
+        values: Waveform samples
+
+    Returns:
+        int16 samples
+    """
+    return (values * 32767).astype(np.int16)
+
+
+def render_beep(
+    frequency: float,
+    duration: float,
+    volume: float = 0.5,
+    sample_rate: int = SAMPLE_RATE
+) -> np.ndarray:
+    """Render a simple beep with a smooth envelope.
+
+    Args:
+        frequency: Frequency in Hz
+        duration: Duration in seconds
+        volume: Volume (0.0 to 1.0)
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        int16 samples
+    """
+    num_samples = int(sample_rate * duration)
+    i = np.arange(num_samples)
+    t = i / sample_rate
+
+    # Smooth sine fade-in to prevent click at start (first 10% of sound)
+    envelope = np.ones(num_samples)
+    fade_in_samples = int(num_samples * 0.1)
+    envelope[:fade_in_samples] = np.sin(i[:fade_in_samples] / fade_in_samples * np.pi / 2)
+
+    # Smooth sine fade-out at end (last 30% of sound)
+    fade_out_samples = int(num_samples * 0.3)
+    tail = i > num_samples - fade_out_samples
+    envelope[tail] *= np.sin((num_samples - i[tail]) / fade_out_samples * np.pi / 2)
+
+    # Gentle exponential decay for retro feel
+    envelope *= np.exp(-t * 3)
+
+    return to_pcm16(volume * envelope * np.sin(2 * np.pi * frequency * t))
+
+
+def render_sweep(
+    start_frequency: float,
+    end_frequency: float,
+    duration: float,
+    volume: float,
+    decay: str = "none",
+    sample_rate: int = SAMPLE_RATE
+) -> np.ndarray:
+    """Render a linear frequency sweep.
+
+    The phase is 2*pi*f(t)*t with f(t) the instantaneous sweep frequency,
+    as the original per-sample loop computed it, so output is unchanged.
+
+    Args:
+        start_frequency: Frequency at the start in Hz
+        end_frequency: Frequency at the end in Hz
+        duration: Duration in seconds
+        volume: Volume (0.0 to 1.0)
+        decay: "none", "exponential" (exp(-3t)) or "linear" (to silence at the end)
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        int16 samples
+    """
+    num_samples = int(sample_rate * duration)
+    t = np.arange(num_samples) / sample_rate
+    frequency = start_frequency + (end_frequency - start_frequency) * t / duration
+
+    amplitude = volume
+    if decay == "exponential":
+        amplitude = volume * np.exp(-t * 3)
+    elif decay == "linear":
+        amplitude = volume * (1.0 - t / duration)
+
+    return to_pcm16(amplitude * np.sin(2 * np.pi * frequency * t))
+
 
 def generate_beep(
     filename: str,
     frequency: float,
     duration: float,
     volume: float = 0.5,
-    sample_rate: int = 22050
+    sample_rate: int = SAMPLE_RATE
 ) -> None:
     """Generate a simple beep sound with smooth envelope.
 
@@ -21,44 +122,7 @@ def generate_beep(
         volume: Volume (0.0 to 1.0)
         sample_rate: Sample rate in Hz
     """
-    num_samples = int(sample_rate * duration)
-
-    with wave.open(filename, 'w') as wav_file:
-        # Set parameters: 1 channel, 2 bytes per sample, sample rate
-        wav_file.setparams((1, 2, sample_rate, num_samples, 'NONE', 'not compressed'))
-
-        # Generate samples
-        for i in range(num_samples):
-            # Create a sine wave with exponential decay for a more retro sound
-            t = i / sample_rate
-
-            # Smooth fade-in to prevent click at start (first 10% of sound)
-            # Use sine curve for smoother fade
-            fade_in_samples = int(num_samples * 0.1)
-            if i < fade_in_samples:
-                fade_in = math.sin((i / fade_in_samples) * math.pi / 2)
-            else:
-                fade_in = 1.0
-
-            # Smooth fade-out at end (last 30% of sound)
-            # Use sine curve for smoother fade
-            fade_out_samples = int(num_samples * 0.3)
-            if i > num_samples - fade_out_samples:
-                fade_out = math.sin(((num_samples - i) / fade_out_samples) * math.pi / 2)
-            else:
-                fade_out = 1.0
-
-            # Gentler exponential decay for retro feel (reduced from 5 to 3)
-            decay = math.exp(-t * 3)
-
-            # Combine all envelopes
-            envelope = fade_in * fade_out * decay
-            value = volume * envelope * math.sin(2 * math.pi * frequency * t)
-
-            # Convert to 16-bit integer
-            sample = int(value * 32767)
-            packed_value = struct.pack('h', sample)
-            wav_file.writeframes(packed_value)
+    write_wav(filename, render_beep(frequency, duration, volume, sample_rate), sample_rate)
 
 
 def generate_paddle_hit(filename: str) -> None:
@@ -89,23 +153,8 @@ def generate_score_sound(filename: str) -> None:
     Args:
         filename: Output WAV file path
     """
-    sample_rate = 22050
-    duration = 0.3
-    num_samples = int(sample_rate * duration)
-
-    with wave.open(filename, 'w') as wav_file:
-        wav_file.setparams((1, 2, sample_rate, num_samples, 'NONE', 'not compressed'))
-
-        for i in range(num_samples):
-            t = i / sample_rate
-            # Descending frequency from 550 Hz to 220 Hz
-            frequency = 550 - (330 * t / duration)
-            decay = math.exp(-t * 3)
-            value = 0.5 * decay * math.sin(2 * math.pi * frequency * t)
-
-            sample = int(value * 32767)
-            packed_value = struct.pack('h', sample)
-            wav_file.writeframes(packed_value)
+    # Descending frequency from 550 Hz to 220 Hz
+    write_wav(filename, render_sweep(550, 220, duration=0.3, volume=0.5, decay="exponential"))
 
 
 def generate_game_start(filename: str) -> None:
@@ -114,23 +163,8 @@ def generate_game_start(filename: str) -> None:
     Args:
         filename: Output WAV file path
     """
-    sample_rate = 22050
-    duration = 0.4
-    num_samples = int(sample_rate * duration)
-
-    with wave.open(filename, 'w') as wav_file:
-        wav_file.setparams((1, 2, sample_rate, num_samples, 'NONE', 'not compressed'))
-
-        for i in range(num_samples):
-            t = i / sample_rate
-            # Ascending frequency from 220 Hz to 880 Hz
-            frequency = 220 + (660 * t / duration)
-            decay = 1.0 - (t / duration)
-            value = 0.4 * decay * math.sin(2 * math.pi * frequency * t)
-
-            sample = int(value * 32767)
-            packed_value = struct.pack('h', sample)
-            wav_file.writeframes(packed_value)
+    # Ascending frequency from 220 Hz to 880 Hz
+    write_wav(filename, render_sweep(220, 880, duration=0.4, volume=0.4, decay="linear"))
 
 
 def generate_game_over(filename: str) -> None:
@@ -139,22 +173,8 @@ def generate_game_over(filename: str) -> None:
     Args:
         filename: Output WAV file path
     """
-    sample_rate = 22050
-    duration = 0.6
-    num_samples = int(sample_rate * duration)
-
-    with wave.open(filename, 'w') as wav_file:
-        wav_file.setparams((1, 2, sample_rate, num_samples, 'NONE', 'not compressed'))
-
-        for i in range(num_samples):
-            t = i / sample_rate
-            # Descending frequency from 440 Hz to 110 Hz
-            frequency = 440 - (330 * t / duration)
-            value = 0.5 * math.sin(2 * math.pi * frequency * t)
-
-            sample = int(value * 32767)
-            packed_value = struct.pack('h', sample)
-            wav_file.writeframes(packed_value)
+    # Descending frequency from 440 Hz to 110 Hz
+    write_wav(filename, render_sweep(440, 110, duration=0.6, volume=0.5))
 
 
 def generate_all_sounds(output_dir: Path) -> None:
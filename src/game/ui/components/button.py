@@ -1,10 +1,19 @@
 """Button component for menus."""
 import arcade
+from arcade.shape_list import ShapeElementList, create_rectangle_filled, create_rectangle_outline
+from pyglet.graphics import Batch
+from typing import Optional
 from game.settings import settings
 
 
 class Button:
-    """Simple button for menu interfaces."""
+    """Simple button for menu interfaces.
+
+    Geometry and labels are built once per visual state (normal, hover,
+    selected) and reused until the text, position or size changes. Menus
+    draw their buttons through a ButtonGroup, which batches every button;
+    draw() still draws a lone button through a group of its own.
+    """
 
     def __init__(
         self,
@@ -25,14 +34,14 @@ class Button:
             text: Button text
             action: Callback function when clicked
         """
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
-        self.text = text
+        self._x = x
+        self._y = y
+        self._width = width
+        self._height = height
+        self._text = text
+        self._selected = False
+        self._hovered = False
         self.action = action
-        self.selected = False
-        self.hovered = False
 
         # Synthwave colors
         self.normal_color = (20, 20, 40)
@@ -43,71 +52,223 @@ class Button:
         self.text_color = (255, 255, 255)
         self.glow_color = settings.synthwave_grid_glow
 
-    def draw(self) -> None:
-        """Draw the button with synthwave neon glow."""
-        # Choose color based on state
-        if self.selected:
+        # Retained rendering state, owned by the group that draws this button
+        self._shapes: dict[str, list] = {}
+        self._labels: dict[str, list[arcade.Text]] = {}
+        self._batch: Optional[Batch] = None
+        self._group: Optional["ButtonGroup"] = None
+        self.dirty = True
+
+    @property
+    def x(self) -> float:
+        """X position (center)."""
+        return self._x
+
+    @x.setter
+    def x(self, value: float) -> None:
+        if value != self._x:
+            self._x = value
+            self._invalidate_layout()
+
+    @property
+    def y(self) -> float:
+        """Y position (center)."""
+        return self._y
+
+    @y.setter
+    def y(self, value: float) -> None:
+        if value != self._y:
+            self._y = value
+            self._invalidate_layout()
+
+    @property
+    def width(self) -> float:
+        """Button width."""
+        return self._width
+
+    @width.setter
+    def width(self, value: float) -> None:
+        if value != self._width:
+            self._width = value
+            self._shapes.clear()
+            self.dirty = True
+
+    @property
+    def height(self) -> float:
+        """Button height."""
+        return self._height
+
+    @height.setter
+    def height(self, value: float) -> None:
+        if value != self._height:
+            self._height = value
+            self._shapes.clear()
+            self.dirty = True
+
+    @property
+    def text(self) -> str:
+        """Button text."""
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        if value != self._text:
+            self._text = value
+            for labels in self._labels.values():
+                for label in labels:
+                    label.text = value
+
+    @property
+    def selected(self) -> bool:
+        """Whether the button is the current menu selection."""
+        return self._selected
+
+    @selected.setter
+    def selected(self, value: bool) -> None:
+        if value != self._selected:
+            self._selected = value
+            self.dirty = True
+
+    @property
+    def hovered(self) -> bool:
+        """Whether the mouse is over the button."""
+        return self._hovered
+
+    @hovered.setter
+    def hovered(self, value: bool) -> None:
+        if value != self._hovered:
+            self._hovered = value
+            self.dirty = True
+
+    @property
+    def state(self) -> str:
+        """Current visual state: "normal", "hover" or "selected"."""
+        if self._selected:
+            return "selected"
+        if self._hovered:
+            return "hover"
+        return "normal"
+
+    def _invalidate_layout(self) -> None:
+        """Drop cached geometry and move labels after a position change."""
+        self._shapes.clear()
+        for labels in self._labels.values():
+            for label in labels:
+                label.position = (self._x, self._y)
+        self.dirty = True
+
+    def shapes(self) -> list:
+        """Get the geometry for the current state, building it if needed.
+
+        Returns:
+            Shapes for the glow layers, background and border
+        """
+        state = self.state
+        if state not in self._shapes:
+            self._shapes[state] = self._build_shapes(state)
+        return self._shapes[state]
+
+    def _build_shapes(self, state: str) -> list:
+        """Build the glow, background and border for a state.
+
+        Args:
+            state: Visual state
+
+        Returns:
+            Shapes in draw order
+        """
+        if state == "selected":
             color = self.selected_color
             border_color = self.border_selected
-            has_glow = True
-        elif self.hovered:
+        elif state == "hover":
             color = self.hover_color
             border_color = self.glow_color
-            has_glow = True
         else:
             color = self.normal_color
             border_color = self.border_normal
-            has_glow = False
 
-        # Draw glow layers if selected/hovered
-        if has_glow:
+        shapes = []
+
+        # Glow layers if selected/hovered
+        if state != "normal":
             glow_layers = [
-                (self.width + 20, self.height + 20, 20),
-                (self.width + 15, self.height + 15, 40),
-                (self.width + 10, self.height + 10, 60),
-                (self.width + 5, self.height + 5, 100)
+                (self._width + 20, self._height + 20, 20),
+                (self._width + 15, self._height + 15, 40),
+                (self._width + 10, self._height + 10, 60),
+                (self._width + 5, self._height + 5, 100)
             ]
             for glow_w, glow_h, alpha in glow_layers:
-                glow_color = (*border_color, alpha)
-                glow_rect = arcade.types.XYWH(self.x, self.y, glow_w, glow_h)
-                arcade.draw.draw_rect_filled(glow_rect, glow_color)
-
-        # Draw button background
-        btn_rect = arcade.types.XYWH(self.x, self.y, self.width, self.height)
-        arcade.draw.draw_rect_filled(btn_rect, color)
+                shapes.append(create_rectangle_filled(
+                    self._x, self._y, glow_w, glow_h, (*border_color, alpha)
+                ))
 
-        # Draw border
-        arcade.draw.draw_rect_outline(
-            btn_rect,
+        # Button background and border
+        shapes.append(create_rectangle_filled(self._x, self._y, self._width, self._height, color))
+        shapes.append(create_rectangle_outline(
+            self._x, self._y, self._width, self._height,
             border_color,
-            border_width=3 if self.selected else 2
-        )
+            border_width=3 if state == "selected" else 2
+        ))
 
-        # Draw text with subtle glow if selected
-        if self.selected:
-            # Text glow
-            arcade.draw_text(
-                self.text,
-                self.x,
-                self.y,
+        return shapes
+
+    def update_labels(self, batch: Batch) -> None:
+        """Show the labels for the current state in a batch.
+
+        Args:
+            batch: Text batch of the group drawing this button
+        """
+        if batch is not self._batch:
+            self._labels.clear()
+            self._batch = batch
+
+        state = self.state
+        if state not in self._labels:
+            self._labels[state] = self._build_labels(state, batch)
+
+        for label_state, labels in self._labels.items():
+            for label in labels:
+                label.visible = label_state == state
+
+    def _build_labels(self, state: str, batch: Batch) -> list[arcade.Text]:
+        """Build the text labels for a state.
+
+        Args:
+            state: Visual state
+            batch: Text batch to add the labels to
+
+        Returns:
+            Labels in draw order
+        """
+        labels = []
+
+        # Subtle text glow if selected
+        if state == "selected":
+            labels.append(arcade.Text(
+                self._text,
+                self._x,
+                self._y,
                 (*self.border_selected, 100),
                 font_size=20,
                 anchor_x="center",
                 anchor_y="center",
-                bold=True
-            )
-
-        # Draw main text
-        arcade.draw_text(
-            self.text,
-            self.x,
-            self.y,
+                bold=True,
+                batch=batch
+            ))
+
+        labels.append(arcade.Text(
+            self._text,
+            self._x,
+            self._y,
             self.text_color,
-            font_size=18 if not self.selected else 20,
+            font_size=20 if state == "selected" else 18,
             anchor_x="center",
             anchor_y="center",
-            bold=self.selected
-        )
+            bold=state == "selected",
+            batch=batch
+        ))
+
+        return labels
 
     def is_point_inside(self, x: float, y: float) -> bool:
         """Check if a point is inside the button.
@@ -120,11 +281,58 @@ class Button:
             True if point is inside button
         """
         return (
-            self.x - self.width / 2 <= x <= self.x + self.width / 2 and
-            self.y - self.height / 2 <= y <= self.y + self.height / 2
+            self._x - self._width / 2 <= x <= self._x + self._width / 2 and
+            self._y - self._height / 2 <= y <= self._y + self._height / 2
         )
 
+    def draw(self) -> None:
+        """Draw this button on its own (menus draw through a ButtonGroup)."""
+        if self._group is None:
+            self._group = ButtonGroup([self])
+        self._group.draw()
+
     def on_click(self) -> None:
         """Handle button click."""
         if self.action:
             self.action()
+
+
+class ButtonGroup:
+    """Draws all buttons of a menu as one batch.
+
+    Geometry for every button goes into a single shape list and all labels
+    into a single text batch. Both are only touched when a button changes
+    state, text or position, so an idle menu costs two draw calls per frame.
+    """
+
+    def __init__(self, buttons: list[Button]):
+        """Initialize button group.
+
+        Args:
+            buttons: Buttons to draw, in draw order
+        """
+        self.buttons = buttons
+        self.shape_list: Optional[ShapeElementList] = None
+        self.batch: Optional[Batch] = None
+
+    def _rebuild(self) -> None:
+        """Rebuild the shape list and label visibility from button state."""
+        if self.shape_list is None:
+            self.shape_list = ShapeElementList()
+            self.batch = Batch()
+        else:
+            self.shape_list.clear()
+
+        for button in self.buttons:
+            for shape in button.shapes():
+                self.shape_list.append(shape)
+            button.update_labels(self.batch)
+            button.dirty = False
+
+    def draw(self) -> None:
+        """Draw every button."""
+        if self.shape_list is None or any(button.dirty for button in self.buttons):
+            self._rebuild()
+
+        self.shape_list.draw()
+        self.batch.draw()
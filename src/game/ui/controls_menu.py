@@ -2,7 +2,9 @@
 import arcade
 from typing import Optional, Callable, Literal
 from game.settings import settings, save_settings, ControlMapping
-from game.ui.components.button import Button
+from game.ui.components.button import Button, ButtonGroup
+from game.render_target import render_target
+from game.background_renderer import background_cache
 
 
 def get_key_name(key_code: int) -> str:
@@ -61,7 +63,9 @@ class ControlsMenuView(arcade.View):
         """Initialize controls menu."""
         super().__init__()
         self.buttons = []
+        self.button_group: Optional[ButtonGroup] = None
         self.selected_index = 0
+        self.background_renderer = None
 
         # Callbacks
         self.on_back: Optional[Callable] = None
@@ -75,6 +79,12 @@ class ControlsMenuView(arcade.View):
         start_y = settings.screen_height / 2 + 140
         button_spacing = 60
 
+        # Shared synthwave background
+        self.background_renderer = background_cache.get(
+            settings.screen_width,
+            settings.screen_height
+        )
+
         # Get key names for display
         single_up_key = get_key_name(settings.single_player_controls.up)
         single_down_key = get_key_name(settings.single_player_controls.down)
@@ -123,6 +133,7 @@ class ControlsMenuView(arcade.View):
         ]
 
         self.buttons[0].selected = True
+        self.button_group = ButtonGroup(self.buttons)
 
     def _start_remap(self, control: Literal["single_up", "single_down", "p1_up", "p1_down", "p2_up", "p2_down"]) -> None:
         """Start remapping a control.
@@ -141,67 +152,74 @@ class ControlsMenuView(arcade.View):
         self.buttons[4].text = f"Two Player P2 Up: {get_key_name(settings.two_player_p2_controls.up)}"
         self.buttons[5].text = f"Two Player P2 Down: {get_key_name(settings.two_player_p2_controls.down)}"
 
+    def on_show_view(self) -> None:
+        """Start each visit with no pending remap and current key names."""
+        self.remapping_mode = None
+        self._update_button_text()
+
     def on_draw(self) -> None:
         """Draw the menu."""
-        self.clear()
         arcade.set_background_color(settings.background_color)
+        with render_target.capture():
+            # Draw synthwave background
+            if self.background_renderer:
+                self.background_renderer.draw()
 
-        # Draw title
-        arcade.draw_text(
-            "CONTROLS",
-            settings.screen_width / 2,
-            settings.screen_height - 150,
-            (0, 255, 255),
-            font_size=60,
-            anchor_x="center",
-            bold=True
-        )
-
-        # Draw buttons
-        for button in self.buttons:
-            button.draw()
-
-        # Draw remapping prompt
-        if self.remapping_mode:
-            # Semi-transparent overlay
-            rect = arcade.types.XYWH(
-                settings.screen_width / 2,
-                settings.screen_height / 2,
-                settings.screen_width,
-                settings.screen_height
-            )
-            arcade.draw.draw_rect_filled(rect, (0, 0, 0, 200))
-
-            # Prompt text
+            # Draw title
             arcade.draw_text(
-                "Press any key to remap...",
+                "CONTROLS",
                 settings.screen_width / 2,
-                settings.screen_height / 2 + 40,
+                settings.screen_height - 150,
                 (0, 255, 255),
-                font_size=40,
+                font_size=60,
                 anchor_x="center",
                 bold=True
             )
 
-            arcade.draw_text(
-                "Press ESC to cancel",
-                settings.screen_width / 2,
-                settings.screen_height / 2 - 20,
-                (150, 150, 200),
-                font_size=20,
-                anchor_x="center"
-            )
-
-        # Draw info text
-        else:
-            arcade.draw_text(
-                "Click a button or press ENTER to remap a control",
-                settings.screen_width / 2,
-                100,
-                (150, 150, 200),
-                font_size=16,
-                anchor_x="center"
-            )
+            # Draw buttons
+            self.button_group.draw()
+
+            # Draw remapping prompt
+            if self.remapping_mode:
+                # Semi-transparent overlay
+                rect = arcade.types.XYWH(
+                    settings.screen_width / 2,
+                    settings.screen_height / 2,
+                    settings.screen_width,
+                    settings.screen_height
+                )
+                arcade.draw.draw_rect_filled(rect, (0, 0, 0, 200))
+
+                # Prompt text
+                arcade.draw_text(
+                    "Press any key to remap...",
+                    settings.screen_width / 2,
+                    settings.screen_height / 2 + 40,
+                    (0, 255, 255),
+                    font_size=40,
+                    anchor_x="center",
+                    bold=True
+                )
+
+                arcade.draw_text(
+                    "Press ESC to cancel",
+                    settings.screen_width / 2,
+                    settings.screen_height / 2 - 20,
+                    (150, 150, 200),
+                    font_size=20,
+                    anchor_x="center"
+                )
+
+            # Draw info text
+            else:
+                arcade.draw_text(
+                    "Click a button or press ENTER to remap a control",
+                    settings.screen_width / 2,
+                    100,
+                    (150, 150, 200),
+                    font_size=16,
+                    anchor_x="center"
+                )
 
     def on_key_press(self, key: int, modifiers: int) -> None:
         """Handle key presses.
@@ -285,6 +303,7 @@ class ControlsMenuView(arcade.View):
         if self.remapping_mode:
             return
 
+        x, y = render_target.window_to_logical(x, y)
         for i, button in enumerate(self.buttons):
             button.hovered = button.is_point_inside(x, y)
             if button.hovered and not button.selected:
@@ -306,6 +325,7 @@ class ControlsMenuView(arcade.View):
             return
 
         if button == arcade.MOUSE_BUTTON_LEFT:
+            x, y = render_target.window_to_logical(x, y)
             for btn in self.buttons:
                 if btn.is_point_inside(x, y):
                     btn.on_click()
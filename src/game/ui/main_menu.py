@@ -2,8 +2,9 @@
 import arcade
 from typing import Optional, Callable
 from game.settings import settings
-from game.ui.components.button import Button
-from game.background_renderer import BackgroundRenderer
+from game.ui.components.button import Button, ButtonGroup
+from game.render_target import render_target
+from game.background_renderer import background_cache
 
 
 class MainMenuView(arcade.View):
@@ -13,6 +14,7 @@ class MainMenuView(arcade.View):
         """Initialize main menu."""
         super().__init__()
         self.buttons = []
+        self.button_group: Optional[ButtonGroup] = None
         self.selected_index = 0
         self.title = "PONG"
         self.background_renderer = None
@@ -29,8 +31,8 @@ class MainMenuView(arcade.View):
         start_y = settings.screen_height / 2 - 50
         button_spacing = 70
 
-        # Create background renderer
-        self.background_renderer = BackgroundRenderer(
+        # Shared synthwave background
+        self.background_renderer = background_cache.get(
             settings.screen_width,
             settings.screen_height
         )
@@ -60,65 +62,64 @@ class MainMenuView(arcade.View):
         ]
 
         self.buttons[0].selected = True
+        self.button_group = ButtonGroup(self.buttons)
 
     def on_draw(self) -> None:
         """Draw the menu."""
-        self.clear()
-
-        # Draw synthwave background
-        if self.background_renderer:
-            self.background_renderer.draw()
-
-        # Draw title with neon glow
-        title_color = settings.synthwave_city_windows_cyan
-        glow_color = settings.synthwave_grid_glow
-
-        # Title glow layers
-        for offset, alpha in [(6, 30), (4, 60), (2, 100)]:
+        with render_target.capture():
+            # Draw synthwave background
+            if self.background_renderer:
+                self.background_renderer.draw()
+
+            # Draw title with neon glow
+            title_color = settings.synthwave_city_windows_cyan
+            glow_color = settings.synthwave_grid_glow
+
+            # Title glow layers
+            for offset, alpha in [(6, 30), (4, 60), (2, 100)]:
+                arcade.draw_text(
+                    self.title,
+                    settings.screen_width / 2 + offset,
+                    settings.screen_height - 150 - offset,
+                    (*glow_color, alpha),
+                    font_size=80,
+                    anchor_x="center",
+                    bold=True
+                )
+
+            # Main title
             arcade.draw_text(
                 self.title,
-                settings.screen_width / 2 + offset,
-                settings.screen_height - 150 - offset,
-                (*glow_color, alpha),
+                settings.screen_width / 2,
+                settings.screen_height - 150,
+                title_color,
                 font_size=80,
                 anchor_x="center",
                 bold=True
             )
 
-        # Main title
-        arcade.draw_text(
-            self.title,
-            settings.screen_width / 2,
-            settings.screen_height - 150,
-            title_color,
-            font_size=80,
-            anchor_x="center",
-            bold=True
-        )
+            # Draw subtitle
+            arcade.draw_text(
+                "Synthwave Edition",
+                settings.screen_width / 2,
+                settings.screen_height - 210,
+                settings.synthwave_grid_color,
+                font_size=24,
+                anchor_x="center"
+            )
 
-        # Draw subtitle
-        arcade.draw_text(
-            "Synthwave Edition",
-            settings.screen_width / 2,
-            settings.screen_height - 210,
-            settings.synthwave_grid_color,
-            font_size=24,
-            anchor_x="center"
-        )
+            # Draw buttons
+            self.button_group.draw()
 
-        # Draw buttons
-        for button in self.buttons:
-            button.draw()
-
-        # Draw controls hint
-        arcade.draw_text(
-            "Use Arrow Keys and Enter to select",
-            settings.screen_width / 2,
-            50,
-            settings.synthwave_grid_glow,
-            font_size=14,
-            anchor_x="center"
-        )
+            # Draw controls hint
+            arcade.draw_text(
+                "Use Arrow Keys and Enter to select",
+                settings.screen_width / 2,
+                50,
+                settings.synthwave_grid_glow,
+                font_size=14,
+                anchor_x="center"
+            )
 
     def on_key_press(self, key: int, modifiers: int) -> None:
         """Handle key presses.
@@ -153,6 +154,7 @@ class MainMenuView(arcade.View):
             dx: Change in x
             dy: Change in y
         """
+        x, y = render_target.window_to_logical(x, y)
         for i, button in enumerate(self.buttons):
             button.hovered = button.is_point_inside(x, y)
             if button.hovered and not button.selected:
@@ -170,6 +172,7 @@ class MainMenuView(arcade.View):
             modifiers: Modifier keys held
         """
         if button == arcade.MOUSE_BUTTON_LEFT:
+            x, y = render_target.window_to_logical(x, y)
             for btn in self.buttons:
                 if btn.is_point_inside(x, y):
                     btn.on_click()
@@ -2,7 +2,7 @@
 import arcade
 from typing import Optional, Callable
 from game.settings import settings
-from game.ui.components.button import Button
+from game.ui.components.button import Button, ButtonGroup
 
 
 class PauseMenu:
@@ -11,6 +11,7 @@ class PauseMenu:
     def __init__(self):
         """Initialize pause menu."""
         self.buttons = []
+        self.button_group: Optional[ButtonGroup] = None
         self.selected_index = 0
         self.visible = False
 
@@ -40,6 +41,7 @@ class PauseMenu:
         ]
 
         self.buttons[0].selected = True
+        self.button_group = ButtonGroup(self.buttons)
 
     def show(self) -> None:
         """Show the pause menu."""
@@ -75,8 +77,7 @@ class PauseMenu:
         )
 
         # Draw buttons
-        for button in self.buttons:
-            button.draw()
+        self.button_group.draw()
 
     def handle_key_press(self, key: int) -> bool:
         """Handle key presses.
@@ -2,7 +2,10 @@
 import arcade
 from typing import Optional, Callable, Literal
 from game.settings import settings, update_difficulty_preset, save_settings
-from game.ui.components.button import Button
+from game.ui.components.button import Button, ButtonGroup
+from game.render_target import render_target
+from game.background_renderer import background_cache
+from game.view_registry import view_registry
 
 
 class SettingsMenuView(arcade.View):
@@ -12,7 +15,9 @@ class SettingsMenuView(arcade.View):
         """Initialize settings menu."""
         super().__init__()
         self.buttons = []
+        self.button_group: Optional[ButtonGroup] = None
         self.selected_index = 0
+        self.background_renderer = None
 
         # Callbacks
         self.on_back: Optional[Callable] = None
@@ -31,6 +36,12 @@ class SettingsMenuView(arcade.View):
         start_y = settings.screen_height / 2 + 120
         button_spacing = 70
 
+        # Shared synthwave background
+        self.background_renderer = background_cache.get(
+            settings.screen_width,
+            settings.screen_height
+        )
+
         # Create settings buttons
         self.buttons = [
             Button(
@@ -61,6 +72,7 @@ class SettingsMenuView(arcade.View):
         ]
 
         self.buttons[0].selected = True
+        self.button_group = ButtonGroup(self.buttons)
 
     def _toggle_difficulty(self) -> None:
         """Toggle difficulty setting."""
@@ -87,32 +99,38 @@ class SettingsMenuView(arcade.View):
 
     def _open_controls(self) -> None:
         """Open controls configuration menu."""
-        from game.ui.controls_menu import ControlsMenuView
+        view_registry.show_controls(self)
 
-        controls_view = ControlsMenuView()
-        controls_view.on_back = lambda: self.window.show_view(self)
-        controls_view.setup()
-        self.window.show_view(controls_view)
+    def on_show_view(self) -> None:
+        """Refresh labels for settings changed elsewhere (e.g. F11 in game)."""
+        self.current_difficulty_index = self.difficulty_options.index(
+            settings.difficulty_preset
+        )
+        self.buttons[0].text = f"Difficulty: {settings.difficulty_preset}"
+        self.buttons[1].text = f"Audio: {'ON' if settings.audio_enabled else 'OFF'}"
+        self.buttons[2].text = f"Fullscreen: {'ON' if settings.fullscreen else 'OFF'}"
 
     def on_draw(self) -> None:
         """Draw the menu."""
-        self.clear()
         arcade.set_background_color(settings.background_color)
-
-        # Draw title
-        arcade.draw_text(
-            "SETTINGS",
-            settings.screen_width / 2,
-            settings.screen_height - 150,
-            (0, 255, 255),
-            font_size=60,
-            anchor_x="center",
-            bold=True
-        )
-
-        # Draw buttons
-        for button in self.buttons:
-            button.draw()
+        with render_target.capture():
+            # Draw synthwave background
+            if self.background_renderer:
+                self.background_renderer.draw()
+
+            # Draw title
+            arcade.draw_text(
+                "SETTINGS",
+                settings.screen_width / 2,
+                settings.screen_height - 150,
+                (0, 255, 255),
+                font_size=60,
+                anchor_x="center",
+                bold=True
+            )
+
+            # Draw buttons
+            self.button_group.draw()
 
     def on_key_press(self, key: int, modifiers: int) -> None:
         """Handle key presses.
@@ -150,6 +168,7 @@ class SettingsMenuView(arcade.View):
             dx: Change in x
             dy: Change in y
         """
+        x, y = render_target.window_to_logical(x, y)
         for i, button in enumerate(self.buttons):
             button.hovered = button.is_point_inside(x, y)
             if button.hovered and not button.selected:
@@ -167,6 +186,7 @@ class SettingsMenuView(arcade.View):
             modifiers: Modifier keys held
         """
         if button == arcade.MOUSE_BUTTON_LEFT:
+            x, y = render_target.window_to_logical(x, y)
             for btn in self.buttons:
                 if btn.is_point_inside(x, y):
                     btn.on_click()
@@ -0,0 +1,139 @@
+"""View registry that keeps menus and game views alive between transitions."""
+import arcade
+from typing import Literal, Optional
+from game.audio_manager_pyaudio import PyAudioManager as AudioManager
+
+
+class ViewRegistry:
+    """Creates each view once and reuses it on every later visit.
+
+    Switching between the menus and the game only resets view state, so
+    transitions allocate nothing and load no assets, and memory stays flat
+    however long the game runs. The audio manager is shared by all game
+    views and only shut down when the game exits.
+    """
+
+    def __init__(self):
+        """Initialize empty registry (views are created on first use)."""
+        self._main_menu = None
+        self._settings_menu = None
+        self._controls_menu = None
+        self._games: dict[str, arcade.View] = {}
+        self._audio_manager: Optional[AudioManager] = None
+
+    @property
+    def audio_manager(self) -> AudioManager:
+        """Shared audio manager, created on first use."""
+        if self._audio_manager is None:
+            self._audio_manager = AudioManager()
+        return self._audio_manager
+
+    def main_menu(self):
+        """Get the main menu view.
+
+        Returns:
+            Main menu view
+        """
+        if self._main_menu is None:
+            from game.ui.main_menu import MainMenuView
+
+            menu = MainMenuView()
+            menu.setup()
+            menu.on_single_player = lambda: self.show_game("single")
+            menu.on_two_player = lambda: self.show_game("two_player")
+            menu.on_settings = lambda: self.show_settings(menu)
+            menu.on_quit = lambda: arcade.get_window().close()
+            self._main_menu = menu
+        return self._main_menu
+
+    def settings_menu(self):
+        """Get the settings menu view.
+
+        Returns:
+            Settings menu view
+        """
+        if self._settings_menu is None:
+            from game.ui.settings_menu import SettingsMenuView
+
+            self._settings_menu = SettingsMenuView()
+            self._settings_menu.setup()
+        return self._settings_menu
+
+    def controls_menu(self):
+        """Get the controls menu view.
+
+        Returns:
+            Controls menu view
+        """
+        if self._controls_menu is None:
+            from game.ui.controls_menu import ControlsMenuView
+
+            self._controls_menu = ControlsMenuView()
+            self._controls_menu.setup()
+        return self._controls_menu
+
+    def game(self, mode: Literal["single", "two_player"]):
+        """Get the game view for a mode.
+
+        Args:
+            mode: "single" or "two_player"
+
+        Returns:
+            Game view
+        """
+        if mode not in self._games:
+            from game.pong_window import PongGameView
+
+            self._games[mode] = PongGameView(mode)
+        return self._games[mode]
+
+    def show_main_menu(self) -> None:
+        """Show the main menu."""
+        arcade.get_window().show_view(self.main_menu())
+
+    def show_game(self, mode: Literal["single", "two_player"]) -> None:
+        """Start a new match and show the game.
+
+        Args:
+            mode: "single" or "two_player"
+        """
+        game_view = self.game(mode)
+        game_view.setup()
+        arcade.get_window().show_view(game_view)
+
+    def show_settings(self, return_view: arcade.View) -> None:
+        """Show the settings menu.
+
+        Args:
+            return_view: View to return to when leaving the settings
+        """
+        settings_view = self.settings_menu()
+        settings_view.on_back = lambda: arcade.get_window().show_view(return_view)
+        arcade.get_window().show_view(settings_view)
+
+    def show_controls(self, return_view: arcade.View) -> None:
+        """Show the controls menu.
+
+        Args:
+            return_view: View to return to when leaving the controls menu
+        """
+        controls_view = self.controls_menu()
+        controls_view.on_back = lambda: arcade.get_window().show_view(return_view)
+        arcade.get_window().show_view(controls_view)
+
+    def shutdown(self, window: arcade.Window) -> None:
+        """Let the current view clean up and release audio resources.
+
+        Args:
+            window: Game window (may already be closed)
+        """
+        if window.current_view:
+            window.current_view.on_hide_view()
+
+        if self._audio_manager is not None:
+            self._audio_manager.cleanup()
+            self._audio_manager = None
+
+
+# Global view registry
+view_registry = ViewRegistry()
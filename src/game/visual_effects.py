@@ -1,9 +1,14 @@
 """Visual effects system for glow, trails, and synthwave aesthetics."""
 import arcade
 import math
+import numpy as np
+from arcade.gl import BufferDescription
 from collections import deque
-from typing import Deque
+from functools import lru_cache
+from itertools import islice
+from typing import Deque, Optional
 from game.settings import settings
+from game.quality import quality
 
 
 class GlowEffect:
@@ -39,7 +44,8 @@ class GlowEffect:
             (radius * 1.2, 150 * adjusted_intensity)
         ]
 
-        for layer_radius, alpha in glow_layers:
+        # Drop the outermost layers first when quality is reduced
+        for layer_radius, alpha in glow_layers[len(glow_layers) - quality.glow_layers:]:
             color_with_alpha = (*glow_color, int(alpha))
             arcade.draw_circle_filled(
                 center_x, center_y,
@@ -82,7 +88,8 @@ class GlowEffect:
             (width + 5, height + 5, 150 * adjusted_intensity)
         ]
 
-        for layer_width, layer_height, alpha in glow_layers:
+        # Drop the outermost layers first when quality is reduced
+        for layer_width, layer_height, alpha in glow_layers[len(glow_layers) - quality.glow_layers:]:
             color_with_alpha = (*glow_color, int(alpha))
             rect = arcade.types.XYWH(center_x, center_y, layer_width, layer_height)
             arcade.draw.draw_rect_filled(rect, color_with_alpha)
@@ -96,8 +103,50 @@ class GlowEffect:
         arcade.draw.draw_rect_outline(core_rect, edge_highlight, border_width=2)
 
 
+# Texture radius used for trail sprites; segments are scaled from this size
+_TRAIL_TEXTURE_RADIUS = 32
+
+
+@lru_cache(maxsize=64)
+def _trail_ramp(
+    length: int,
+    core_color: tuple[int, int, int],
+    trail_color: tuple[int, int, int]
+) -> tuple[tuple[tuple[int, int, int, int], float], ...]:
+    """Compute the per-segment color and size ramp for a motion trail.
+
+    Args:
+        length: Number of segments currently in the trail
+        core_color: Color of most recent segment
+        trail_color: Color of older segments
+
+    Returns:
+        Tuple of ((r, g, b, a), radius_factor) pairs from oldest to newest
+    """
+    ramp = []
+    for i in range(length):
+        # Calculate fade factor (older = more transparent)
+        age_ratio = i / length
+        alpha = int(200 * age_ratio)  # 0 to 200 opacity
+
+        # Interpolate between trail color and core color
+        r = int(trail_color[0] + (core_color[0] - trail_color[0]) * age_ratio)
+        g = int(trail_color[1] + (core_color[1] - trail_color[1]) * age_ratio)
+        b = int(trail_color[2] + (core_color[2] - trail_color[2]) * age_ratio)
+
+        # Scale radius based on age (older = smaller)
+        ramp.append(((r, g, b, alpha), 0.5 + 0.5 * age_ratio))
+    return tuple(ramp)
+
+
 class MotionTrail:
-    """Manages motion blur trail effect for moving objects."""
+    """Manages motion blur trail effect for moving objects.
+
+    Trail segments are preallocated sprites in a single sprite list, so the
+    whole trail is submitted as one batched draw. Segment colors and sizes
+    only change when the trail length or colors change; every other frame
+    just repositions the sprites in place.
+    """
 
     def __init__(self, max_length: int = 15):
         """Initialize motion trail.
@@ -108,6 +157,11 @@ class MotionTrail:
         self.max_length = max_length
         self.positions: Deque[tuple[float, float]] = deque(maxlen=max_length)
 
+        # Batched rendering state (created lazily on first draw)
+        self._sprite_list: Optional[arcade.SpriteList] = None
+        self._sprites: list[arcade.Sprite] = []
+        self._ramp_key: Optional[tuple] = None
+
     def update(self, x: float, y: float) -> None:
         """Update trail with new position.
 
@@ -117,6 +171,44 @@ class MotionTrail:
         """
         self.positions.append((x, y))
 
+    def _build_sprites(self) -> None:
+        """Preallocate one sprite per trail segment."""
+        self._sprite_list = arcade.SpriteList(capacity=self.max_length, lazy=True)
+        self._sprites = [
+            arcade.SpriteCircle(_TRAIL_TEXTURE_RADIUS, arcade.color.WHITE)
+            for _ in range(self.max_length)
+        ]
+        for sprite in self._sprites:
+            sprite.visible = False
+            self._sprite_list.append(sprite)
+
+    def _apply_ramp(
+        self,
+        length: int,
+        radius: float,
+        core_color: tuple[int, int, int],
+        trail_color: tuple[int, int, int]
+    ) -> None:
+        """Recolor and resize the segment sprites for the current trail length.
+
+        Args:
+            length: Number of segments currently in the trail
+            radius: Base radius of trail segments
+            core_color: Color of most recent segment
+            trail_color: Color of older segments
+        """
+        ramp = _trail_ramp(length, tuple(core_color), tuple(trail_color))
+        base_scale = radius / _TRAIL_TEXTURE_RADIUS
+
+        for i, sprite in enumerate(self._sprites):
+            if i < length:
+                color, radius_factor = ramp[i]
+                sprite.color = color
+                sprite.scale = base_scale * radius_factor
+                sprite.visible = True
+            else:
+                sprite.visible = False
+
     def draw(
         self,
         radius: float,
@@ -130,70 +222,238 @@ class MotionTrail:
             core_color: Color of most recent segment
             trail_color: Color of older segments
         """
-        if not settings.motion_blur_enabled or len(self.positions) < 2:
+        # Reduced quality draws only the most recent part of the trail
+        max_segments = int(self.max_length * quality.trail_fraction)
+        length = min(len(self.positions), max_segments)
+        if not settings.motion_blur_enabled or length < 2:
             return
 
-        # Draw trail segments from oldest to newest
-        for i, (x, y) in enumerate(self.positions):
-            # Calculate fade factor (older = more transparent)
-            age_ratio = i / len(self.positions)
-            alpha = int(200 * age_ratio)  # 0 to 200 opacity
+        if self._sprite_list is None:
+            self._build_sprites()
 
-            # Interpolate between trail color and core color
-            r = int(trail_color[0] + (core_color[0] - trail_color[0]) * age_ratio)
-            g = int(trail_color[1] + (core_color[1] - trail_color[1]) * age_ratio)
-            b = int(trail_color[2] + (core_color[2] - trail_color[2]) * age_ratio)
+        # Only touch colors/sizes when the ramp actually changes
+        ramp_key = (length, radius, core_color, trail_color)
+        if ramp_key != self._ramp_key:
+            self._apply_ramp(length, radius, core_color, trail_color)
+            self._ramp_key = ramp_key
 
-            # Scale radius based on age (older = smaller)
-            segment_radius = radius * (0.5 + 0.5 * age_ratio)
+        # Reposition segments from oldest to newest
+        positions = islice(self.positions, len(self.positions) - length, None)
+        for sprite, position in zip(self._sprites, positions):
+            sprite.position = position
 
-            # Draw trail segment
-            arcade.draw_circle_filled(
-                x, y,
-                segment_radius,
-                (*((r, g, b)), alpha)
-            )
+        self._sprite_list.draw()
 
     def clear(self) -> None:
         """Clear all trail positions."""
         self.positions.clear()
 
 
+_PARTICLE_VERTEX_SHADER = """
+#version 330
+
+in vec2 in_pos;
+in float in_size;
+in vec4 in_color;
+
+out float v_size;
+out vec4 v_color;
+
+void main() {
+    gl_Position = vec4(in_pos, 0.0, 1.0);
+    v_size = in_size;
+    v_color = in_color;
+}
+"""
+
+_PARTICLE_GEOMETRY_SHADER = """
+#version 330
+
+uniform WindowBlock {
+    mat4 projection;
+    mat4 view;
+} window;
+
+layout (points) in;
+layout (triangle_strip, max_vertices = 4) out;
+
+in float v_size[];
+in vec4 v_color[];
+
+out vec2 uv;
+out vec4 color;
+
+void main() {
+    vec2 center = gl_in[0].gl_Position.xy;
+    float size = v_size[0];
+    mat4 mvp = window.projection * window.view;
+
+    color = v_color[0];
+    gl_Position = mvp * vec4(center + vec2(-size,  size), 0.0, 1.0);
+    uv = vec2(-1.0,  1.0);
+    EmitVertex();
+
+    gl_Position = mvp * vec4(center + vec2(-size, -size), 0.0, 1.0);
+    uv = vec2(-1.0, -1.0);
+    EmitVertex();
+
+    gl_Position = mvp * vec4(center + vec2( size,  size), 0.0, 1.0);
+    uv = vec2( 1.0,  1.0);
+    EmitVertex();
+
+    gl_Position = mvp * vec4(center + vec2( size, -size), 0.0, 1.0);
+    uv = vec2( 1.0, -1.0);
+    EmitVertex();
+    EndPrimitive();
+}
+"""
+
+_PARTICLE_FRAGMENT_SHADER = """
+#version 330
+
+in vec2 uv;
+in vec4 color;
+
+out vec4 fragColor;
+
+void main() {
+    float dist = length(uv);
+    if (dist > 1.0) discard;
+    fragColor = vec4(color.rgb, color.a * smoothstep(1.0, 0.85, dist));
+}
+"""
+
+
 class ParticleEffect:
-    """Simple particle system for impact effects."""
+    """Fixed-capacity pooled particle system for impact effects.
+
+    Particles are stored as NumPy struct-of-arrays with live particles
+    packed at the front of the pool. Updates are vectorized, dead particles
+    are compacted by moving the last live particles into their slots, and
+    the whole pool is drawn with a single batched draw call.
+    """
+
+    # Initial palette slots; the palette grows only when every slot is on screen
+    PALETTE_SIZE = 32
 
-    def __init__(self):
-        """Initialize particle system."""
-        self.particles: list[dict] = []
+    def __init__(self, capacity: int = 4096, drag: float = 0.95, decay_rate: float = 2.0):
+        """Initialize particle system.
+
+        Args:
+            capacity: Maximum number of live particles
+            drag: Velocity multiplier applied every update
+            decay_rate: Life lost per second (1.0 = full life)
+        """
+        self.capacity = capacity
+        self.drag = drag
+        self.decay_rate = decay_rate
+        self.count = 0
+
+        # Struct-of-arrays particle storage
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)  # 1.0 = full life, 0.0 = dead
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.color_index = np.zeros(capacity, dtype=np.uint8)
+
+        # Color palette shared by all particles (normalized RGB)
+        self.palette = np.zeros((self.PALETTE_SIZE, 3), dtype=np.float32)
+        self._palette_lookup: dict[tuple[int, int, int], int] = {}  # Least recently used first
+
+        # Interleaved vertex data: x, y, size, r, g, b, a
+        self._vertex_data = np.zeros((capacity, 7), dtype=np.float32)
+
+        # GPU resources (created lazily on first draw)
+        self._program = None
+        self._buffer = None
+        self._geometry = None
+
+    def __len__(self) -> int:
+        """Return the number of live particles."""
+        return self.count
+
+    def _get_color_index(self, color: tuple[int, int, int]) -> int:
+        """Get (or register) the palette index for a color.
+
+        Args:
+            color: RGB color
+
+        Returns:
+            Palette index for the color
+        """
+        color = tuple(color[:3])
+        index = self._palette_lookup.pop(color, None)
+        if index is None:
+            index = self._free_palette_slot()
+            self.palette[index] = np.array(color, dtype=np.float32) / 255.0
+        self._palette_lookup[color] = index  # Now the most recently used
+        return index
+
+    def _free_palette_slot(self) -> int:
+        """Find a palette slot for a new color.
+
+        Uses an unassigned slot, then the least recently used color that no
+        live particle shows, and only grows the palette when every color is
+        on screen, so a live particle never changes color.
+
+        Returns:
+            Free palette index
+        """
+        assigned = len(self._palette_lookup)
+        if assigned < len(self.palette):
+            return assigned
+
+        on_screen = np.zeros(len(self.palette), dtype=bool)
+        on_screen[self.color_index[:self.count]] = True
+        for color, index in self._palette_lookup.items():
+            if not on_screen[index]:
+                del self._palette_lookup[color]
+                return index
+
+        self.palette = np.concatenate((self.palette, np.zeros_like(self.palette)))
+        if len(self.palette) > np.iinfo(self.color_index.dtype).max + 1:
+            self.color_index = self.color_index.astype(np.uint16)
+        return assigned
 
     def emit_burst(
         self,
         x: float,
         y: float,
         color: tuple[int, int, int],
-        count: int = 8
+        count: int = 8,
+        speed: float = 3.0,
+        size: float = 3.0
     ) -> None:
         """Emit a burst of particles.
 
+        Particles that do not fit in the pool are dropped.
+
         Args:
             x: Emission position x
             y: Emission position y
             color: Particle color
             count: Number of particles
+            speed: Initial particle speed
+            size: Initial particle radius
         """
-        for i in range(count):
-            angle = (2 * math.pi * i) / count
-            speed = 3.0
-
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'color': color,
-                'life': 1.0,  # 1.0 = full life, 0.0 = dead
-                'size': 3.0
-            })
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return
+
+        start = self.count
+        end = start + count
+        angles = np.arange(count, dtype=np.float32) * (2 * math.pi / count)
+
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = np.cos(angles) * speed
+        self.vy[start:end] = np.sin(angles) * speed
+        self.life[start:end] = 1.0
+        self.size[start:end] = size
+        self.color_index[start:end] = self._get_color_index(color)
+        self.count = end
 
     def update(self, delta_time: float) -> None:
         """Update particle positions and lifetimes.
@@ -201,32 +461,80 @@ class ParticleEffect:
         Args:
             delta_time: Time since last update
         """
-        for particle in self.particles[:]:
-            # Update position
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
+        n = self.count
+        if n == 0:
+            return
+
+        # Update position
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+
+        # Apply drag
+        self.vx[:n] *= self.drag
+        self.vy[:n] *= self.drag
+
+        # Decrease life
+        self.life[:n] -= delta_time * self.decay_rate
+
+        self._compact()
+
+    def _compact(self) -> None:
+        """Remove dead particles by moving the last live particles into their slots."""
+        n = self.count
+        dead = np.flatnonzero(self.life[:n] <= 0)
+        if dead.size == 0:
+            return
+
+        new_count = n - dead.size
 
-            # Apply drag
-            particle['vx'] *= 0.95
-            particle['vy'] *= 0.95
+        # Holes inside the surviving range are filled from the live tail
+        holes = dead[dead < new_count]
+        if holes.size:
+            tail = np.arange(new_count, n)
+            movers = tail[self.life[new_count:n] > 0]
+            for array in (self.x, self.y, self.vx, self.vy, self.life, self.size, self.color_index):
+                array[holes] = array[movers]
 
-            # Decrease life
-            particle['life'] -= delta_time * 2.0
+        self.count = new_count
 
-            # Remove dead particles
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+    def clear(self) -> None:
+        """Remove all particles."""
+        self.count = 0
+
+    def _create_gpu_resources(self) -> None:
+        """Create the shader program and vertex buffer for batched drawing."""
+        ctx = arcade.get_window().ctx
+        self._program = ctx.program(
+            vertex_shader=_PARTICLE_VERTEX_SHADER,
+            geometry_shader=_PARTICLE_GEOMETRY_SHADER,
+            fragment_shader=_PARTICLE_FRAGMENT_SHADER
+        )
+        self._buffer = ctx.buffer(reserve=self._vertex_data.nbytes)
+        self._geometry = ctx.geometry(
+            [BufferDescription(self._buffer, "2f 1f 4f", ["in_pos", "in_size", "in_color"])],
+            mode=ctx.POINTS
+        )
 
     def draw(self) -> None:
-        """Draw all active particles."""
-        for particle in self.particles:
-            alpha = int(255 * particle['life'])
-            size = particle['size'] * particle['life']
-            color = (*particle['color'], alpha)
+        """Draw all active particles in one batched draw call."""
+        n = self.count
+        if n == 0:
+            return
 
-            arcade.draw_circle_filled(
-                particle['x'],
-                particle['y'],
-                size,
-                color
-            )
+        if self._geometry is None:
+            self._create_gpu_resources()
+
+        life = self.life[:n]
+        vertices = self._vertex_data[:n]
+        vertices[:, 0] = self.x[:n]
+        vertices[:, 1] = self.y[:n]
+        vertices[:, 2] = self.size[:n] * life
+        vertices[:, 3:6] = self.palette[self.color_index[:n]]
+        vertices[:, 6] = life
+
+        self._buffer.write(vertices)
+
+        # Arcade only enables blending around its own draw calls
+        ctx = self._program.ctx
+        with ctx.enabled(ctx.BLEND):
+            self._geometry.render(self._program, vertices=n)
@@ -1,59 +1,69 @@
 """Main entry point for the Pong game."""
+import argparse
 import arcade
+import pyglet
 from game.settings import settings
-from game.ui.main_menu import MainMenuView
-from game.ui.settings_menu import SettingsMenuView
-from game.pong_window import PongGameView
+from game.audio_assets import asset_registry
+from game.audio_backends import CaptureBackend
+from game.frame_pacing import frame_pacer
+from game.view_registry import view_registry
 
 
 def main() -> None:
     """Run the Pong game."""
+    parser = argparse.ArgumentParser(description=settings.screen_title)
+    parser.add_argument(
+        "--record-inputs",
+        metavar="DIR",
+        help="Record each match's inputs to DIR for replay with game.capture"
+    )
+    parser.add_argument(
+        "--frame-pacing",
+        choices=["vsync", "uncapped", "capped"],
+        help="Frame pacing mode for this run (defaults to the saved setting)"
+    )
+    parser.add_argument(
+        "--audio-backend",
+        choices=["pyaudio", "null", "capture"],
+        help="Audio output for this run; null and capture play the game without a sound device"
+    )
+    args = parser.parse_args()
+    if args.record_inputs:
+        settings.input_log_dir = args.record_inputs
+    if args.audio_backend:
+        settings.audio_backend = args.audio_backend
+
+    # Rebuild any missing or outdated sound files while the menu loads
+    asset_registry.start()
+
     # Create window
     window = arcade.Window(
         settings.screen_width,
         settings.screen_height,
         settings.screen_title,
-        resizable=True,
-        update_rate=1 / settings.target_fps
+        resizable=True
     )
+    frame_pacer.install(window, args.frame_pacing)
 
-    # Create main menu
-    menu = MainMenuView()
-
-    # Set up menu callbacks
-    def start_single_player() -> None:
-        """Start single player game."""
-        game_view = PongGameView("single")
-        game_view.setup()
-        window.show_view(game_view)
-
-    def start_two_player() -> None:
-        """Start two player game."""
-        game_view = PongGameView("two_player")
-        game_view.setup()
-        window.show_view(game_view)
-
-    def show_settings() -> None:
-        """Show settings menu."""
-        settings_view = SettingsMenuView()
-        settings_view.on_back = lambda: window.show_view(menu)
-        settings_view.setup()
-        window.show_view(settings_view)
-
-    def quit_game() -> None:
-        """Quit the game."""
-        window.close()
-
-    menu.on_single_player = start_single_player
-    menu.on_two_player = start_two_player
-    menu.on_settings = show_settings
-    menu.on_quit = quit_game
+    # Without a device pulling blocks, render captured audio as the game runs
+    capture = view_registry.audio_manager.backend
+    if isinstance(capture, CaptureBackend):
+        capture.keep_audio = False
+        pyglet.clock.schedule(capture.advance)
 
     # Show menu and run
-    menu.setup()
-    window.show_view(menu)
+    view_registry.show_main_menu()
     arcade.run()
 
+    # Let the last view clean up (e.g. save a match still being recorded)
+    view_registry.shutdown(window)
+
+    report = frame_pacer.report()
+    if report:
+        print(f"[PACING] {report}")
+    if isinstance(capture, CaptureBackend):
+        print(f"[AUDIO] {capture.report()}")
+
 
 if __name__ == "__main__":
     main()
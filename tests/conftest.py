@@ -1,7 +1,16 @@
 """Pytest configuration and fixtures."""
 import sys
+import pytest
 from pathlib import Path
 
 # Add src directory to Python path
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
+
+
+@pytest.fixture(autouse=True)
+def null_audio(monkeypatch):
+    """Run every test without a sound device (game views get the null backend)."""
+    from game.settings import settings
+
+    monkeypatch.setattr(settings, "audio_backend", "null")
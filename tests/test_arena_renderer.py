@@ -0,0 +1,59 @@
+"""Unit tests for the cached arena decorations."""
+import arcade
+import pytest
+from game.arena_renderer import ArenaRenderer
+from game.settings import settings
+
+
+@pytest.fixture
+def window():
+    """Create a window for testing."""
+    window = arcade.Window(800, 600, "Test")
+    yield window
+    window.close()
+
+
+@pytest.fixture
+def renderer(window):
+    """Create an arena renderer that has drawn once."""
+    renderer = ArenaRenderer()
+    renderer.draw(800, 600)
+    return renderer
+
+
+def test_shape_list_built_once(renderer):
+    """Test repeated draws reuse the cached shape list."""
+    shape_list = renderer.shape_list
+    for _ in range(5):
+        renderer.draw(800, 600)
+
+    assert renderer.builds == 1
+    assert renderer.shape_list is shape_list
+
+
+def test_rebuilt_for_new_size(renderer):
+    """Test a different arena size rebuilds the decorations."""
+    renderer.draw(1280, 720)
+
+    assert renderer.builds == 2
+
+
+def test_rebuilt_when_theme_changes(renderer, monkeypatch):
+    """Test changing a decoration color rebuilds the decorations."""
+    monkeypatch.setattr(settings, "center_line_color", (1, 2, 3))
+    renderer.draw(800, 600)
+    assert renderer.builds == 2
+
+    monkeypatch.setattr(settings, "synthwave_grid_color", (4, 5, 6))
+    renderer.draw(800, 600)
+    assert renderer.builds == 3
+
+
+def test_border_setting_changes_shapes(renderer, monkeypatch):
+    """Test toggling the border rebuilds with or without the border lines."""
+    monkeypatch.setattr(settings, "arena_border_enabled", not settings.arena_border_enabled)
+    before = len(renderer.shape_list)
+    renderer.draw(800, 600)
+
+    assert renderer.builds == 2
+    assert abs(len(renderer.shape_list) - before) == 2
@@ -0,0 +1,89 @@
+"""Unit tests for the generated audio asset registry."""
+import json
+import pytest
+from game.audio_assets import AssetRegistry, GeneratedAsset, MANIFEST_NAME
+
+calls = []
+
+
+def write_tone(filename: str, level: int = 1) -> None:
+    """Stand-in generator writing its parameter to the file."""
+    calls.append(level)
+    with open(filename, "w") as f:
+        f.write(str(level))
+
+
+@pytest.fixture
+def registry(tmp_path):
+    """Create a registry with one asset in a temporary directory."""
+    calls.clear()
+    registry = AssetRegistry(tmp_path)
+    registry.register(GeneratedAsset("tone", "tone.wav", write_tone, level=1))
+    return registry
+
+
+def test_missing_asset_is_generated_and_recorded(registry):
+    """Test a missing file is generated and its key saved."""
+    assert registry.stale() == ["tone"]
+    assert registry.refresh() == ["tone"]
+
+    assert registry.path("tone").read_text() == "1"
+    manifest = json.loads((registry.directory / MANIFEST_NAME).read_text())
+    assert manifest == {"tone": registry.assets["tone"].key()}
+    assert registry.stale() == []
+
+
+def test_unchanged_asset_is_not_regenerated(registry):
+    """Test an up-to-date file is left alone."""
+    registry.refresh()
+    registry.refresh()
+
+    assert calls == [1]
+
+
+def test_parameter_change_marks_asset_stale(registry):
+    """Test tweaking a parameter regenerates the file."""
+    registry.refresh()
+    registry.register(GeneratedAsset("tone", "tone.wav", write_tone, level=2))
+
+    assert registry.stale() == ["tone"]
+    registry.refresh()
+    assert registry.path("tone").read_text() == "2"
+
+
+def test_deleted_asset_is_regenerated(registry):
+    """Test a deleted file is stale even with a matching key."""
+    registry.refresh()
+    registry.path("tone").unlink()
+
+    assert registry.stale() == ["tone"]
+
+
+def test_start_regenerates_in_background(registry):
+    """Test start hands stale assets to a worker and wait blocks until ready."""
+    registry.start()
+    path = registry.wait("tone", timeout=5)
+
+    assert path.read_text() == "1"
+    assert registry.regenerated == ["tone"]
+
+
+def test_start_skips_worker_when_fresh(registry):
+    """Test nothing runs in the background when every asset is current."""
+    registry.refresh()
+    registry.start()
+
+    assert registry._worker is None
+    assert registry.wait("tone") == registry.path("tone")
+
+
+def test_failed_generation_does_not_block_loaders(registry):
+    """Test a generator error still releases waiting loaders."""
+    def broken(filename: str) -> None:
+        raise RuntimeError("boom")
+
+    registry.register(GeneratedAsset("broken", "broken.wav", broken))
+    registry.start()
+
+    assert not registry.wait("broken", timeout=5).exists()
+    assert "broken" not in registry.regenerated
@@ -0,0 +1,126 @@
+"""Unit tests for the null and capture audio backends."""
+import arcade
+import numpy as np
+import pytest
+from game.audio_backends import CaptureBackend, NullBackend, PYAUDIO_AVAILABLE, create_backend
+from game.audio_manager_pyaudio import PyAudioManager
+from game.audio_mixer import MAX_PENDING
+from game.pong_window import PongGameView
+from game.settings import settings
+from game.view_registry import view_registry
+
+TICK = 1 / 120
+
+
+@pytest.fixture(autouse=True)
+def audio_on(monkeypatch):
+    """Enable audio whatever the saved settings say."""
+    monkeypatch.setattr(settings, "audio_enabled", True)
+
+
+@pytest.fixture
+def capture():
+    """Create an audio manager rendering into memory."""
+    manager = PyAudioManager(CaptureBackend())
+    yield manager.backend
+    manager.cleanup()
+
+
+def test_capture_records_when_sounds_start():
+    """Test sounds are logged at the block a device would have started them in."""
+    backend = CaptureBackend(block_frames=441)
+    manager = PyAudioManager(backend)
+    manager.play_bounce()
+    backend.advance(0.1)
+    manager.play_score()
+    backend.advance(0.1)
+    manager.cleanup()
+
+    assert [name for _, name in backend.events] == ["paddle_hit", "score"]
+    assert backend.fired("paddle_hit") == [0.0]
+    assert backend.fired("score") == [pytest.approx(0.1)]
+    assert backend.time == pytest.approx(0.2)
+
+
+def test_capture_renders_the_mix(capture):
+    """Test captured audio holds the sound and silence once it ends."""
+    capture.mixer.play("tone", np.full(1000, 1234, dtype=np.int16))
+    capture.advance(1.0)
+    audio = capture.samples()
+
+    assert len(audio) == capture.frames * capture.channels >= capture.sample_rate
+    assert audio[0] == 1234 and audio[999] == 1234
+    assert not audio[1000:].any()
+
+
+def test_capture_measures_mixer_cpu(capture):
+    """Test render time is accounted against the audio time rendered."""
+    assert capture.cpu_load() == 0.0
+    capture.mixer.play_music("music", np.ones(5000, dtype=np.int16))
+    capture.advance(0.5)
+
+    assert capture.render_seconds > 0
+    assert 0 < capture.cpu_load() < 1
+    assert "mixer CPU" in capture.report()
+
+
+def test_capture_without_keeping_audio():
+    """Test a long-running capture can keep only events and timing."""
+    backend = CaptureBackend(keep_audio=False)
+    manager = PyAudioManager(backend)
+    manager.play_score()
+    backend.advance(0.5)
+    manager.cleanup()
+
+    assert backend.fired("score") == [0.0]
+    assert backend.blocks == [] and backend.time >= 0.5
+
+
+def test_null_backend_discards_audio():
+    """Test the null backend keeps the manager enabled and never renders."""
+    manager = PyAudioManager(NullBackend())
+    for index in range(MAX_PENDING * 2):
+        manager.mixer.play(f"tone{index}", np.ones(10, dtype=np.int16))
+
+    assert manager.enabled
+    assert manager.mixer.blocks_rendered == 0
+    assert len(manager.mixer._pending) == MAX_PENDING
+    manager.cleanup()
+    assert not manager.backend.is_open
+
+
+def test_backend_by_name():
+    """Test backends are created from the setting's names."""
+    assert isinstance(create_backend("null"), NullBackend)
+    assert isinstance(create_backend("capture"), CaptureBackend)
+    if not PYAUDIO_AVAILABLE:
+        assert create_backend("pyaudio") is None
+
+
+def test_game_loop_with_captured_audio(monkeypatch):
+    """Test a match plays its sounds at the right times without a sound device."""
+    monkeypatch.setattr(settings, "audio_backend", "capture")
+    monkeypatch.setattr(view_registry, "_audio_manager", None)
+    window = arcade.Window(800, 600, "Test")
+    view = PongGameView("two_player")
+    view.setup()
+    capture = view.audio_manager.backend
+
+    view._launch_delay = 0.0
+    view.ball.center_x = settings.screen_width - 100
+    view.ball.velocity_x = 10.0
+    view.ball.velocity_y = 0.0
+    view.paddle_right.center_y = 100
+    while view.score_left == 0:
+        view.on_update(TICK)
+        capture.advance(TICK)
+    goal_time = capture.time
+    capture.advance(TICK)
+    view.audio_manager.cleanup()
+    window.close()
+
+    assert isinstance(capture, CaptureBackend)
+    assert capture.fired("game_start") == [0.0]
+    assert capture.fired("background_music") == [0.0]
+    assert capture.fired("score") == [pytest.approx(goal_time, abs=capture.block_frames / capture.sample_rate)]
+    assert capture.samples().any()
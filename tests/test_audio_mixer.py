@@ -0,0 +1,237 @@
+"""Unit tests for the software audio mixer."""
+import numpy as np
+import pytest
+from game.audio_mixer import Mixer, ScaledBufferCache, STREAM_CONTINUE, scale_samples
+
+
+def tone(value, length):
+    """Create a constant int16 buffer."""
+    return np.full(length, value, dtype=np.int16)
+
+
+def samples(data):
+    """Decode rendered PCM bytes."""
+    return np.frombuffer(data, dtype=np.int16)
+
+
+@pytest.fixture
+def mixer():
+    """Create a mixer."""
+    return Mixer()
+
+
+def test_silence_without_voices(mixer):
+    """Test an idle mixer renders a silent block of the requested size."""
+    block = samples(mixer.render(256))
+
+    assert len(block) == 256
+    assert not block.any()
+
+
+def test_voices_are_summed(mixer):
+    """Test overlapping sounds are mixed together."""
+    mixer.play("a", tone(1000, 100))
+    mixer.play("b", tone(500, 50))
+    block = samples(mixer.render(128))
+
+    assert block[0] == 1500
+    assert block[60] == 1000
+    assert block[110] == 0
+
+
+def test_mix_saturates(mixer):
+    """Test loud overlaps clip instead of wrapping around."""
+    mixer.play("a", tone(30000, 10))
+    mixer.play("b", tone(30000, 10))
+    mixer.play("c", tone(-30000, 20))
+    block = samples(mixer.render(20))
+
+    assert block[0] == 30000
+    assert block[15] == -30000
+
+    mixer.play("d", tone(30000, 10))
+    mixer.play("e", tone(30000, 10))
+    assert samples(mixer.render(10))[0] == 32767
+
+
+def test_voice_continues_across_blocks(mixer):
+    """Test a sound longer than a block plays to the end and is released."""
+    mixer.play("a", np.arange(300, dtype=np.int16))
+    first = samples(mixer.render(256))
+    second = samples(mixer.render(256))
+
+    assert first[255] == 255
+    assert second[0] == 256 and second[43] == 299 and second[44] == 0
+    assert mixer.voices == []
+
+
+def test_stop_all(mixer):
+    """Test stopping silences playing and queued voices."""
+    mixer.play("a", tone(1000, 1000))
+    mixer.render(10)
+    mixer.play("b", tone(1000, 1000))
+    mixer.stop_all()
+
+    assert not samples(mixer.render(10)).any()
+
+
+def test_stream_callback_keeps_stream_running(mixer):
+    """Test the stream callback returns a block and the continue flag."""
+    data, flag = mixer.stream_callback(None, 64, {}, 0)
+
+    assert len(data) == 64 * 2
+    assert flag == STREAM_CONTINUE
+
+
+def test_trigger_latency_measured(mixer):
+    """Test the time from trigger to playback is recorded."""
+    assert mixer.latency_stats() == {}
+    mixer.play("a", tone(1, 10))
+    mixer.render(441)
+
+    stats = mixer.latency_stats()
+    assert 0 <= stats["trigger_ms"] <= stats["max_trigger_ms"]
+    assert stats["block_ms"] == pytest.approx(20.0)
+
+
+def test_scale_samples():
+    """Test scaling halves, silences and saturates int16 samples."""
+    data = np.array([1000, -1000, 30000], dtype=np.int16)
+
+    assert list(scale_samples(data, 0.5)) == [500, -500, 15000]
+    assert not scale_samples(data, 0.0).any()
+    assert scale_samples(data, 2.0)[2] == 32767
+
+
+def test_voice_bus_and_master_gain(mixer):
+    """Test voice, bus and master gains multiply together."""
+    mixer.play("a", tone(1000, 10), gain=0.5)
+    mixer.play("b", tone(1000, 10), bus="music")
+    mixer.bus_gains["music"] = 0.25
+    mixer.master_gain = 0.5
+    block = samples(mixer.render(10))
+
+    assert block[0] == 250 + 125
+
+
+def test_muted_voice_still_advances(mixer):
+    """Test a voice at zero gain stays silent and finishes on time."""
+    mixer.master_gain = 0.0
+    mixer.play("a", tone(1000, 100))
+
+    assert not samples(mixer.render(100)).any()
+    assert mixer.voices == []
+
+
+def test_scaled_buffer_cache_reuses_buffers():
+    """Test repeated levels hit the cache and unity returns the original."""
+    cache = ScaledBufferCache()
+    data = tone(1000, 10)
+
+    assert cache.get("a", data, 1.0) is data
+    first = cache.get("a", data, 0.5)
+    assert first[0] == 500
+    assert cache.get("a", data, 0.5 + 1e-6) is first
+
+
+def test_scaled_buffer_cache_evicts_least_recent():
+    """Test the oldest unused level is dropped when the cache is full."""
+    cache = ScaledBufferCache(max_entries=2)
+    data = tone(1000, 10)
+    low = cache.get("a", data, 0.25)
+    cache.get("a", data, 0.5)
+    cache.get("a", data, 0.25)
+    cache.get("a", data, 0.75)
+
+    assert cache.get("a", data, 0.25) is low
+    assert len(cache._buffers) == 2
+    assert ("a", 512) not in cache._buffers
+
+
+def test_repeat_triggers_coalesced(mixer):
+    """Test a sound triggered again within the window plays once."""
+    assert mixer.play("wall", tone(1000, 100))
+    assert not mixer.play("wall", tone(1000, 100))
+    assert mixer.play("paddle", tone(1000, 100))
+
+    assert samples(mixer.render(10))[0] == 2000
+    assert mixer.voice_stats()["dropped"] == 1
+
+    mixer._last_trigger["wall"] -= mixer.coalesce_window
+    assert mixer.play("wall", tone(1000, 100))
+
+
+def test_per_sound_cap_steals_oldest():
+    """Test a sound over its polyphony cap replaces its oldest voice."""
+    mixer = Mixer(max_voices_per_sound=2, coalesce_window=0.0)
+    for value in (1, 10, 100):
+        mixer.play("hit", tone(value, 100))
+    mixer.play("other", tone(1000, 100))
+
+    assert samples(mixer.render(10))[0] == 1110
+    assert [voice.samples[0] for voice in mixer.voices] == [10, 100, 1000]
+    assert mixer.voice_stats()["stolen"] == 1
+
+
+def test_global_cap_steals_oldest():
+    """Test the voice count never exceeds the global cap."""
+    mixer = Mixer(max_voices=4, coalesce_window=0.0)
+    for index in range(10):
+        mixer.play(f"sound{index}", tone(1, 100))
+    mixer.render(10)
+
+    assert [voice.name for voice in mixer.voices] == ["sound6", "sound7", "sound8", "sound9"]
+    assert mixer.voice_stats() == {"active": 4, "dropped": 0, "stolen": 6}
+
+
+def test_music_loops_without_gap(mixer):
+    """Test music wraps to its start inside a block, sample for sample."""
+    loop = np.arange(1, 101, dtype=np.int16)
+    mixer.play_music("music", loop)
+    block = samples(mixer.render(256))
+
+    assert list(block[:100]) == list(loop)
+    assert list(block[100:200]) == list(loop)
+    assert block[200] == 1 and block[255] == 56
+    assert samples(mixer.render(10))[0] == 57
+
+
+def test_music_fades_in_and_out(mixer):
+    """Test fades ramp the level and a faded-out track is released."""
+    mixer.play_music("music", tone(10000, 1000), fade_in=100 / mixer.sample_rate)
+    block = samples(mixer.render(200))
+
+    assert 0 < block[0] < block[50] < block[99]
+    assert block[99] == block[150] == 10000
+
+    mixer.stop_music(fade_out=100 / mixer.sample_rate)
+    block = samples(mixer.render(200))
+    assert block[0] > block[50] > block[98]
+    assert not block[100:].any()
+    assert mixer.music is None
+
+
+def test_music_restart_resumes_fading_track(mixer):
+    """Test starting the playing music again fades it back in, not over."""
+    loop = np.arange(1, 1001, dtype=np.int16)
+    mixer.play_music("music", loop)
+    mixer.render(10)
+    mixer.stop_music(fade_out=1.0)
+    mixer.render(10)
+    mixer.play_music("music", loop)
+    block = samples(mixer.render(10))
+
+    assert block[0] == 21
+    assert mixer.music.level == 1.0
+
+
+def test_music_outside_polyphony_caps():
+    """Test sound effects never steal the music voice."""
+    mixer = Mixer(max_voices=1, coalesce_window=0.0)
+    mixer.play_music("music", tone(100, 1000), gain=0.5)
+    mixer.play("a", tone(1000, 100))
+    mixer.play("b", tone(1000, 100))
+    mixer.bus_gains["music"] = 0.5
+
+    assert samples(mixer.render(10))[0] == 1025
+    assert mixer.music is not None
@@ -0,0 +1,85 @@
+"""Unit tests for the synthwave background renderer."""
+import random
+import pytest
+from game.background_renderer import BackgroundRenderer, BackgroundCache
+from game.settings import settings
+
+
+@pytest.fixture
+def background():
+    """Create a background renderer (GL resources are created on first draw)."""
+    return BackgroundRenderer(settings.screen_width, settings.screen_height)
+
+
+def test_grid_still_without_speed(background):
+    """Test the grid does not scroll when nothing is moving."""
+    background.update(1.0, 0.0)
+    assert background.grid_scroll == 0.0
+
+
+def test_grid_scroll_follows_speed(background):
+    """Test the grid scrolls faster with higher speed."""
+    background.update(0.1, 2.0)
+    slow = background.grid_scroll
+    background.grid_scroll = 0.0
+    background.update(0.1, 4.0)
+
+    assert background.grid_scroll == pytest.approx(slow * 2)
+
+
+def test_grid_scroll_wraps(background):
+    """Test the scroll offset wraps after a full row."""
+    for _ in range(100):
+        background.update(0.5, settings.ball_max_speed)
+        assert 0.0 <= background.grid_scroll < 1.0
+
+
+def test_flicker_does_not_use_global_random(background):
+    """Test drawing randomness is independent from game randomness."""
+    random.seed(5)
+    expected = random.random()
+
+    random.seed(5)
+    background._flicker_random.random()
+    assert random.random() == expected
+
+
+def test_same_seed_same_layout():
+    """Test a seed reproduces the star and skyline layout."""
+    first = BackgroundRenderer(640, 360, seed=3)
+    second = BackgroundRenderer(640, 360, seed=3)
+
+    assert first.stars == second.stars
+    assert first.buildings == second.buildings
+
+
+def test_cache_shares_background_per_size():
+    """Test views asking for the same size share one background."""
+    cache = BackgroundCache()
+
+    assert cache.get(1280, 720) is cache.get(1280, 720)
+    assert cache.get(1280, 720) is not cache.get(640, 360)
+
+
+def test_cache_rebuilds_when_theme_changes():
+    """Test changing a baked-in theme color builds a new background."""
+    cache = BackgroundCache()
+    original = cache.get(1280, 720)
+    old_color = settings.synthwave_grid_color
+    try:
+        settings.synthwave_grid_color = (0, 255, 0)
+        assert cache.get(1280, 720) is not original
+    finally:
+        settings.synthwave_grid_color = old_color
+
+    assert cache.get(1280, 720) is original
+
+
+def test_cache_does_not_use_global_random():
+    """Test building a background leaves game randomness untouched."""
+    random.seed(9)
+    expected = random.random()
+
+    random.seed(9)
+    BackgroundCache().get(1280, 720)
+    assert random.random() == expected
@@ -0,0 +1,95 @@
+"""Unit tests for retained menu buttons."""
+import pytest
+import arcade
+from game.ui.components.button import Button, ButtonGroup
+
+
+@pytest.fixture
+def window():
+    """Create a window for testing."""
+    window = arcade.Window(800, 600, "Test")
+    yield window
+    window.close()
+
+
+@pytest.fixture
+def group(window):
+    """Create a drawn group of two buttons."""
+    group = ButtonGroup([
+        Button(400, 300, 300, 50, "Play"),
+        Button(400, 230, 300, 50, "Quit"),
+    ])
+    group.draw()
+    return group
+
+
+def test_geometry_cached_per_state(window):
+    """Test geometry is reused when returning to a state."""
+    button = Button(100, 100, 200, 50, "Play")
+    normal = button.shapes()
+    button.selected = True
+    selected = button.shapes()
+    button.selected = False
+
+    assert selected is not normal
+    assert button.shapes() is normal
+
+
+def test_position_change_rebuilds_geometry(window):
+    """Test moving a button drops its cached geometry."""
+    button = Button(100, 100, 200, 50, "Play")
+    before = button.shapes()
+    button.y = 150
+
+    assert button.shapes() is not before
+
+
+def test_idle_group_is_not_rebuilt(group):
+    """Test drawing an unchanged menu reuses the shape list."""
+    shapes = list(group.shape_list)
+    group.draw()
+
+    assert not any(button.dirty for button in group.buttons)
+    assert list(group.shape_list) == shapes
+
+
+def test_selection_rebuilds_group(group):
+    """Test selecting a button adds its glow on the next draw."""
+    count = len(group.shape_list)
+    group.buttons[0].selected = True
+    group.draw()
+
+    assert len(group.shape_list) == count + 4
+
+
+def test_text_change_updates_labels_in_place(group):
+    """Test changing the text keeps the geometry and relabels."""
+    button = group.buttons[0]
+    label = button._labels["normal"][0]
+    button.text = "Resume"
+
+    assert not button.dirty
+    assert label.text == "Resume"
+
+
+def test_only_current_state_labels_visible(group):
+    """Test labels of inactive states are hidden."""
+    button = group.buttons[0]
+    button.selected = True
+    group.draw()
+
+    assert all(label.visible for label in button._labels["selected"])
+    assert not any(label.visible for label in button._labels["normal"])
+
+
+def test_single_button_draws_without_group(window):
+    """Test a lone button draws through its own cached group."""
+    button = Button(400, 300, 300, 50, "Play")
+    button.draw()
+    group = button._group
+    button.selected = True
+    button.draw()
+
+    assert button._group is group
+    assert not button.dirty
+    assert all(label.visible for label in button._labels["selected"])
@@ -0,0 +1,132 @@
+"""Unit tests for input logs and the frame capture writer."""
+import json
+import arcade
+import numpy as np
+import pytest
+from PIL import Image
+from game.capture import InputLog, FrameCapture, MatchReplay
+from game.pong_window import PongGameView
+from game.settings import settings
+
+
+def make_frame(width, height):
+    """Create bottom-up RGBA pixels with a red bottom row."""
+    pixels = np.zeros((height, width, 4), dtype=np.uint8)
+    pixels[0] = (255, 0, 0, 255)
+    return pixels.tobytes()
+
+
+def test_input_log_records_events_before_tick():
+    """Test key events are stamped with the tick they precede."""
+    log = InputLog("single", seed=42)
+    log.record_key("press", arcade.key.UP)
+    log.advance(1 / 120)
+    log.advance(1 / 120)
+    log.record_key("release", arcade.key.UP)
+
+    assert log.tick == 2
+    assert log.events_by_tick() == {0: [("press", arcade.key.UP)], 2: [("release", arcade.key.UP)]}
+
+
+def test_input_log_ignores_window_keys():
+    """Test profiler and fullscreen toggles are not recorded."""
+    log = InputLog()
+    log.record_key("press", arcade.key.F3)
+    log.record_key("press", arcade.key.F11)
+
+    assert log.events == []
+
+
+def test_input_log_round_trip(tmp_path):
+    """Test saving and loading preserves the match."""
+    log = InputLog("two_player", seed=7)
+    log.record_key("press", arcade.key.W)
+    log.advance(0.008)
+    path = tmp_path / "logs" / "match.json"
+    log.save(path)
+
+    loaded = InputLog.load(path)
+    assert loaded.game_mode == "two_player"
+    assert loaded.seed == 7
+    assert loaded.delta_times == [0.008]
+    assert loaded.events == [(0, "press", arcade.key.W)]
+
+
+def test_input_log_round_trips_mouse_events(tmp_path):
+    """Test pause menu mouse events are saved alongside key events."""
+    log = InputLog("single", seed=3)
+    log.record_key("press", arcade.key.ESCAPE)
+    log.advance(0.008)
+    log.record_mouse("move", 640.0, 360.5)
+    log.record_mouse("click", 640.0, 360.5)
+    path = tmp_path / "match.json"
+    log.save(path)
+
+    loaded = InputLog.load(path)
+    assert loaded.events_by_tick() == {
+        0: [("press", arcade.key.ESCAPE)],
+        1: [("move", 640.0, 360.5), ("click", 640.0, 360.5)],
+    }
+
+
+def test_replay_follows_pause_menu_clicks(tmp_path, monkeypatch):
+    """Test a match resumed with a mouse click replays unpaused."""
+    monkeypatch.setattr(settings, "input_log_dir", str(tmp_path))
+    window = arcade.Window(800, 600, "Test")
+    try:
+        view = PongGameView("single")
+        view.setup()
+        view.on_key_press(arcade.key.ESCAPE, 0)
+        view.on_update(1 / settings.target_fps)
+        assert view.paused
+        resume = view.pause_menu.buttons[0]
+        view.handle_mouse("move", resume.x, resume.y)
+        view.handle_mouse("click", resume.x, resume.y)
+        view.on_update(1 / settings.target_fps)
+        assert not view.paused
+        log = view.input_log
+
+        monkeypatch.setattr(settings, "input_log_dir", None)
+        replay = MatchReplay(log)
+        while not replay.finished:
+            replay.step()
+        assert not replay.view.paused
+    finally:
+        window.close()
+
+
+def test_capture_drops_frames_when_queue_full(tmp_path):
+    """Test live capture drops frames instead of blocking."""
+    capture = FrameCapture(tmp_path, (4, 2), queue_size=1, drop_when_full=True)
+
+    assert capture.submit(0, make_frame(4, 2))
+    assert not capture.submit(1, make_frame(4, 2))
+    assert capture.frames_dropped == 1
+
+
+def test_capture_writes_png_top_down(tmp_path):
+    """Test PNG frames are flipped to top-down row order."""
+    capture = FrameCapture(tmp_path, (4, 2), frame_format="png")
+    capture.start()
+    capture.submit(3, make_frame(4, 2))
+    capture.close()
+
+    image = np.asarray(Image.open(tmp_path / "frame_000003.png"))
+    assert capture.frames_written == 1
+    assert tuple(image[1, 0]) == (255, 0, 0, 255)
+    assert tuple(image[0, 0]) == (0, 0, 0, 0)
+
+
+def test_capture_writes_raw_stream(tmp_path):
+    """Test raw capture appends frames and writes stream metadata."""
+    capture = FrameCapture(tmp_path, (4, 2), frame_format="raw", fps=30)
+    capture.start()
+    for i in range(3):
+        capture.submit(i, make_frame(4, 2))
+    capture.close()
+
+    assert (tmp_path / "frames.rgba").stat().st_size == 3 * 4 * 2 * 4
+    info = json.loads((tmp_path / "frames.json").read_text())
+    assert info["frames"] == 3
+    assert info["fps"] == 30
+    assert (info["width"], info["height"]) == (4, 2)
@@ -0,0 +1,119 @@
+"""Unit tests for frame pacing and its measurements."""
+import gc
+import time
+import pytest
+import arcade
+from game import frame_pacing
+from game.frame_pacing import FramePacer, sleep_until
+from game.settings import settings
+
+
+@pytest.fixture
+def window():
+    """Create a small window for testing."""
+    window = arcade.Window(64, 64, "Test")
+    yield window
+    window.close()
+
+
+@pytest.fixture
+def pacer(window):
+    """Create a pacer installed on the test window."""
+    pacer = FramePacer()
+    pacer.install(window, "capped")
+    yield pacer
+    pacer.uninstall()
+
+
+class FakeClock:
+    """Stand-in for the time module whose clock only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def perf_counter(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += max(0.0, seconds)
+
+
+def test_sleep_until_reaches_deadline():
+    """Test the hybrid wait never returns early."""
+    deadline = time.perf_counter() + 0.005
+    sleep_until(deadline, 0.002)
+
+    assert time.perf_counter() >= deadline
+
+
+def test_capped_mode_holds_target_rate(pacer):
+    """Test capped frames arrive at the target frame period."""
+    gc.collect()  # Keep a full collection of earlier tests' garbage out of the timing
+    for _ in range(30):
+        pacer._frame(0.0)
+
+    stats = pacer.stats()
+    assert stats["interval_ms"] == pytest.approx(1000 / settings.target_fps, rel=0.1)
+    assert "latency_ms" in stats
+
+
+def test_stats_measure_jitter():
+    """Test uneven intervals show up as jitter and late frames."""
+    pacer = FramePacer()
+    pacer.intervals.extend([0.010, 0.010, 0.010, 0.030])
+
+    stats = pacer.stats()
+    assert stats["interval_ms"] == pytest.approx(15.0)
+    assert stats["jitter_ms"] == pytest.approx(8.66, abs=0.01)
+    assert stats["late_frames"] == 1
+
+
+def test_no_stats_before_frames():
+    """Test an unused pacer reports nothing."""
+    pacer = FramePacer()
+
+    assert pacer.stats() == {}
+    assert pacer.report() == ""
+
+
+def test_set_mode_restarts_measurements(pacer):
+    """Test switching modes discards the previous mode's timings."""
+    pacer._frame(0.0)
+    pacer._frame(0.0)
+    pacer.set_mode("uncapped")
+
+    assert pacer.mode == "uncapped"
+    assert len(pacer.intervals) == 0
+
+
+def test_uninstall_restores_flip(window):
+    """Test the window presents normally after uninstalling."""
+    pacer = FramePacer()
+    pacer.install(window, "uncapped")
+    pacer.uninstall()
+
+    assert "flip" not in vars(window)
+    window.flip()
+    assert len(pacer.intervals) == 0
+
+
+@pytest.mark.parametrize("mode, frame_time", [
+    ("vsync", 1 / 60),
+    ("uncapped", 0.002),
+    ("capped", 0.002),
+])
+def test_tick_rate_independent_of_mode(pacer, window, monkeypatch, mode, frame_time):
+    """Test the game ticks target_fps times a second whatever the present rate."""
+    clock = FakeClock()
+    monkeypatch.setattr(frame_pacing, "time", clock)
+    monkeypatch.setattr(frame_pacing, "sleep_until", lambda deadline, spin: setattr(clock, "now", deadline))
+    monkeypatch.setattr(window, "draw", lambda delta_time: clock.sleep(frame_time))
+    updates = []
+    monkeypatch.setattr(window, "_dispatch_updates", updates.append)
+    pacer.set_mode(mode)
+
+    while clock.now < 1.0:
+        pacer._frame(0.0)
+
+    assert len(updates) == pytest.approx(settings.target_fps, abs=1)
+    assert updates == [pytest.approx(1 / settings.target_fps)] * len(updates)
@@ -132,3 +132,33 @@ def test_ball_reset(single_player_game):
     assert single_player_game.ball.center_y == initial_y
     assert single_player_game.ball.velocity_x == 0.0
     assert single_player_game.ball.velocity_y == 0.0
+
+
+def test_restart_reuses_game_objects(single_player_game):
+    """Test setting up again resets state without rebuilding objects."""
+    ball = single_player_game.ball
+    audio_manager = single_player_game.audio_manager
+    single_player_game.score_left = settings.winning_score
+    single_player_game._check_win_condition()
+    single_player_game.paddle_left.center_y = 100
+    single_player_game.ai_controller.elapsed_time = 60.0
+
+    single_player_game.setup()
+
+    assert single_player_game.ball is ball
+    assert single_player_game.audio_manager is audio_manager
+    assert single_player_game.score_left == 0
+    assert not single_player_game.game_over
+    assert single_player_game.paddle_left.center_y == settings.screen_height / 2
+    assert single_player_game.ai_controller.elapsed_time == 0.0
+
+
+def test_ball_relaunches_after_delay(single_player_game):
+    """Test the ball launches again once the post-point delay passes."""
+    single_player_game._reset_ball()
+
+    single_player_game.on_update(0.25)
+    assert single_player_game.ball.velocity_x == 0.0
+
+    single_player_game.on_update(0.3)
+    assert single_player_game.ball.velocity_x != 0.0
@@ -0,0 +1,227 @@
+"""Golden-image render regression tests.
+
+Each case renders a deterministic frame into the internal-resolution
+framebuffer, compares it with a stored PNG in tests/golden/ and checks the
+number of arcade draw calls against a budget. Runs headless on a software
+OpenGL context (ARCADE_HEADLESS=1).
+
+Regenerate the images after an intended visual change with:
+
+    UPDATE_GOLDEN=1 pytest tests/test_golden_images.py
+"""
+import os
+import random
+from pathlib import Path
+import arcade
+import numpy as np
+import pytest
+from PIL import Image
+from arcade.gl.backends.opengl.vertex_array import OpenGLVertexArray
+from game.background_renderer import BackgroundRenderer, background_cache
+from game.ball import Ball
+from game.paddle import Paddle
+from game.pong_window import PongGameView
+from game.quality import quality
+from game.render_target import render_target
+from game.settings import settings
+from game.ui.controls_menu import ControlsMenuView
+from game.ui.main_menu import MainMenuView
+from game.ui.settings_menu import SettingsMenuView
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+UPDATE_GOLDEN = bool(os.environ.get("UPDATE_GOLDEN"))
+SEED = 1234
+
+# A pixel differs when any channel is off by more than this
+CHANNEL_TOLERANCE = 8
+# Fraction of pixels allowed to differ (text antialiasing across drivers)
+MAX_DIFF_FRACTION = 0.002
+
+# Maximum arcade draw calls per frame (text drawn by pyglet is not counted).
+# Lower these when an optimization reduces the count so it cannot regress.
+DRAW_CALL_BUDGETS = {
+    "background": 643,
+    "paddles": 14,
+    "ball": 6,
+    "hud": 0,
+    "game": 664,
+    "pause_menu": 666,
+    "game_over": 644,
+    "main_menu": 645,
+    "settings_menu": 645,
+    "controls_menu": 645,
+}
+
+
+@pytest.fixture
+def window():
+    """Create a window with a fixed, seeded render state."""
+    window = arcade.Window(settings.screen_width, settings.screen_height, "Test")
+    old_adaptive = settings.adaptive_quality_enabled
+    settings.adaptive_quality_enabled = False
+    quality.reset()
+    background_cache.seed = SEED
+    background_cache.clear()
+    random.seed(SEED)
+
+    yield window
+
+    background_cache.seed = None
+    background_cache.clear()
+    settings.adaptive_quality_enabled = old_adaptive
+    window.close()
+
+
+@pytest.fixture
+def draw_calls(monkeypatch):
+    """Count arcade draw calls; returns a one-element list holding the count."""
+    count = [0]
+    original_render = OpenGLVertexArray.render
+
+    def counting_render(vao, mode, first=0, vertices=0, instances=1):
+        count[0] += 1
+        original_render(vao, mode, first, vertices, instances)
+
+    monkeypatch.setattr(OpenGLVertexArray, "render", counting_render)
+    return count
+
+
+def read_frame() -> np.ndarray:
+    """Read the internal framebuffer as top-down RGBA pixels."""
+    framebuffer = render_target.framebuffer
+    width, height = framebuffer.size
+    pixels = np.frombuffer(framebuffer.read(components=4), dtype=np.uint8)
+    return pixels.reshape(height, width, 4)[::-1]
+
+
+def render(draw) -> np.ndarray:
+    """Render one frame offscreen.
+
+    Args:
+        draw: Function drawing in game coordinates
+
+    Returns:
+        Top-down RGBA pixels
+    """
+    with render_target.capture(present=False):
+        draw()
+    return read_frame()
+
+
+def check_golden(name: str, frame: np.ndarray, calls: int, tmp_path: Path) -> None:
+    """Compare a frame with its golden image and draw-call budget.
+
+    Args:
+        name: Case name (golden file stem)
+        frame: Rendered top-down RGBA pixels
+        calls: Draw calls used for the frame
+        tmp_path: Where to save the rendered frame on mismatch
+    """
+    assert calls <= DRAW_CALL_BUDGETS[name], (
+        f"{name} used {calls} draw calls (budget {DRAW_CALL_BUDGETS[name]})"
+    )
+
+    path = GOLDEN_DIR / f"{name}.png"
+    if UPDATE_GOLDEN:
+        GOLDEN_DIR.mkdir(exist_ok=True)
+        Image.fromarray(frame).save(path, optimize=True)
+        return
+
+    assert path.exists(), f"missing {path}; run with UPDATE_GOLDEN=1 to create it"
+    golden = np.asarray(Image.open(path).convert("RGBA"))
+    assert golden.shape == frame.shape
+
+    diff = np.abs(golden.astype(np.int16) - frame.astype(np.int16)).max(axis=2)
+    fraction = np.count_nonzero(diff > CHANNEL_TOLERANCE) / diff.size
+    if fraction > MAX_DIFF_FRACTION:
+        actual = tmp_path / f"{name}.png"
+        Image.fromarray(frame).save(actual)
+        pytest.fail(f"{name} differs from golden in {fraction:.2%} of pixels (saved {actual})")
+
+
+def make_game(mode: str = "single") -> PongGameView:
+    """Create a game view at the start of a match."""
+    game = PongGameView(mode)
+    game.setup()
+    return game
+
+
+def test_background(window, draw_calls, tmp_path):
+    """Test the synthwave background."""
+    background = BackgroundRenderer(settings.screen_width, settings.screen_height, seed=SEED)
+    frame = render(background.draw)
+    check_golden("background", frame, draw_calls[0], tmp_path)
+
+
+def test_paddles(window, draw_calls, tmp_path):
+    """Test both paddles with their glow."""
+    left = Paddle(50, settings.screen_height / 2, "left")
+    right = Paddle(settings.screen_width - 50, settings.screen_height / 3, "right")
+
+    def draw():
+        left.draw()
+        right.draw()
+
+    frame = render(draw)
+    check_golden("paddles", frame, draw_calls[0], tmp_path)
+
+
+def test_ball(window, draw_calls, tmp_path):
+    """Test the ball with its glow."""
+    ball = Ball(settings.screen_width / 2, settings.screen_height / 2)
+    frame = render(ball.draw)
+    check_golden("ball", frame, draw_calls[0], tmp_path)
+
+
+def test_hud(window, draw_calls, tmp_path):
+    """Test the score display."""
+    game = make_game()
+    game.score_left = 3
+    game.score_right = 7
+    draw_calls[0] = 0
+    frame = render(game._draw_scores)
+    check_golden("hud", frame, draw_calls[0], tmp_path)
+
+
+def test_game(window, draw_calls, tmp_path):
+    """Test a full game frame at the start of a match."""
+    game = make_game()
+    draw_calls[0] = 0
+    frame = render(game._draw_frame)
+    check_golden("game", frame, draw_calls[0], tmp_path)
+
+
+def test_pause_menu(window, draw_calls, tmp_path):
+    """Test the pause overlay over the game."""
+    game = make_game()
+    game.paused = True
+    game.pause_menu.show()
+    draw_calls[0] = 0
+    frame = render(game._draw_frame)
+    check_golden("pause_menu", frame, draw_calls[0], tmp_path)
+
+
+def test_game_over(window, draw_calls, tmp_path):
+    """Test the game over screen."""
+    game = make_game("two_player")
+    game.score_left = settings.winning_score
+    game.game_over = True
+    game.winner = "Player 1"
+    draw_calls[0] = 0
+    frame = render(game._draw_frame)
+    check_golden("game_over", frame, draw_calls[0], tmp_path)
+
+
+@pytest.mark.parametrize("name, view_class", [
+    ("main_menu", MainMenuView),
+    ("settings_menu", SettingsMenuView),
+    ("controls_menu", ControlsMenuView),
+])
+def test_menu(window, draw_calls, tmp_path, name, view_class):
+    """Test each menu screen."""
+    view = view_class()
+    view.setup()
+    window.show_view(view)
+    draw_calls[0] = 0
+    view.on_draw()
+    check_golden(name, read_frame(), draw_calls[0], tmp_path)
@@ -0,0 +1,148 @@
+"""Unit tests for the instant replay buffer and playback."""
+import arcade
+import numpy as np
+import pytest
+from game.frame_pacing import FramePacer
+from game.instant_replay import ReplayBuffer, FIXED_POINT_SCALE
+from game.pong_window import PongGameView
+from game.settings import settings
+
+TICK = 1 / settings.target_fps
+
+
+@pytest.fixture
+def window():
+    """Create a window for testing."""
+    window = arcade.Window(800, 600, "Test")
+    yield window
+    window.close()
+
+
+@pytest.fixture
+def game_view(window):
+    """Create a game view with a match in progress."""
+    view = PongGameView("two_player")
+    view.setup()
+    return view
+
+
+def score_goal(view):
+    """Play ticks until the ball crosses the right goal line."""
+    view._launch_delay = 0.0
+    view.ball.center_x = settings.screen_width - 100
+    view.ball.velocity_x = 10.0
+    view.ball.velocity_y = 0.0
+    view.paddle_right.center_y = 100
+    while view.score_left == 0:
+        view.on_update(TICK)
+
+
+def test_buffer_costs_eight_bytes_per_tick():
+    """Test each tick is stored as four int16 values."""
+    buffer = ReplayBuffer(seconds=10, tick_rate=120)
+
+    assert buffer.states.nbytes == buffer.capacity * 8
+    assert buffer.capacity == 1200
+
+
+def test_buffer_round_trips_positions():
+    """Test positions survive fixed point within a fraction of a pixel."""
+    buffer = ReplayBuffer(seconds=1, tick_rate=10)
+    buffer.record(640.3, 12.06, 360.0, 719.9)
+
+    state = buffer.snapshot()[0] / FIXED_POINT_SCALE
+    assert state == pytest.approx([640.3, 12.06, 360.0, 719.9], abs=1 / FIXED_POINT_SCALE)
+
+
+def test_buffer_wraps_in_order():
+    """Test a full buffer keeps the newest ticks oldest first."""
+    buffer = ReplayBuffer(seconds=1, tick_rate=4)
+    for tick in range(6):
+        buffer.record(tick, 0, 0, 0)
+
+    assert len(buffer) == 4
+    assert list(buffer.snapshot()[:, 0] // FIXED_POINT_SCALE) == [2, 3, 4, 5]
+
+
+def test_no_replay_before_a_goal(game_view):
+    """Test the hotkey does nothing until someone scores."""
+    game_view.on_key_press(arcade.key.R, 0)
+
+    assert not game_view.instant_replay.playing
+
+
+def test_goal_replays_in_slow_motion(game_view):
+    """Test a goal can be replayed and the match is frozen meanwhile."""
+    score_goal(game_view)
+    game_view.on_key_press(arcade.key.R, 0)
+    replay = game_view.instant_replay
+    ticks = len(replay.last_goal)
+
+    assert replay.playing
+    ball_position = game_view.ball.position
+    game_view.on_update(TICK)
+    assert game_view.ball.position == ball_position
+    assert replay.position == pytest.approx(settings.instant_replay_speed)
+
+    for _ in range(int((ticks - 1) / settings.instant_replay_speed) + 1):
+        game_view.on_update(TICK)
+    assert not replay.playing
+
+
+def test_replay_draw_restores_game_objects(game_view):
+    """Test drawing a replay frame leaves the live objects untouched."""
+    score_goal(game_view)
+    game_view.on_key_press(arcade.key.R, 0)
+    game_view.instant_replay.position = 5.5
+    ball_position = game_view.ball.position
+    paddle_y = game_view.paddle_right.center_y
+    trail = game_view.ball.motion_trail.positions
+
+    game_view._draw_frame()
+
+    assert game_view.ball.position == ball_position
+    assert game_view.paddle_right.center_y == paddle_y
+    assert game_view.ball.motion_trail.positions is trail
+
+
+def test_replay_key_skips_replay(game_view):
+    """Test pressing the hotkey again ends the replay."""
+    score_goal(game_view)
+    game_view.on_key_press(arcade.key.R, 0)
+    game_view.on_key_press(arcade.key.R, 0)
+
+    assert not game_view.instant_replay.playing
+
+
+def test_new_match_forgets_goals(game_view):
+    """Test restarting clears the recorded goal."""
+    score_goal(game_view)
+    game_view.setup()
+
+    assert not game_view.instant_replay.available
+    assert np.asarray(game_view.instant_replay.buffer.snapshot()).size == 0
+
+
+def test_replay_counts_simulation_ticks_at_vsync(window, game_view, monkeypatch):
+    """Test a 60 Hz present rate records and replays target_fps ticks per second."""
+    monkeypatch.setattr(window, "_enable_event_queue", False)  # Dispatch at once, as arcade.run() does
+    pacer = FramePacer()
+    pacer.install(window, "vsync")
+    window.show_view(game_view)
+    try:
+        game_view.instant_replay.buffer.clear()
+        for _ in range(60):
+            pacer._run_ticks(1 / 60)
+        recorded = len(game_view.instant_replay.buffer)
+
+        score_goal(game_view)
+        replay = game_view.instant_replay
+        replay.start()
+        for _ in range(60):
+            pacer._run_ticks(1 / 60)
+        position = replay.position
+    finally:
+        pacer.uninstall()
+
+    assert recorded == pytest.approx(settings.target_fps, abs=1)
+    assert position == pytest.approx(settings.target_fps * settings.instant_replay_speed, abs=1)
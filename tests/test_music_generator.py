@@ -0,0 +1,39 @@
+"""Tests for the vectorized, event-based music generator."""
+import wave
+from pathlib import Path
+import numpy as np
+from game.music_generator import generate_arcade_music, note_events
+
+SOUNDS_DIR = Path(__file__).parent.parent / "src" / "assets" / "sounds"
+
+
+def read_samples(path: Path) -> np.ndarray:
+    """Read a WAV file's int16 samples."""
+    with wave.open(str(path), "rb") as wav_file:
+        return np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype=np.int16)
+
+
+def test_note_events_tile_the_track():
+    """Test notes start where the previous one ends and the pattern loops."""
+    events = list(note_events([("A", 1.0), ("B", 0.5)], 0.5, 2000, 1000))
+
+    assert [event[:3] for event in events[:4]] == [(0, 500, "A"), (500, 750, "B"), (750, 1250, "A"), (1250, 1500, "B")]
+    assert events[-1][1] == 2000
+
+
+def test_note_boundary_rounds_up_to_next_sample():
+    """Test a note ending between samples runs to the following sample."""
+    start, end, _, _ = next(note_events([("A", 1.0)], 0.0105, 100, 1000))
+
+    assert (start, end) == (0, 11)
+
+
+def test_matches_shipped_music(tmp_path):
+    """Test the generated loop matches the shipped background music."""
+    path = tmp_path / "background_music.wav"
+    generate_arcade_music(str(path), duration=30.0, tempo=120, volume=0.25)
+    samples = read_samples(path)
+    expected = read_samples(SOUNDS_DIR / "background_music.wav")
+
+    assert len(samples) == len(expected)
+    assert np.abs(samples.astype(np.int32) - expected).max() <= 1
@@ -0,0 +1,129 @@
+"""Unit tests for the memory-mapped PCM asset store."""
+import os
+import numpy as np
+import pytest
+from game.audio_assets import AssetRegistry, GeneratedAsset
+from game.pcm_store import PCMStore, convert
+from game.sound_generator import write_wav
+
+
+def write_ramp(filename: str, length: int = 100, sample_rate: int = 22050) -> None:
+    """Generator writing a ramp of int16 samples."""
+    write_wav(filename, np.arange(length, dtype=np.int16), sample_rate)
+
+
+@pytest.fixture
+def registry(tmp_path):
+    """Create a registry of generated ramps."""
+    registry = AssetRegistry(tmp_path / "sounds")
+    registry.register(GeneratedAsset("short", "short.wav", write_ramp, length=100))
+    registry.register(GeneratedAsset("long", "long.wav", write_ramp, length=5000))
+    registry.refresh()
+    return registry
+
+
+@pytest.fixture
+def store(tmp_path, registry):
+    """Create a PCM store over the registry."""
+    store = PCMStore(tmp_path / "pcm", registry)
+    yield store
+    store.close()
+
+
+def test_samples_are_mapped_views(store):
+    """Test sounds come back as read-only views of the mapping."""
+    short = store.get("short")
+    long = store.get("long")
+
+    assert list(short[:3]) == [0, 1, 2] and len(short) == 100
+    assert long[4999] == 4999
+    assert not short.flags.writeable
+    assert short.base.obj is store._mmap
+    assert store.get("missing") is None
+
+
+def test_second_open_reuses_store(tmp_path, registry, store):
+    """Test another store instance maps the existing files without decoding."""
+    store.get("short")
+    other = PCMStore(tmp_path / "pcm", registry)
+
+    assert list(other.get("long")[:2]) == [0, 1]
+    assert store.builds == 1 and other.builds == 0
+    other.close()
+
+
+def test_changed_wav_rebuilds_store(tmp_path, registry, store):
+    """Test a regenerated WAV invalidates the store."""
+    store.get("short")
+    store.close()
+    write_ramp(str(registry.path("short")), length=200)
+    stat = registry.path("short").stat()
+    os.utime(registry.path("short"), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    assert len(store.get("short")) == 200
+    assert store.builds == 2
+
+
+def write_sine(filename: str, frequency: float = 1000.0, length: int = 22050) -> None:
+    """Generator writing a sine tone at 22050 Hz."""
+    t = np.arange(length) / 22050
+    write_wav(filename, (np.sin(2 * np.pi * frequency * t) * 16000).astype(np.int16))
+
+
+def test_sounds_resampled_to_output_format(tmp_path):
+    """Test the store converts sounds to the configured rate and channels."""
+    registry = AssetRegistry(tmp_path / "sounds")
+    registry.register(GeneratedAsset("tone", "tone.wav", write_sine))
+    registry.refresh()
+    store = PCMStore(tmp_path / "pcm", registry)
+    store.configure(48000, 2)
+
+    stereo = store.get("tone").reshape(-1, 2)
+    assert len(stereo) == 48000
+    assert np.array_equal(stereo[:, 0], stereo[:, 1])
+
+    # Away from the edges the tone matches a sine computed at 48 kHz
+    expected = np.sin(2 * np.pi * 1000.0 * np.arange(48000) / 48000) * 16000
+    assert np.abs(stereo[1000:-1000, 0] - expected[1000:-1000]).max() < 16
+    store.close()
+
+
+def test_loop_stays_seamless_when_resampled():
+    """Test a resampled loop keeps its exact length and wraps smoothly."""
+    # 5 full cycles, so the loop is periodic
+    loop = (np.sin(2 * np.pi * 5 * np.arange(2205) / 2205) * 16000).astype(np.int16)
+    converted = convert(loop, 22050, 1, 44100, 1, loop=True)
+
+    assert len(converted) == 4410
+    step = 2 * np.pi * 5 / 4410 * 16000
+    assert abs(int(converted[0]) - int(converted[-1])) < step * 1.5
+
+
+def test_stereo_downmixed_to_mono():
+    """Test multi-channel audio is averaged to mono."""
+    stereo = np.array([100, 300, -200, 0], dtype=np.int16)
+
+    assert list(convert(stereo, 22050, 2, 22050, 1)) == [200, -100]
+
+
+def test_configure_rebuilds_for_new_format(store):
+    """Test changing the output format rebuilds the store."""
+    assert len(store.get("short")) == 100
+    store.configure(44100, 1)
+
+    assert len(store.get("short")) == 200
+    assert store.builds == 2
+
+
+def test_formats_use_separate_files(tmp_path, store):
+    """Test switching formats keeps the old data file and its views intact."""
+    short = store.get("short")
+    old_data = sorted((tmp_path / "pcm").glob("*.pcm"))
+    store.configure(44100, 1)
+    assert len(store.get("short")) == 200
+
+    assert list(short[:3]) == [0, 1, 2]
+    assert set(old_data) < set((tmp_path / "pcm").glob("*.pcm"))
+    store.configure(22050, 1)
+    assert len(store.get("short")) == 100
+    assert store.builds == 2
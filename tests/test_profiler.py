@@ -0,0 +1,66 @@
+"""Unit tests for the frame profiler."""
+import pytest
+from game.profiler import FrameProfiler
+
+
+@pytest.fixture
+def profiler():
+    """Create an enabled profiler and disable it afterwards."""
+    profiler = FrameProfiler(history=10)
+    profiler.enable()
+    yield profiler
+    profiler.disable()
+
+
+def test_sections_are_noops_when_disabled():
+    """Test disabled profiler records nothing."""
+    profiler = FrameProfiler()
+
+    with profiler.section("update"):
+        pass
+    profiler.end_frame()
+
+    assert profiler.last_sections == {}
+    assert len(profiler.frame_times) == 0
+
+
+def test_sections_accumulate_per_frame(profiler):
+    """Test repeated sections in a frame add up and reset each frame."""
+    with profiler.section("glow"):
+        pass
+    with profiler.section("glow"):
+        pass
+    profiler.end_frame()
+
+    assert set(profiler.last_sections) == {"glow"}
+    assert profiler.sections == {}
+
+
+def test_frame_time_history_is_bounded(profiler):
+    """Test frame time history keeps only the most recent frames."""
+    for _ in range(20):
+        profiler.end_frame()
+
+    assert len(profiler.frame_times) == 10
+
+
+def test_percentiles(profiler):
+    """Test rolling percentiles of frame times."""
+    profiler.frame_times.extend([0.010] * 9 + [0.050])
+
+    p50, p95, p99 = profiler.percentiles()
+
+    assert p50 == pytest.approx(0.010)
+    assert p99 > p95 > p50
+
+
+def test_toggle_restores_draw_hook():
+    """Test disabling the profiler restores the original render function."""
+    from arcade.gl.backends.opengl.vertex_array import OpenGLVertexArray
+    original = OpenGLVertexArray.render
+    profiler = FrameProfiler()
+
+    assert profiler.toggle() is True
+    assert OpenGLVertexArray.render is not original
+    assert profiler.toggle() is False
+    assert OpenGLVertexArray.render is original
@@ -0,0 +1,102 @@
+"""Unit tests for the adaptive quality governor."""
+import pytest
+from game.quality import QualityGovernor, QUALITY_LADDER, FULL_QUALITY
+from game.settings import settings
+
+
+@pytest.fixture
+def governor():
+    """Create a governor with short windows for testing."""
+    return QualityGovernor(downgrade_frames=5, upgrade_frames=20, smoothing=1.0)
+
+
+@pytest.fixture
+def budget():
+    """Frame budget for the target FPS."""
+    return 1.0 / settings.target_fps
+
+
+def test_starts_at_full_quality(governor):
+    """Test governor starts with every effect at full quality."""
+    assert governor.level == 0
+    assert governor.knobs == FULL_QUALITY
+
+
+def test_steps_down_when_over_budget(governor, budget):
+    """Test sustained over-budget frames reduce quality one step."""
+    for _ in range(5):
+        governor.record_frame(budget * 2)
+
+    assert governor.level == 1
+    knob, value = QUALITY_LADDER[0]
+    assert governor.knobs[knob] == value
+
+
+def test_short_spike_does_not_step_down(governor, budget):
+    """Test a few slow frames are tolerated."""
+    for _ in range(3):
+        governor.record_frame(budget * 2)
+    governor.record_frame(budget * 0.8)
+
+    assert governor.level == 0
+
+
+def test_steps_up_only_after_long_headroom(governor, budget):
+    """Test quality returns only after a long stretch with headroom."""
+    governor.set_level(3)
+
+    for _ in range(19):
+        governor.record_frame(budget * 0.3)
+    assert governor.level == 3
+
+    governor.record_frame(budget * 0.3)
+    assert governor.level == 2
+
+
+def test_no_step_up_without_headroom(governor, budget):
+    """Test frames near the budget hold the current level (hysteresis band)."""
+    governor.set_level(2)
+
+    for _ in range(100):
+        governor.record_frame(budget * 0.9)
+
+    assert governor.level == 2
+
+
+def test_level_is_clamped(governor):
+    """Test levels stay within the ladder."""
+    governor.set_level(100)
+    assert governor.level == governor.max_level
+    assert governor.particle_fraction == 0.0
+
+    governor.set_level(-5)
+    assert governor.level == 0
+
+
+def test_disabled_governor_ignores_frames(governor, budget):
+    """Test adaptive quality can be switched off."""
+    settings.adaptive_quality_enabled = False
+    try:
+        for _ in range(50):
+            governor.record_frame(budget * 3)
+    finally:
+        settings.adaptive_quality_enabled = True
+
+    assert governor.level == 0
+
+
+def test_vsync_interval_does_not_step_down(governor):
+    """Test light frames presented at 60 Hz keep full quality whatever target_fps is."""
+    for _ in range(200):
+        governor.record_frame(0.002)
+        governor.record_frame(0.002, budget=1 / 60)
+
+    assert governor.level == 0
+
+
+def test_steps_down_against_given_budget(governor):
+    """Test work over the pacing mode's frame budget still reduces quality."""
+    for _ in range(5):
+        governor.record_frame(0.025, budget=1 / 60)
+
+    assert governor.level == 1
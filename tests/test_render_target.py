@@ -0,0 +1,38 @@
+"""Unit tests for the internal-resolution render target."""
+import pytest
+from game.render_target import InternalRenderTarget
+from game.settings import settings
+
+
+@pytest.fixture
+def target():
+    """Create a render target (no GL resources needed for layout math)."""
+    return InternalRenderTarget()
+
+
+def test_letterbox_same_size_fills_window(target):
+    """Test a window matching the logical size needs no bars."""
+    x, y, width, height = target.letterbox(settings.screen_width, settings.screen_height)
+
+    assert (x, y) == (0, 0)
+    assert (width, height) == (settings.screen_width, settings.screen_height)
+
+
+def test_letterbox_taller_window_adds_bars_top_and_bottom(target):
+    """Test a 16:10 window letterboxes a 16:9 image vertically."""
+    x, y, width, height = target.letterbox(1920, 1200)
+
+    assert x == 0
+    assert width == 1920
+    assert height == pytest.approx(1920 * settings.screen_height / settings.screen_width)
+    assert y == pytest.approx((1200 - height) / 2)
+
+
+def test_letterbox_wider_window_adds_bars_left_and_right(target):
+    """Test an ultrawide window pillarboxes the image."""
+    x, y, width, height = target.letterbox(2560, 720)
+
+    assert y == 0
+    assert height == 720
+    assert x == pytest.approx((2560 - width) / 2)
+    assert width / height == pytest.approx(settings.screen_width / settings.screen_height)
@@ -265,6 +265,7 @@ def test_save_settings_config_structure():
         assert "display" in config_data
         assert "gameplay" in config_data
         assert "audio" in config_data
+        assert "frame_pacing_mode" in config_data["display"]
 
         # Check controls structure
         assert "single_player" in config_data["controls"]
@@ -0,0 +1,36 @@
+"""Tests for the vectorized sound effect generator."""
+import wave
+from pathlib import Path
+import numpy as np
+import pytest
+from game.sound_generator import generate_all_sounds
+
+SOUNDS_DIR = Path(__file__).parent.parent / "src" / "assets" / "sounds"
+EFFECTS = ["paddle_hit", "wall_hit", "score", "game_start", "game_over"]
+
+
+def read_wav(path: Path):
+    """Read a WAV file's parameters and int16 samples."""
+    with wave.open(str(path), "rb") as wav_file:
+        params = (wav_file.getnchannels(), wav_file.getsampwidth(), wav_file.getframerate())
+        samples = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype=np.int16)
+    return params, samples
+
+
+@pytest.fixture(scope="module")
+def generated(tmp_path_factory):
+    """Generate all sound effects into a temporary directory."""
+    output_dir = tmp_path_factory.mktemp("sounds")
+    generate_all_sounds(output_dir)
+    return output_dir
+
+
+@pytest.mark.parametrize("name", EFFECTS)
+def test_matches_shipped_sound(generated, name):
+    """Test each effect matches the shipped WAV to within one step."""
+    params, samples = read_wav(generated / f"{name}.wav")
+    expected_params, expected = read_wav(SOUNDS_DIR / f"{name}.wav")
+
+    assert params == expected_params == (1, 2, 22050)
+    assert len(samples) == len(expected)
+    assert np.abs(samples.astype(np.int32) - expected).max() <= 1
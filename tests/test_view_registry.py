@@ -0,0 +1,78 @@
+"""Unit tests for the view registry."""
+import pytest
+import arcade
+from game.view_registry import ViewRegistry
+from game.pong_window import PongGameView
+from game.ui.main_menu import MainMenuView
+from game.ui.settings_menu import SettingsMenuView
+
+
+@pytest.fixture
+def window():
+    """Create a window for testing."""
+    window = arcade.Window(800, 600, "Test")
+    yield window
+    window.close()
+
+
+@pytest.fixture
+def registry(window):
+    """Create an empty view registry."""
+    return ViewRegistry()
+
+
+def test_views_are_created_once(registry):
+    """Test repeated lookups return the same view instances."""
+    assert registry.main_menu() is registry.main_menu()
+    assert registry.settings_menu() is registry.settings_menu()
+    assert registry.controls_menu() is registry.controls_menu()
+    assert registry.game("single") is registry.game("single")
+    assert registry.game("single") is not registry.game("two_player")
+
+
+def test_show_game_reuses_view(registry, window):
+    """Test starting a second match reuses the game view and its objects."""
+    registry.show_game("single")
+    game = window.current_view
+    ball = game.ball
+    game.score_right = 3
+
+    registry.show_main_menu()
+    registry.show_game("single")
+
+    assert window.current_view is game
+    assert game.ball is ball
+    assert game.score_right == 0
+
+
+def test_game_views_share_audio_manager(registry):
+    """Test game views share one audio manager instead of creating their own."""
+    registry.show_game("single")
+    registry.show_game("two_player")
+
+    assert registry.game("single").audio_manager is registry.game("two_player").audio_manager
+    assert registry.audio_manager.backend.name == "null"  # No sound device in tests (conftest)
+
+
+def test_settings_back_returns_to_caller(registry, window):
+    """Test leaving the settings menu returns to the view that opened it."""
+    menu = registry.main_menu()
+    registry.show_settings(menu)
+    assert isinstance(window.current_view, SettingsMenuView)
+
+    window.current_view.on_back()
+    assert window.current_view is menu
+    assert isinstance(menu, MainMenuView)
+
+
+def test_quit_to_menu_uses_registry(registry, window, monkeypatch):
+    """Test the pause menu's quit shows the shared main menu."""
+    import game.pong_window
+
+    monkeypatch.setattr(game.pong_window, "view_registry", registry)
+    registry.show_game("two_player")
+    game_view = window.current_view
+    assert isinstance(game_view, PongGameView)
+
+    game_view._quit_to_menu()
+    assert window.current_view is registry.main_menu()
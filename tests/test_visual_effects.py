@@ -0,0 +1,113 @@
+"""Unit tests for visual effects."""
+import pytest
+import numpy as np
+from game.visual_effects import MotionTrail, ParticleEffect, _trail_ramp
+
+
+def test_trail_ramp_fades_from_trail_to_core_color():
+    """Test trail ramp interpolates color, alpha and size by age."""
+    ramp = _trail_ramp(4, (255, 255, 255), (0, 0, 0))
+
+    assert len(ramp) == 4
+    assert ramp[0] == ((0, 0, 0, 0), 0.5)
+    assert ramp[2] == ((127, 127, 127, 100), 0.75)
+
+
+def test_trail_ramp_is_cached():
+    """Test the same ramp is reused for the same length and colors."""
+    first = _trail_ramp(15, (255, 255, 255), (255, 200, 255))
+    second = _trail_ramp(15, (255, 255, 255), (255, 200, 255))
+
+    assert first is second
+
+
+def test_trail_respects_max_length():
+    """Test trail keeps only the most recent positions."""
+    trail = MotionTrail(max_length=3)
+    for i in range(5):
+        trail.update(i, i)
+
+    assert list(trail.positions) == [(2, 2), (3, 3), (4, 4)]
+
+
+def test_particle_burst_fills_pool():
+    """Test emitting a burst adds live particles to the pool."""
+    particles = ParticleEffect(capacity=64)
+    particles.emit_burst(100, 200, (255, 0, 0), count=8)
+
+    assert len(particles) == 8
+    assert np.all(particles.x[:8] == 100)
+    assert np.all(particles.life[:8] == 1.0)
+
+
+def test_particle_burst_respects_capacity():
+    """Test particles beyond the pool capacity are dropped."""
+    particles = ParticleEffect(capacity=10)
+    particles.emit_burst(0, 0, (255, 0, 0), count=8)
+    particles.emit_burst(0, 0, (255, 0, 0), count=8)
+
+    assert len(particles) == 10
+
+
+def test_particle_update_moves_and_applies_drag():
+    """Test particles move by their velocity and slow down."""
+    particles = ParticleEffect(capacity=8, drag=0.5)
+    particles.emit_burst(0, 0, (255, 0, 0), count=1, speed=4.0)
+
+    particles.update(0.1)
+
+    assert particles.x[0] == pytest.approx(4.0)
+    assert particles.vx[0] == pytest.approx(2.0)
+    assert particles.life[0] == pytest.approx(0.8)
+
+
+def test_particle_compaction_keeps_live_particles():
+    """Test dead particles are replaced by live ones from the end of the pool."""
+    particles = ParticleEffect(capacity=16)
+    particles.emit_burst(0, 0, (255, 0, 0), count=4)
+    particles.emit_burst(50, 50, (0, 255, 0), count=4)
+
+    # Kill the first burst only
+    particles.life[:4] = 0.01
+    particles.update(0.1)
+
+    assert len(particles) == 4
+    assert np.all(particles.life[:4] > 0)
+    assert np.all(particles.color_index[:4] == 1)
+
+
+def test_particle_palette_reuses_colors():
+    """Test particles of the same color share one palette entry."""
+    particles = ParticleEffect(capacity=16)
+    particles.emit_burst(0, 0, (255, 0, 0), count=2)
+    particles.emit_burst(0, 0, (255, 0, 0), count=2)
+    particles.emit_burst(0, 0, (0, 0, 255), count=2)
+
+    assert list(particles.color_index[:6]) == [0, 0, 0, 0, 1, 1]
+
+
+def test_particle_palette_reuses_only_unseen_colors():
+    """Test a full palette recycles the least recent color no particle shows."""
+    particles = ParticleEffect(capacity=64)
+    particles.emit_burst(0, 0, (1, 0, 0), count=1)
+    for red in range(2, ParticleEffect.PALETTE_SIZE + 1):
+        particles.emit_burst(0, 0, (red, 0, 0), count=1)
+    particles.life[1] = 0.0  # Color 2 is no longer on screen
+    particles.update(0.0)
+    particles.emit_burst(0, 0, (0, 255, 0), count=1)
+
+    assert len(particles.palette) == ParticleEffect.PALETTE_SIZE
+    assert particles.color_index[particles.count - 1] == 1
+    assert particles.palette[0] == pytest.approx([1 / 255, 0, 0])
+
+
+def test_particle_palette_grows_when_every_color_is_live():
+    """Test live particles keep their color when more colors are on screen than slots."""
+    particles = ParticleEffect(capacity=1024)
+    for red in range(300):
+        particles.emit_burst(0, 0, (red % 256, red // 256, 0), count=1)
+
+    colors = particles.palette[particles.color_index[:particles.count]] * 255
+    assert len(particles.palette) >= 300
+    assert np.allclose(colors[:, 0], np.arange(300) % 256)
+    assert np.allclose(colors[:, 1], np.arange(300) // 256)